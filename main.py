@@ -19,6 +19,13 @@ from typing import List, Tuple
 
 from dataclasses import dataclass
 from enum import Enum
+from collections import OrderedDict, deque
+from time import perf_counter
+import functools
+import io
+import queue
+import threading
+import wave
 
 
 
@@ -38,292 +45,1675 @@ def resource_path(relative_path):
 
 
 # ============== SOUND SYNTHESIZER ==============
+def _blip_preset(pitch: int) -> dict:
+    return {"notes": [(0.05, [(440 + pitch * 100, 1.0, 'square')])],
+            "adsr": (0.01, 0.01, 0.5, 0.03), "volume": 0.2}
+
+
+# Tabella dei suoni: "notes" = segmenti in sequenza (durata, [(frequenza, guadagno, forma)]), dove
+# la frequenza puo' essere uno sweep (f0, f1); "noise" = (mix, ampiezza) di rumore bianco sul tono;
+# "adsr" in secondi (sustain come livello) e "volume" finale. I pitch dei blip coprono menu (-1/1),
+# Pong (0/1), SpinDuel (2) e i passi del name entry; gli altri pitch si renderizzano al volo.
+SOUND_PRESETS: Dict[str, dict] = {
+    **{f"blip_{pitch}": _blip_preset(pitch) for pitch in range(-3, 4)},
+    "select": {"notes": [(0.08, [(440, 1.0, 'square')]), (0.08, [(660, 1.0, 'square')])],
+               "adsr": (0.01, 0.02, 0.7, 0.05), "volume": 0.25},
+    "back": {"notes": [(0.1, [(330, 1.0, 'sine')])],
+             "adsr": (0.01, 0.03, 0.5, 0.06), "volume": 0.2},
+    "game_start": {"notes": [(0.12, [(f, 1.0, 'sine')]) for f in (262, 330, 392, 523)],
+                   "adsr": (0.01, 0.02, 0.8, 0.1), "volume": 0.3},
+    "score_point": {"notes": [(0.06, [(880, 1.0, 'triangle')])],
+                    "adsr": (0.005, 0.01, 0.6, 0.045), "volume": 0.25},
+    "game_over": {"notes": [(0.2, [(f, 1.0, 'sawtooth')]) for f in (440, 370, 311, 233)],
+                  "adsr": (0.02, 0.05, 0.7, 0.2), "volume": 0.3},
+    "high_score": {"notes": [(0.15, [(523, 1.0, 'sine')]), (0.15, [(659, 1.0, 'sine')]),
+                             (0.15, [(784, 1.0, 'sine')]), (0.3, [(1047, 1.0, 'sine')])],
+                   "adsr": (0.01, 0.03, 0.8, 0.2), "volume": 0.35},
+    "hit": {"notes": [(0.08, [(200, 1.0, 'square')])], "noise": (0.7, 0.5),
+            "adsr": (0.001, 0.02, 0.3, 0.057), "volume": 0.2},
+    # Power-up: arpeggio C5-E6 con l'ottava sopra per lo scintillio
+    "powerup": {"notes": [(0.08, [(f, 1.0, 'sine'), (f * 2, 0.3, 'sine')]) for f in (523, 659, 784, 1047, 1319)],
+                "adsr": (0.005, 0.02, 0.8, 0.1), "volume": 0.28},
+    "brick_break": {"notes": [(0.1, [(150, 1.0, 'square')])], "noise": (0.6, 0.6),
+                    "adsr": (0.001, 0.03, 0.3, 0.066), "volume": 0.22},
+    "laser_shoot": {"notes": [(0.12, [((1200, 400), 1.0, 'sine')])],
+                    "adsr": (0.001, 0.02, 0.5, 0.099), "volume": 0.2},
+    # Fanfara: triangolo + quinta
+    "level_complete": {"notes": [(0.35 if f == 1047 else 0.15, [(f, 1.0, 'triangle'), (f * 1.5, 0.2, 'sine')])
+                                 for f in (523, 659, 784, 1047)],
+                       "adsr": (0.01, 0.03, 0.85, 0.15), "volume": 0.32},
+    "ball_lost": {"notes": [(0.15, [(f, 1.0, 'sine')]) for f in (440, 370, 311)],
+                  "adsr": (0.01, 0.05, 0.6, 0.15), "volume": 0.25},
+    "combo": {"notes": [(0.05, [(660, 1.0, 'square')]), (0.05, [(880, 1.0, 'square')])],
+              "adsr": (0.005, 0.01, 0.7, 0.035), "volume": 0.2},
+    "paddle_hit": {"notes": [(0.08, [(330, 1.0, 'triangle')])], "noise": (0.3, 0.3),
+                   "adsr": (0.001, 0.015, 0.4, 0.064), "volume": 0.22},
+    "wall_bounce": {"notes": [(0.06, [(250, 1.0, 'square')])], "noise": (0.5, 0.4),
+                    "adsr": (0.001, 0.01, 0.3, 0.049), "volume": 0.18},
+    "multiball": {"notes": [(0.2, [(440, 1 / 3, 'square'), (554, 1 / 3, 'square'), (659, 1 / 3, 'square')])],
+                  "adsr": (0.01, 0.04, 0.7, 0.15), "volume": 0.3},
+    "shield_activate": {"notes": [(0.25, [((200, 800), 1.0, 'sine')])],
+                        "adsr": (0.01, 0.05, 0.8, 0.19), "volume": 0.25},
+}
+
+
 class SoundSynthesizer:
-    def __init__(self, sample_rate: int = 22050):
-        pygame.mixer.init(frequency=sample_rate, size=-16, channels=2, buffer=512)
+    """Sintetizzatore a preset: un solo motore NumPy renderizza ogni voce di SOUND_PRESETS.
+
+    Base dei tempi, inviluppi e buffer di lavoro float32 sono in cache e si riusano tra un
+    suono e l'altro; il risultato va scritto direttamente nell'int16 stereo di destinazione.
+    render_all() renderizza tutta la tabella in un unico buffer (bank e warm-up), anche divisa
+    tra `workers` processi: i worker ritornano PCM grezzo, i Sound si creano sempre qui.
+    """
+    BANK_FILE = "sound_bank.bin"
+    BANK_MAGIC = b"SPNBANK\0"
+    BANK_VERSION = 2
+    
+    def __init__(self, sample_rate: int = 22050, bank_file: Optional[str] = BANK_FILE,
+                 workers: int = 0, mixer: bool = True):
+        if mixer:
+            pygame.mixer.init(frequency=sample_rate, size=-16, channels=2, buffer=512)
         self.sample_rate = sample_rate
+        self.workers = workers
         self.sounds_cache = {}
+        self.warmup_stats: Dict[str, object] = {}
+        self._rng = np.random.default_rng(0x5B1)  # rumore riproducibile, indipendente da np.random
+        self._time = np.zeros(0, dtype=np.float32)
+        self._work = np.zeros((3, 0), dtype=np.float32)
+        self._envelopes: Dict[tuple, np.ndarray] = {}
+        if bank_file:
+            self.load_bank(bank_file)
+    
+    # ---------- SOUND BANK ----------
+    def _bank_fingerprint(self) -> str:
+        """Hash di versione, formato del mixer, tabella dei preset e bytecode del motore"""
+        import hashlib
+        h = hashlib.sha1()
+        h.update(repr((self.BANK_VERSION, self.sample_rate, pygame.mixer.get_init(), SOUND_PRESETS)).encode())
+        for name in ("_samples", "_buffers", "_oscillate", "_envelope", "render_into"):
+            h.update(getattr(type(self), name).__code__.co_code)
+        return h.hexdigest()
+    
+    def build_bank(self, path: str = BANK_FILE):
+        """Renderizza tutti i preset e li scrive in un unico file (header JSON + PCM grezzo)"""
+        import time
+        start = time.perf_counter()
+        buffers = self.render_all(workers=self.workers)
+        index, offset = {}, 0
+        for key, pcm in buffers.items():
+            self.sounds_cache[key] = pygame.mixer.Sound(buffer=pcm)
+            index[key] = [offset, pcm.nbytes]
+            offset += pcm.nbytes
+        header = json.dumps({'fingerprint': self._bank_fingerprint(), 'sounds': index}).encode()
+        tmp = f"{path}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(self.BANK_MAGIC)
+                f.write(len(header).to_bytes(4, 'little'))
+                f.write(header)
+                for pcm in buffers.values():
+                    f.write(pcm)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[SoundBank] Impossibile scrivere {path}: {e}")
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        self.warmup_stats = {'source': 'render', 'sounds': len(index), 'ms': elapsed, 'workers': self.workers}
+        print(f"[SoundBank] Creato {path}: {len(index)} suoni, {offset // 1024} KB in {elapsed:.0f} ms")
     
-    def _generate_wave(self, frequency: float, duration: float, wave_type: str = 'sine') -> np.ndarray:
-        num_samples = int(duration * self.sample_rate)
-        t = np.linspace(0, duration, num_samples, False)
-        
-        if wave_type == 'sine':
-            wave = np.sin(2 * np.pi * frequency * t)
-        elif wave_type == 'square':
-            wave = np.sign(np.sin(2 * np.pi * frequency * t))
-        elif wave_type == 'sawtooth':
-            wave = 2 * (t * frequency - np.floor(0.5 + t * frequency))
-        elif wave_type == 'triangle':
-            wave = 2 * np.abs(2 * (t * frequency - np.floor(0.5 + t * frequency))) - 1
+    def load_bank(self, path: str = BANK_FILE) -> bool:
+        """Carica il bank con una sola lettura (mmap); se manca o e' obsoleto lo ricostruisce"""
+        import mmap
+        import time
+        start = time.perf_counter()
+        try:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic_len = len(self.BANK_MAGIC)
+                if data[:magic_len] != self.BANK_MAGIC:
+                    raise ValueError("magic errato")
+                header_len = int.from_bytes(data[magic_len:magic_len + 4], 'little')
+                body = magic_len + 4 + header_len
+                header = json.loads(data[magic_len + 4:body])
+                if header.get('fingerprint') != self._bank_fingerprint():
+                    raise ValueError("preset cambiati")
+                view = memoryview(data)
+                try:
+                    for key, (offset, length) in header['sounds'].items():
+                        self.sounds_cache[key] = pygame.mixer.Sound(buffer=view[body + offset:body + offset + length])
+                finally:
+                    view.release()
+            self.warmup_stats = {'source': 'bank', 'sounds': len(header['sounds']),
+                                 'ms': (time.perf_counter() - start) * 1000}
+            return True
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[SoundBank] {path} non valido ({e}), rigenero")
+        self.build_bank(path)
+        return False
+    
+    # ---------- ENGINE ----------
+    def _samples(self, duration: float) -> int:
+        return int(duration * self.sample_rate)
+    
+    def _length(self, preset: dict) -> int:
+        return sum(self._samples(duration) for duration, _ in preset["notes"])
+    
+    def _buffers(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Base dei tempi e tre buffer di lavoro lunghi n (ingranditi solo se serve)"""
+        if len(self._time) < n:
+            self._time = np.arange(n, dtype=np.float32) / np.float32(self.sample_rate)
+        if self._work.shape[1] < n:
+            self._work = np.empty((3, n), dtype=np.float32)
+        return self._time[:n], self._work[0, :n], self._work[1, :n], self._work[2, :n]
+    
+    def _oscillate(self, out: np.ndarray, t: np.ndarray, freq, gain: float, shape: str,
+                   tmp: np.ndarray, tmp2: np.ndarray):
+        """Somma in `out` un oscillatore (fase in cicli; sweep lineare se freq = (f0, f1))"""
+        if isinstance(freq, tuple):
+            f0, f1 = freq
+            np.multiply(t, (f1 - f0) / (len(t) / self.sample_rate), out=tmp)
+            tmp += f0
+            tmp *= t
         else:
-            wave = np.sin(2 * np.pi * frequency * t)
-        return wave
-    
-    def _apply_envelope(self, wave: np.ndarray, attack: float, decay: float, sustain: float, release: float) -> np.ndarray:
-        total_samples = len(wave)
-        envelope = np.ones(total_samples)
-        
-        attack_samples = int(attack * self.sample_rate)
-        decay_samples = int(decay * self.sample_rate)
-        release_samples = int(release * self.sample_rate)
-        
-        if attack_samples > 0:
-            envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-        if decay_samples > 0:
-            decay_end = attack_samples + decay_samples
-            envelope[attack_samples:decay_end] = np.linspace(1, sustain, decay_samples)
-        
-        sustain_start = attack_samples + decay_samples
-        sustain_end = total_samples - release_samples
-        if sustain_end > sustain_start:
-            envelope[sustain_start:sustain_end] = sustain
-        if release_samples > 0:
-            envelope[-release_samples:] = np.linspace(sustain, 0, release_samples)
-        return wave * envelope
-    
-    def _to_pygame_sound(self, wave: np.ndarray, volume: float = 0.3) -> pygame.mixer.Sound:
-        wave = wave * volume
-        wave = np.clip(wave, -1.0, 1.0)
-        stereo_wave = np.column_stack((wave, wave))
-        sound_array = (stereo_wave * 32767).astype(np.int16)
-        return pygame.mixer.Sound(sound_array)
+            np.multiply(t, freq, out=tmp)
+        if shape in ('sine', 'square'):
+            tmp *= 2 * np.pi
+            np.sin(tmp, out=tmp)
+            if shape == 'square':
+                np.sign(tmp, out=tmp)
+        else:
+            np.add(tmp, 0.5, out=tmp2)
+            np.floor(tmp2, out=tmp2)
+            tmp -= tmp2
+            tmp *= 2
+            if shape == 'triangle':
+                np.abs(tmp, out=tmp)
+                tmp *= 2
+                tmp -= 1
+        if gain != 1.0:
+            tmp *= gain
+        out += tmp
+    
+    def _envelope(self, n: int, adsr: Tuple[float, float, float, float]) -> np.ndarray:
+        """Inviluppo ADSR lungo n campioni (in cache: i blip condividono lo stesso)"""
+        key = (n, adsr)
+        envelope = self._envelopes.get(key)
+        if envelope is not None:
+            return envelope
+        attack, decay, sustain, release = adsr
+        a, d, r = self._samples(attack), self._samples(decay), self._samples(release)
+        envelope = np.full(n, sustain, dtype=np.float32)
+        envelope[:a] = np.linspace(0, 1, a)[:n]
+        envelope[a:a + d] = np.linspace(1, sustain, d)[:max(0, n - a)]
+        if r > 0:
+            envelope[-r:] = np.linspace(sustain, 0, r)[-n:]
+        self._envelopes[key] = envelope
+        return envelope
+    
+    def render_into(self, preset: dict, out: np.ndarray):
+        """Renderizza un preset in `out` (int16, forma (n, 2)) senza copie float intermedie"""
+        n = len(out)
+        _, mono, tmp, tmp2 = self._buffers(n)
+        mono.fill(0)
+        start = 0
+        for duration, partials in preset["notes"]:
+            end = start + self._samples(duration)
+            t = self._time[:end - start]
+            for freq, gain, shape in partials:
+                self._oscillate(mono[start:end], t, freq, gain, shape, tmp[:end - start], tmp2[:end - start])
+            start = end
+        
+        noise = preset.get("noise")
+        if noise:
+            mix, amount = noise
+            self._rng.random(n, dtype=np.float32, out=tmp)
+            tmp *= 2 * amount * mix
+            tmp -= amount * mix
+            mono *= 1 - mix
+            mono += tmp
+        
+        mono *= self._envelope(n, preset["adsr"])
+        mono *= preset["volume"] * 32767
+        np.clip(mono, -32767, 32767, out=mono)
+        out[:, 0] = mono
+        out[:, 1] = out[:, 0]
+    
+    def render(self, preset: dict) -> np.ndarray:
+        pcm = np.empty((self._length(preset), 2), dtype=np.int16)
+        self.render_into(preset, pcm)
+        return pcm
+    
+    def render_all(self, names: Optional[List[str]] = None, workers: int = 0) -> Dict[str, np.ndarray]:
+        """Tutta la tabella in un passaggio: un buffer int16, una vista per suono"""
+        names = list(SOUND_PRESETS) if names is None else names
+        if workers > 1 and len(names) > 1:
+            try:
+                return self._render_parallel(names, workers)
+            except Exception as e:  # pool non disponibile (sandbox, processo figlio morto...)
+                print(f"[SoundSynthesizer] Render parallelo fallito ({e}), continuo in-process")
+        lengths = [self._length(SOUND_PRESETS[name]) for name in names]
+        bank = np.empty((sum(lengths), 2), dtype=np.int16)
+        self._buffers(max(lengths, default=0))
+        views, start = {}, 0
+        for name, n in zip(names, lengths):
+            views[name] = bank[start:start + n]
+            self.render_into(SOUND_PRESETS[name], views[name])
+            start += n
+        return views
+    
+    def _render_parallel(self, names: List[str], workers: int) -> Dict[str, np.ndarray]:
+        """Divide i preset tra `workers` processi bilanciando i campioni (i piu' lunghi prima)"""
+        from concurrent.futures import ProcessPoolExecutor
+        chunks: List[List[str]] = [[] for _ in range(min(workers, len(names)))]
+        loads = [0] * len(chunks)
+        for name in sorted(names, key=lambda n: -self._length(SOUND_PRESETS[n])):
+            i = loads.index(min(loads))
+            chunks[i].append(name)
+            loads[i] += self._length(SOUND_PRESETS[name])
+        rendered: Dict[str, bytes] = {}
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            for part in pool.map(_render_presets_worker, [self.sample_rate] * len(chunks), chunks):
+                rendered.update(part)
+        return {name: np.frombuffer(rendered[name], dtype=np.int16).reshape(-1, 2) for name in names}
+    
+    def warm_up(self):
+        """Prima del primo frame: ogni preset diventa un Sound (dal bank o renderizzato ora)"""
+        import time
+        start = time.perf_counter()
+        missing = [name for name in SOUND_PRESETS if name not in self.sounds_cache]
+        if missing:
+            for name, pcm in self.render_all(missing, workers=self.workers).items():
+                self.sounds_cache[name] = pygame.mixer.Sound(buffer=pcm)
+            self.warmup_stats = {'source': 'render', 'sounds': len(missing),
+                                 'ms': (time.perf_counter() - start) * 1000, 'workers': self.workers}
+        return self.warmup_stats
+    
+    def sound(self, name: str, preset: Optional[dict] = None) -> pygame.mixer.Sound:
+        """Sound del preset `name`, dalla cache o renderizzato al primo uso"""
+        sound = self.sounds_cache.get(name)
+        if sound is None:
+            pcm = self.render(preset if preset is not None else SOUND_PRESETS[name])
+            sound = self.sounds_cache[name] = pygame.mixer.Sound(buffer=pcm)
+        return sound
+    
+    def play(self, name: str) -> Optional[pygame.mixer.Channel]:
+        """Suona un preset passando da VOICES (cooldown, limiti di voci, priorita')"""
+        return VOICES.play(self.sound(name), name)
+    
+    def play_blip(self, pitch: int = 0) -> Optional[pygame.mixer.Channel]:
+        return VOICES.play(self.create_blip(pitch), f"blip_{pitch}")
     
+    # ---------- SUONI ----------
     def create_blip(self, pitch: int = 0) -> pygame.mixer.Sound:
-        cache_key = f"blip_{pitch}"
-        if cache_key in self.sounds_cache:
-            return self.sounds_cache[cache_key]
-        freq = 440 + (pitch * 100)
-        wave = self._generate_wave(freq, 0.05, 'square')
-        wave = self._apply_envelope(wave, 0.01, 0.01, 0.5, 0.03)
-        sound = self._to_pygame_sound(wave, 0.2)
-        self.sounds_cache[cache_key] = sound
-        return sound
+        return self.sound(f"blip_{pitch}", _blip_preset(pitch))
     
     def create_select(self) -> pygame.mixer.Sound:
-        if "select" in self.sounds_cache:
-            return self.sounds_cache["select"]
-        wave1 = self._generate_wave(440, 0.08, 'square')
-        wave2 = self._generate_wave(660, 0.08, 'square')
-        wave = np.concatenate([wave1, wave2])
-        wave = self._apply_envelope(wave, 0.01, 0.02, 0.7, 0.05)
-        sound = self._to_pygame_sound(wave, 0.25)
-        self.sounds_cache["select"] = sound
-        return sound
+        return self.sound("select")
     
     def create_back(self) -> pygame.mixer.Sound:
-        if "back" in self.sounds_cache:
-            return self.sounds_cache["back"]
-        wave = self._generate_wave(330, 0.1, 'sine')
-        wave = self._apply_envelope(wave, 0.01, 0.03, 0.5, 0.06)
-        sound = self._to_pygame_sound(wave, 0.2)
-        self.sounds_cache["back"] = sound
-        return sound
+        return self.sound("back")
     
     def create_game_start(self) -> pygame.mixer.Sound:
-        if "game_start" in self.sounds_cache:
-            return self.sounds_cache["game_start"]
-        freqs = [262, 330, 392, 523]
-        waves = [self._generate_wave(freq, 0.12, 'sine') for freq in freqs]
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.01, 0.02, 0.8, 0.1)
-        sound = self._to_pygame_sound(wave, 0.3)
-        self.sounds_cache["game_start"] = sound
-        return sound
+        return self.sound("game_start")
     
     def create_score_point(self) -> pygame.mixer.Sound:
-        if "score_point" in self.sounds_cache:
-            return self.sounds_cache["score_point"]
-        wave = self._generate_wave(880, 0.06, 'triangle')
-        wave = self._apply_envelope(wave, 0.005, 0.01, 0.6, 0.045)
-        sound = self._to_pygame_sound(wave, 0.25)
-        self.sounds_cache["score_point"] = sound
-        return sound
+        return self.sound("score_point")
     
     def create_game_over(self) -> pygame.mixer.Sound:
-        if "game_over" in self.sounds_cache:
-            return self.sounds_cache["game_over"]
-        freqs = [440, 370, 311, 233]
-        waves = [self._generate_wave(freq, 0.2, 'sawtooth') for freq in freqs]
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.02, 0.05, 0.7, 0.2)
-        sound = self._to_pygame_sound(wave, 0.3)
-        self.sounds_cache["game_over"] = sound
-        return sound
+        return self.sound("game_over")
     
     def create_high_score(self) -> pygame.mixer.Sound:
-        if "high_score" in self.sounds_cache:
-            return self.sounds_cache["high_score"]
-        freqs = [523, 659, 784, 1047]
-        waves = []
-        for i, freq in enumerate(freqs):
-            duration = 0.15 if i < 3 else 0.3
-            waves.append(self._generate_wave(freq, duration, 'sine'))
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.01, 0.03, 0.8, 0.2)
-        sound = self._to_pygame_sound(wave, 0.35)
-        self.sounds_cache["high_score"] = sound
-        return sound
+        return self.sound("high_score")
     
     def create_hit(self) -> pygame.mixer.Sound:
-        if "hit" in self.sounds_cache:
-            return self.sounds_cache["hit"]
-        wave = self._generate_wave(200, 0.08, 'square')
-        noise = np.random.uniform(-0.5, 0.5, len(wave))
-        wave = wave * 0.3 + noise * 0.7
-        wave = self._apply_envelope(wave, 0.001, 0.02, 0.3, 0.057)
-        sound = self._to_pygame_sound(wave, 0.2)
-        self.sounds_cache["hit"] = sound
-        return sound
+        return self.sound("hit")
     
     def create_powerup(self) -> pygame.mixer.Sound:
         """Power-up collected sound - ascending magical chime"""
-        if "powerup" in self.sounds_cache:
-            return self.sounds_cache["powerup"]
-        freqs = [523, 659, 784, 1047, 1319]  # C5, E5, G5, C6, E6
-        waves = []
-        for freq in freqs:
-            wave = self._generate_wave(freq, 0.08, 'sine')
-            # Add harmonic for sparkle effect
-            harmonic = self._generate_wave(freq * 2, 0.08, 'sine') * 0.3
-            waves.append(wave + harmonic)
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.005, 0.02, 0.8, 0.1)
-        sound = self._to_pygame_sound(wave, 0.28)
-        self.sounds_cache["powerup"] = sound
-        return sound
+        return self.sound("powerup")
     
     def create_brick_break(self) -> pygame.mixer.Sound:
         """Brick breaking sound - satisfying crunch"""
-        if "brick_break" in self.sounds_cache:
-            return self.sounds_cache["brick_break"]
-        # Combination of tone and noise for impact
-        wave = self._generate_wave(150, 0.1, 'square')
-        noise = np.random.uniform(-0.6, 0.6, len(wave))
-        wave = wave * 0.4 + noise * 0.6
-        wave = self._apply_envelope(wave, 0.001, 0.03, 0.3, 0.066)
-        sound = self._to_pygame_sound(wave, 0.22)
-        self.sounds_cache["brick_break"] = sound
-        return sound
+        return self.sound("brick_break")
     
     def create_laser_shoot(self) -> pygame.mixer.Sound:
         """Laser shooting sound - sci-fi pew"""
-        if "laser_shoot" in self.sounds_cache:
-            return self.sounds_cache["laser_shoot"]
-        # Descending frequency for laser effect
-        duration = 0.12
-        num_samples = int(duration * self.sample_rate)
-        t = np.linspace(0, duration, num_samples, False)
-        # Frequency sweep from 1200 to 400 Hz
-        freq_sweep = 1200 - (800 * t / duration)
-        wave = np.sin(2 * np.pi * freq_sweep * t)
-        wave = self._apply_envelope(wave, 0.001, 0.02, 0.5, 0.099)
-        sound = self._to_pygame_sound(wave, 0.2)
-        self.sounds_cache["laser_shoot"] = sound
-        return sound
+        return self.sound("laser_shoot")
     
     def create_level_complete(self) -> pygame.mixer.Sound:
         """Level complete fanfare - victory jingle"""
-        if "level_complete" in self.sounds_cache:
-            return self.sounds_cache["level_complete"]
-        # Victory melody: C-E-G-C (arpeggiated chord)
-        freqs = [523, 659, 784, 1047]
-        waves = []
-        for i, freq in enumerate(freqs):
-            duration = 0.15 if i < 3 else 0.35
-            wave = self._generate_wave(freq, duration, 'triangle')
-            # Add fifth harmonic for richness
-            harmonic = self._generate_wave(freq * 1.5, duration, 'sine') * 0.2
-            waves.append(wave + harmonic)
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.01, 0.03, 0.85, 0.15)
-        sound = self._to_pygame_sound(wave, 0.32)
-        self.sounds_cache["level_complete"] = sound
-        return sound
+        return self.sound("level_complete")
     
     def create_ball_lost(self) -> pygame.mixer.Sound:
         """Ball lost sound - descending sad tone"""
-        if "ball_lost" in self.sounds_cache:
-            return self.sounds_cache["ball_lost"]
-        freqs = [440, 370, 311]  # Descending notes
-        waves = [self._generate_wave(freq, 0.15, 'sine') for freq in freqs]
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.01, 0.05, 0.6, 0.15)
-        sound = self._to_pygame_sound(wave, 0.25)
-        self.sounds_cache["ball_lost"] = sound
-        return sound
+        return self.sound("ball_lost")
     
     def create_combo(self) -> pygame.mixer.Sound:
         """Combo hit sound - quick ascending beep"""
-        if "combo" in self.sounds_cache:
-            return self.sounds_cache["combo"]
-        wave = self._generate_wave(660, 0.05, 'square')
-        wave2 = self._generate_wave(880, 0.05, 'square')
-        wave = np.concatenate([wave, wave2])
-        wave = self._apply_envelope(wave, 0.005, 0.01, 0.7, 0.035)
-        sound = self._to_pygame_sound(wave, 0.2)
-        self.sounds_cache["combo"] = sound
-        return sound
+        return self.sound("combo")
     
     def create_paddle_hit(self) -> pygame.mixer.Sound:
         """Paddle hit sound - bounce effect"""
-        if "paddle_hit" in self.sounds_cache:
-            return self.sounds_cache["paddle_hit"]
-        wave = self._generate_wave(330, 0.08, 'triangle')
-        noise = np.random.uniform(-0.3, 0.3, len(wave))
-        wave = wave * 0.7 + noise * 0.3
-        wave = self._apply_envelope(wave, 0.001, 0.015, 0.4, 0.064)
-        sound = self._to_pygame_sound(wave, 0.22)
-        self.sounds_cache["paddle_hit"] = sound
-        return sound
+        return self.sound("paddle_hit")
     
     def create_wall_bounce(self) -> pygame.mixer.Sound:
         """Wall bounce sound - sharp tick"""
-        if "wall_bounce" in self.sounds_cache:
-            return self.sounds_cache["wall_bounce"]
-        wave = self._generate_wave(250, 0.06, 'square')
-        noise = np.random.uniform(-0.4, 0.4, len(wave))
-        wave = wave * 0.5 + noise * 0.5
-        wave = self._apply_envelope(wave, 0.001, 0.01, 0.3, 0.049)
-        sound = self._to_pygame_sound(wave, 0.18)
-        self.sounds_cache["wall_bounce"] = sound
-        return sound
+        return self.sound("wall_bounce")
     
     def create_multiball(self) -> pygame.mixer.Sound:
         """Multiball activation - explosive sound"""
-        if "multiball" in self.sounds_cache:
-            return self.sounds_cache["multiball"]
-        # Multiple frequencies at once for chaotic effect
-        wave1 = self._generate_wave(440, 0.2, 'square')
-        wave2 = self._generate_wave(554, 0.2, 'square')
-        wave3 = self._generate_wave(659, 0.2, 'square')
-        wave = (wave1 + wave2 + wave3) / 3
-        wave = self._apply_envelope(wave, 0.01, 0.04, 0.7, 0.15)
-        sound = self._to_pygame_sound(wave, 0.3)
-        self.sounds_cache["multiball"] = sound
-        return sound
+        return self.sound("multiball")
     
     def create_shield_activate(self) -> pygame.mixer.Sound:
         """Shield/protection activation - rising protective sound"""
-        if "shield_activate" in self.sounds_cache:
-            return self.sounds_cache["shield_activate"]
-        # Rising frequency sweep
-        duration = 0.25
-        num_samples = int(duration * self.sample_rate)
-        t = np.linspace(0, duration, num_samples, False)
-        freq_sweep = 200 + (600 * t / duration)
-        wave = np.sin(2 * np.pi * freq_sweep * t)
-        wave = self._apply_envelope(wave, 0.01, 0.05, 0.8, 0.19)
-        sound = self._to_pygame_sound(wave, 0.25)
-        self.sounds_cache["shield_activate"] = sound
-        return sound
+        return self.sound("shield_activate")
+
+
+def _render_presets_worker(sample_rate: int, names: List[str]) -> Dict[str, bytes]:
+    """Worker di ProcessPoolExecutor: solo NumPy, niente mixer; ritorna PCM int16 stereo grezzo"""
+    synth = SoundSynthesizer(sample_rate, bank_file=None, mixer=False)
+    return {name: pcm.tobytes() for name, pcm in synth.render_all(names).items()}
+
+
+# ============== VOICE MANAGER ==============
+class VoiceManager:
+    """Allocazione dei canali del mixer per gli effetti sonori.
+
+    Ogni play passa da qui: cooldown per suono (richieste troppo ravvicinate si scartano),
+    massimo di voci contemporanee per suono (oltre si riusa la voce piu' vecchia dello stesso
+    suono) e, a canali esauriti, furto della voce con priorita' piu' bassa (a parita', la piu'
+    vecchia) se non supera quella del nuovo suono. Le regole sono per famiglia: "blip_2" usa "blip".
+    """
+
+    # famiglia -> (priorita', cooldown s, voci max)
+    RULES: Dict[str, Tuple[int, float, int]] = {
+        "blip": (1, 0.03, 2),
+        "select": (3, 0.0, 1),
+        "back": (3, 0.0, 1),
+        "game_start": (4, 0.0, 1),
+        "score_point": (1, 0.04, 3),
+        "game_over": (4, 0.0, 1),
+        "high_score": (4, 0.0, 1),
+        "hit": (1, 0.03, 3),
+        "powerup": (2, 0.1, 2),
+        "brick_break": (1, 0.03, 3),
+        "laser_shoot": (1, 0.06, 2),
+        "level_complete": (4, 0.0, 1),
+        "ball_lost": (3, 0.0, 1),
+        "combo": (2, 0.08, 2),
+        "paddle_hit": (2, 0.05, 2),
+        "wall_bounce": (0, 0.05, 2),
+        "multiball": (3, 0.2, 1),
+        "shield_activate": (3, 0.2, 1),
+    }
+    DEFAULT_RULE = (1, 0.03, 2)
+    RESERVED = 1  # canale 0: AudioStream
+
+    def __init__(self, channels: int = 16):
+        self.num_channels = channels
+        self._channels: List[pygame.mixer.Channel] = []
+        self._owners: List[Optional[Tuple[str, int, float]]] = []  # (suono, priorita', inizio)
+        self._last_play: Dict[str, float] = {}
+        self.requested = 0
+        self.played = 0
+        self.throttled = 0
+        self.retriggered = 0
+        self.stolen = 0
+
+    def _ensure_channels(self) -> bool:
+        if not self._channels:
+            if not pygame.mixer.get_init():
+                return False
+            pygame.mixer.set_num_channels(self.RESERVED + self.num_channels)
+            pygame.mixer.set_reserved(self.RESERVED)
+            self._channels = [pygame.mixer.Channel(self.RESERVED + i) for i in range(self.num_channels)]
+            self._owners = [None] * self.num_channels
+        return True
+
+    def stream_channel(self) -> Optional[pygame.mixer.Channel]:
+        """Canale riservato allo stream procedurale (fuori dal budget delle voci)"""
+        return pygame.mixer.Channel(0) if self._ensure_channels() else None
+
+    def rule(self, name: str) -> Tuple[int, float, int]:
+        return self.RULES.get(name) or self.RULES.get(name.split("_")[0], self.DEFAULT_RULE)
+
+    def _pick_channel(self, name: str, priority: int, max_voices: int) -> Optional[int]:
+        free, same, victim = None, [], None
+        for i, channel in enumerate(self._channels):
+            owner = self._owners[i]
+            if owner is None or not channel.get_busy():
+                if free is None:
+                    free = i
+                continue
+            if owner[0] == name:
+                same.append(i)
+            if victim is None or owner[1:] < self._owners[victim][1:]:
+                victim = i
+        if len(same) >= max_voices:
+            self.retriggered += 1
+            return min(same, key=lambda i: self._owners[i][2])
+        if free is not None:
+            return free
+        if victim is not None and self._owners[victim][1] <= priority:
+            self.stolen += 1
+            return victim
+        return None
+
+    def play(self, sound: pygame.mixer.Sound, name: str) -> Optional[pygame.mixer.Channel]:
+        """Suona `sound` secondo le regole di `name`; None se scartato"""
+        self.requested += 1
+        if not self._ensure_channels():
+            return None
+        priority, cooldown, max_voices = self.rule(name)
+        now = perf_counter()
+        if now - self._last_play.get(name, -1.0) < cooldown:
+            self.throttled += 1
+            return None
+        index = self._pick_channel(name, priority, max_voices)
+        if index is None:
+            self.throttled += 1
+            return None
+        channel = self._channels[index]
+        channel.play(sound)
+        self._owners[index] = (name, priority, now)
+        self._last_play[name] = now
+        self.played += 1
+        return channel
+
+    def busy(self) -> int:
+        return sum(1 for channel in self._channels if channel.get_busy())
+
+    def overlay_line(self) -> str:
+        return (f"Voices: {self.played}/{self.requested} played, {self.throttled} throttled, "
+                f"{self.stolen} stolen, {self.busy()}/{self.num_channels} busy")
+
+
+VOICES = VoiceManager()
+
+
+# ============== AUDIO STREAM ==============
+class AudioStream:
+    """Audio procedurale continuo: blocchi NumPy piccoli accodati su un canale riservato del mixer.
+
+    Tre Sound da `block` campioni girano ad anello (uno suona, uno e' in coda, uno si scrive in
+    place con sndarray.samples); update() dal main loop riempie la coda quando si libera, quindi
+    la latenza e' ~2 blocchi. Oscillatore sine/saw a fase continua con pitch e volume in rampa
+    lungo il blocco, poi un passa-basso FIR a media mobile la cui lunghezza segue `brightness`.
+    I giochi chiamano set(); a volume zero lo stream si ferma e non costa nulla.
+    """
+
+    MAX_TAPS = 16
+
+    def __init__(self, block: int = 1024, sample_rate: int = 44100):
+        self.block = block
+        self.sample_rate = sample_rate
+        self.freq = self._freq = 110.0
+        self.gain = self._gain = 0.0
+        self.brightness = self._brightness = 0.5
+        self.saw_mix = 0.3
+        self.underruns = 0
+        self.blocks = 0
+        self.render_time = 0.0
+        self._phase = 0.0
+        self._history = np.zeros(self.MAX_TAPS, dtype=np.float32)
+        self._channel: Optional[pygame.mixer.Channel] = None
+        self._ring: List[pygame.mixer.Sound] = []
+        self._next = 0
+        self.resize(block)
+
+    def resize(self, block: int):
+        """Cambia la dimensione del blocco (i Sound dell'anello si ricreano al prossimo avvio)"""
+        self.stop()
+        self.block = block
+        self._ramp = np.arange(1, block + 1, dtype=np.float32) / block
+        self._work = np.empty((3, block + self.MAX_TAPS), dtype=np.float32)
+        self._channel = None
+        self._ring = []
+        self._next = 0
+
+    @property
+    def latency(self) -> float:
+        """Secondi tra set() e l'uscita: blocco in riproduzione + blocco in coda"""
+        return 2 * self.block / self.sample_rate
+
+    def set(self, freq: Optional[float] = None, gain: Optional[float] = None,
+            brightness: Optional[float] = None):
+        """Parametri bersaglio, raggiunti in rampa nel prossimo blocco"""
+        if freq is not None:
+            self.freq = max(20.0, min(self.sample_rate / 4, freq))
+        if gain is not None:
+            self.gain = max(0.0, min(1.0, gain))
+        if brightness is not None:
+            self.brightness = max(0.0, min(1.0, brightness))
+
+    def render_block(self, out: np.ndarray):
+        """Un blocco nello int16 `out` ((block, 2) o (block,)): fase, filtro e rampe proseguono"""
+        n = self.block
+        sr = self.sample_rate
+        phase, tmp, buf = self._work[0, :n], self._work[1, :n], self._work[2]
+        ramp = self._ramp
+
+        # Fase continua con glissando lineare del pitch
+        np.multiply(ramp, (self.freq - self._freq) / sr, out=phase)
+        phase += self._freq / sr
+        np.cumsum(phase, out=phase)
+        phase += self._phase
+        self._phase = float(phase[-1]) % 1.0
+        self._freq = self.freq
+
+        # Sine + saw (la saw da' le armoniche che il filtro toglie)
+        x = buf[self.MAX_TAPS:self.MAX_TAPS + n]
+        np.multiply(phase, 2 * np.pi, out=x)
+        np.sin(x, out=x)
+        np.floor(phase, out=tmp)
+        np.subtract(phase, tmp, out=tmp)
+        tmp *= 2
+        tmp -= 1
+        x *= 1 - self.saw_mix
+        tmp *= self.saw_mix
+        x += tmp
+
+        # Passa-basso: media mobile di `taps` campioni con la coda del blocco precedente
+        taps = 1 + int(round((1.0 - self.brightness) * (self.MAX_TAPS - 1)))
+        self._brightness = self.brightness
+        buf[:self.MAX_TAPS] = self._history
+        self._history[:] = buf[n:n + self.MAX_TAPS]
+        np.cumsum(buf[:n + self.MAX_TAPS], out=buf[:n + self.MAX_TAPS])
+        np.subtract(buf[self.MAX_TAPS:], buf[self.MAX_TAPS - taps:self.MAX_TAPS - taps + n], out=tmp)
+        tmp *= 1.0 / taps
+
+        # Volume in rampa, poi int16 direttamente nel buffer del Sound
+        np.multiply(ramp, self.gain - self._gain, out=phase)
+        phase += self._gain
+        self._gain = self.gain
+        tmp *= phase
+        tmp *= 32767
+        if out.ndim == 2:
+            out[:, 0] = tmp
+            out[:, 1] = out[:, 0]
+        else:
+            out[:] = tmp
+
+    def _start(self) -> bool:
+        self._channel = VOICES.stream_channel()
+        if self._channel is None:
+            return False
+        if not self._ring:
+            self.sample_rate, _, channels = pygame.mixer.get_init()
+            shape = (self.block, channels) if channels > 1 else (self.block,)
+            self._ring = [pygame.mixer.Sound(buffer=np.zeros(shape, dtype=np.int16)) for _ in range(3)]
+        return True
+
+    def update(self):
+        """Dal main loop, una volta per frame: tiene piena la coda del canale"""
+        if self.gain == 0.0 and self._gain == 0.0:
+            if self._channel is not None and self._channel.get_busy():
+                self._channel.stop()
+            return
+        if self._channel is None and not self._start():
+            return
+        # Al massimo due blocchi: dopo un vuoto (avvio o underrun) play + queue insieme
+        for _ in range(2):
+            idle = not self._channel.get_busy()
+            if not idle and self._channel.get_queue() is not None:
+                return
+            if idle and self.blocks:
+                self.underruns += 1
+            start = perf_counter()
+            sound = self._ring[self._next]
+            self._next = (self._next + 1) % len(self._ring)
+            self.render_block(pygame.sndarray.samples(sound))
+            self.render_time = perf_counter() - start
+            self.blocks += 1
+            if idle:
+                self._channel.play(sound)
+            else:
+                self._channel.queue(sound)
+
+    def stop(self):
+        self.gain = self._gain = 0.0
+        if self._channel is not None:
+            self._channel.stop()
+
+    def overlay_line(self) -> str:
+        return (f"Stream: {self.latency * 1000:.0f}ms, {self.render_time * 1000:.3f}ms/block, "
+                f"underruns {self.underruns}")
+
+
+STREAM = AudioStream()
+
+
+# ============== MUSIC CACHE ==============
+class MusicCache:
+    """Tracce della playlist pronte in RAM, preparate in background.
+
+    Un thread legge il file; se c'e' budget la decodifica va a un processo separato (mixer.Sound
+    tiene il lock del device audio per tutto il decode, e nel processo del gioco bloccherebbe ogni
+    effetto sonoro) che ritorna un WAV al formato del mixer: music.load non deve piu' decodificare
+    ne' ricampionare. Se il PCM supera meta' budget si tengono i byte compressi. LRU entro
+    budget_mb, tranne le tracce pinnate (corrente e successiva). get() non blocca mai.
+    """
+
+    def __init__(self, budget_mb: int = 64):
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.read_times: Dict[str, float] = {}
+        self.decode_times: Dict[str, float] = {}
+        self.switch_times: deque = deque(maxlen=32)
+        self.gapless = 0
+        self.switches = 0
+        self._entries: OrderedDict = OrderedDict()  # path -> (bytes, namehint)
+        self._bytes = 0
+        self._pinned: set = set()
+        self._requested: set = set()
+        self._lock = threading.Lock()
+        self._jobs: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._decoder = None  # ProcessPoolExecutor, creato al primo decode
+
+    # ---------- MAIN THREAD ----------
+    def request(self, path: str):
+        """Accoda la preparazione di una traccia (una volta sola finche' resta in cache)"""
+        with self._lock:
+            if path in self._entries or path in self._requested:
+                return
+            self._requested.add(path)
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="MusicCache", daemon=True)
+            self._worker.start()
+        self._jobs.put(path)
+
+    def get(self, path: str) -> Optional[Tuple[io.BytesIO, str]]:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            self._entries.move_to_end(path)
+        return io.BytesIO(entry[0]), entry[1]
+
+    def load(self, path: str) -> Tuple[io.BytesIO, str]:
+        """Come get(), ma se la traccia non e' pronta la legge subito (senza decodifica).
+        Ritorna i byte appena letti: fuori budget (es. music_cache_mb 0) _store la scarta subito"""
+        track = self.get(path)
+        if track is None:
+            data, hint = self._read(path), Path(path).suffix.lstrip(".").lower()
+            self._store(path, data, hint)
+            track = io.BytesIO(data), hint
+        return track
+
+    def pin(self, paths):
+        with self._lock:
+            self._pinned = set(paths)
+            self._evict()
+
+    def switched(self, seconds: float, gapless: bool):
+        self.switch_times.append(seconds)
+        self.switches += 1
+        self.gapless += gapless
+
+    def memory_bytes(self) -> int:
+        return self._bytes
+
+    def overlay_line(self) -> str:
+        switch = max(self.switch_times, default=0.0) * 1000
+        decode = max(self.decode_times.values(), default=0.0) * 1000
+        return (f"Music: {len(self._entries)} in cache {self._bytes >> 20}/{self.budget_bytes >> 20} MB, "
+                f"decode {decode:.0f}ms, switch {switch:.1f}ms, gapless {self.gapless}/{self.switches}")
+
+    def stop(self):
+        if self._worker is not None and self._worker.is_alive():
+            self._jobs.put(None)
+        if self._decoder is not None:
+            self._decoder.shutdown(wait=False, cancel_futures=True)
+            self._decoder = None
+
+    # ---------- WORKER ----------
+    def _read(self, path: str) -> bytes:
+        start = perf_counter()
+        data = Path(path).read_bytes()
+        self.read_times[path] = perf_counter() - start
+        return data
+
+    def _decode(self, path: str) -> Optional[bytes]:
+        """WAV al formato del mixer dal processo di decodifica, o None (niente mixer/budget, non 16 bit)"""
+        init = pygame.mixer.get_init()
+        if not init or abs(init[1]) != 16 or self.budget_bytes <= 0:
+            return None
+        if self._decoder is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # spawn: un fork copierebbe lo stato di SDL con il thread audio (e i suoi lock) a meta'
+            self._decoder = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+                                                initializer=_music_decoder_init)
+        start = perf_counter()
+        wav = self._decoder.submit(_decode_music_worker, path, init, self.budget_bytes // 2).result()
+        if wav is not None:
+            self.decode_times[path] = perf_counter() - start
+        return wav
+
+    def _store(self, path: str, data: bytes, hint: str):
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._bytes -= len(old[0])
+            self._entries[path] = (data, hint)
+            self._bytes += len(data)
+            self._requested.discard(path)
+            self._evict()
+
+    def _evict(self):
+        """Scarta le tracce meno recenti non pinnate finche' si rientra nel budget (lock gia' preso)"""
+        for path in list(self._entries):
+            if self._bytes <= self.budget_bytes:
+                return
+            if path not in self._pinned:
+                self._bytes -= len(self._entries.pop(path)[0])
+
+    def _run(self):
+        # Priorita' bassa anche per il processo di decodifica, che su Linux la eredita dal thread
+        # che lo crea: cosi' anche il suo avvio (import di pygame e numpy) non ruba tempo al frame
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except (AttributeError, OSError):
+            pass
+        while True:
+            path = self._jobs.get()
+            if path is None:
+                return
+            try:
+                data = self._read(path)
+                try:
+                    pcm = self._decode(path)
+                except Exception as e:  # pygame.error dal worker, processo morto, pool chiuso
+                    print(f"[Music] Decodifica fallita {Path(path).name}: {e}")
+                    pcm = None
+                if pcm is not None:
+                    self._store(path, pcm, "wav")
+                else:
+                    self._store(path, data, Path(path).suffix.lstrip(".").lower())
+            except OSError as e:
+                print(f"[Music] Lettura fallita {Path(path).name}: {e}")
+                with self._lock:
+                    self._requested.discard(path)
+
+
+def _music_decoder_init():
+    """Initializer del processo di decodifica: priorita' bassa, e mai il device audio reale"""
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    try:
+        os.nice(19)
+    except (AttributeError, OSError):
+        pass
+
+
+def _decode_music_worker(path: str, fmt: Tuple[int, int, int], limit: int) -> Optional[bytes]:
+    """Worker del processo di decodifica: PCM in un WAV al formato `fmt` del mixer, None oltre `limit` byte"""
+    if pygame.mixer.get_init() is None:
+        pygame.mixer.init(frequency=fmt[0], size=fmt[1], channels=fmt[2])
+    if pygame.mixer.get_init() != tuple(fmt):
+        return None
+    pcm = pygame.mixer.Sound(path).get_raw()
+    if len(pcm) > limit:
+        return None
+    out = io.BytesIO()
+    with wave.open(out, "wb") as wav:
+        wav.setnchannels(fmt[2])
+        wav.setsampwidth(2)
+        wav.setframerate(fmt[0])
+        wav.writeframes(pcm)
+    return out.getvalue()
+
+
+MUSIC = MusicCache()
+
+
+# ============== PROFILER ==============
+class _NullZone:
+    """Zona vuota restituita a profiler spento: nessuna misura, nessuna allocazione"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_ZONE = _NullZone()
+
+
+class _Zone:
+    __slots__ = ("profiler", "name", "start", "depth")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._stack
+        self.depth = len(stack)
+        stack.append(self.name)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = perf_counter()
+        profiler = self.profiler
+        profiler._stack.pop()
+        profiler._zones.append((self.name, self.depth, self.start, end - self.start))
+        return False
+
+
+class Profiler:
+    """Profiler gerarchico a zone (context manager / decoratore) con overlay a barre e dump.
+
+    Da spento zone() ritorna una zona vuota condivisa e @profiled fa un solo controllo di flag.
+    Ogni frame (begin_frame/end_frame) conserva le sue zone con inizio, durata e profondita';
+    gli ultimi `history` frame restano in memoria per l'overlay e per dump() in CSV o JSON.
+    """
+
+    BAR_WIDTH = 600
+    ROW_HEIGHT = 16
+
+    def __init__(self, history: int = 600):
+        self.enabled = False
+        self.show_overlay = False
+        self.frames: deque = deque(maxlen=history)
+        self.frame_index = 0
+        self._stack: List[str] = []
+        self._zones: list = []
+        self._frame_start = 0.0
+        self._font = None
+        self._owner = threading.get_ident()  # le zone si registrano solo dal thread principale
+
+    def enable(self, overlay: bool = True):
+        self.enabled = True
+        self.show_overlay = overlay
+        self._zones = []
+        self._frame_start = perf_counter()
+
+    def disable(self):
+        self.enabled = False
+        self.show_overlay = False
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        print(f"[Profiler] {'ON' if self.enabled else 'OFF'}")
+
+    def zone(self, name: str):
+        if self.enabled and threading.get_ident() == self._owner:
+            return _Zone(self, name)
+        return _NULL_ZONE
+
+    def begin_frame(self):
+        if self.enabled:
+            self._zones = []
+            self._frame_start = perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        end = perf_counter()
+        self.frames.append((self.frame_index, self._frame_start, end - self._frame_start, self._zones))
+        self.frame_index += 1
+        self._zones = []
+
+    # ---------- OUTPUT ----------
+    def summary(self, frames: int = 60) -> Dict[str, float]:
+        """Media in ms per zona sugli ultimi `frames` frame"""
+        recent = list(self.frames)[-frames:]
+        totals: Dict[str, float] = {}
+        for _, _, _, zones in recent:
+            for name, _, _, duration in zones:
+                totals[name] = totals.get(name, 0.0) + duration
+        count = max(1, len(recent))
+        return {name: total * 1000.0 / count for name, total in totals.items()}
+
+    def dump(self, path: Optional[str] = None) -> Optional[str]:
+        """Scrive gli ultimi frame registrati (.json o .csv, dall'estensione)"""
+        if not self.frames:
+            return None
+        if path is None:
+            path = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        rows = [
+            (index, name, depth, (start - frame_start) * 1000.0, duration * 1000.0)
+            for index, frame_start, _, zones in self.frames
+            for name, depth, start, duration in zones
+        ]
+        try:
+            with open(path, 'w', newline='') as f:
+                if path.endswith('.json'):
+                    json.dump({
+                        'frames': [
+                            {'frame': index, 'ms': round(total * 1000.0, 4)}
+                            for index, _, total, _ in self.frames
+                        ],
+                        'zones': [
+                            {'frame': r[0], 'name': r[1], 'depth': r[2],
+                             'start_ms': round(r[3], 4), 'ms': round(r[4], 4)}
+                            for r in rows
+                        ],
+                    }, f, indent=1)
+                else:
+                    import csv
+                    writer = csv.writer(f)
+                    writer.writerow(['frame', 'zone', 'depth', 'start_ms', 'ms'])
+                    for r in rows:
+                        writer.writerow([r[0], r[1], r[2], f"{r[3]:.4f}", f"{r[4]:.4f}"])
+        except OSError as e:
+            print(f"[Profiler] Dump fallito: {e}")
+            return None
+        print(f"[Profiler] {len(self.frames)} frame salvati in {path}")
+        return path
+
+    @staticmethod
+    def _zone_color(name: str) -> Tuple[int, int, int]:
+        h = sum(map(ord, name)) * 2654435761 & 0xFFFFFF
+        return 80 + (h & 0x7F), 80 + ((h >> 8) & 0x7F), 80 + ((h >> 16) & 0x7F)
+
+    def draw_overlay(self, surface: pygame.Surface, x: int = 10, y: int = 10):
+        """Flame bar dell'ultimo frame completo: una riga per livello, scala = max(frame, 16.7 ms)"""
+        if not self.show_overlay or not self.frames:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        _, frame_start, total, zones = self.frames[-1]
+        budget = 1.0 / 60.0
+        span = max(total, budget)
+        px = self.BAR_WIDTH / span
+        depth = 1 + max((z[1] for z in zones), default=0)
+        height = 22 + depth * self.ROW_HEIGHT
+
+        bg = pygame.Surface((self.BAR_WIDTH + 10, height), pygame.SRCALPHA)
+        bg.fill((0, 0, 0, 180))
+        surface.blit(bg, (x - 5, y - 5))
+        label = self._font.render(f"frame {total * 1000:.2f} ms", True, (230, 230, 230))
+        surface.blit(label, (x, y))
+        budget_x = x + int(budget * px)
+        pygame.draw.line(surface, (255, 80, 80), (budget_x, y), (budget_x, y + height - 10))
+
+        top = y + 16
+        for name, level, start, duration in zones:
+            rect = pygame.Rect(x + int((start - frame_start) * px), top + level * self.ROW_HEIGHT,
+                               max(1, int(duration * px)), self.ROW_HEIGHT - 2)
+            pygame.draw.rect(surface, self._zone_color(name), rect)
+            if rect.width > 50:
+                text = self._font.render(f"{name} {duration * 1000:.2f}", True, (0, 0, 0))
+                surface.blit(text, (rect.x + 2, rect.y + 1), pygame.Rect(0, 0, rect.width - 4, rect.height))
+
+
+PROFILER = Profiler()
+
+
+def profiled(fn):
+    """Decoratore: misura la funzione come zona col suo __qualname__ (quasi gratis da spento)"""
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not PROFILER.enabled:
+            return fn(*args, **kwargs)
+        with _Zone(PROFILER, name):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+# ============== TEXT CACHE ==============
+class TextCache:
+    """Cache LRU delle scritte renderizzate, condivisa da tutti gli stati e minigiochi.
+
+    Chiave (font, testo, colore, antialias, sfondo, alpha/outline/ombra): le scritte statiche o
+    che cambiano di rado si renderizzano una volta sola. Le surface restituite sono condivise:
+    non vanno modificate (set_alpha, fill...), per la trasparenza si usa il parametro alpha.
+    Usata anche dal thread di presentazione (overlay FPS): gli accessi all'LRU sono sotto lock.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._fonts: Dict[tuple, pygame.font.Font] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """Font condiviso: evita di ricaricare il file a ogni frame"""
+        key = (name, size)
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is None:
+                font = self._fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    @staticmethod
+    def _size_of(surf: pygame.Surface) -> int:
+        return surf.get_bytesize() * surf.get_width() * surf.get_height()
+
+    def _lookup(self, key: tuple) -> Optional[pygame.Surface]:
+        with self._lock:
+            surf = self._cache.get(key)
+            if surf is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+        return surf
+
+    def _store(self, key: tuple, surf: pygame.Surface) -> pygame.Surface:
+        # Il render avviene fuori dal lock: se l'altro thread ha gia' salvato la stessa chiave
+        # si sostituisce la sua surface senza contarla due volte
+        with self._lock:
+            self.misses += 1
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self.bytes -= self._size_of(old)
+            self._cache[key] = surf
+            self.bytes += self._size_of(surf)
+            while len(self._cache) > self.max_entries or (self.bytes > self.max_bytes and len(self._cache) > 1):
+                _, old = self._cache.popitem(last=False)
+                self.bytes -= self._size_of(old)
+        return surf
+
+    @staticmethod
+    def _fade(surf: pygame.Surface, alpha: int) -> pygame.Surface:
+        """Moltiplica l'alpha per-pixel (a differenza di set_alpha resta dentro la surface)"""
+        if surf.get_flags() & pygame.SRCALPHA:
+            surf = surf.copy()
+        else:
+            rgba = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
+            rgba.blit(surf, (0, 0))
+            surf = rgba
+        surf.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        return surf
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color,
+               background=None, alpha: int = 255) -> pygame.Surface:
+        """Come font.render, ma dalla cache"""
+        key = (font, text, antialias, tuple(color), background and tuple(background), alpha)
+        surf = self._lookup(key)
+        if surf is not None:
+            return surf
+        surf = font.render(text, antialias, color, background)
+        if alpha < 255:
+            surf = self._fade(surf, alpha)
+        return self._store(key, surf)
+
+    def outlined(self, font: pygame.font.Font, text: str, color, outline_color=(0, 0, 0),
+                 radius: int = 2, antialias: bool = True) -> pygame.Surface:
+        """Testo con contorno in 8 direzioni, pre-composto in un'unica surface (centrata come il testo)"""
+        key = (font, text, antialias, tuple(color), 'outline', tuple(outline_color), radius)
+        surf = self._lookup(key)
+        if surf is not None:
+            return surf
+        inner = font.render(text, antialias, color)
+        edge = font.render(text, antialias, outline_color)
+        d = round(radius * 0.75)
+        surf = pygame.Surface((inner.get_width() + radius * 2, inner.get_height() + radius * 2), pygame.SRCALPHA)
+        for ox, oy in ((0, radius), (radius, 0), (0, -radius), (-radius, 0), (d, d), (-d, d), (d, -d), (-d, -d)):
+            surf.blit(edge, (radius + ox, radius + oy))
+        surf.blit(inner, (radius, radius))
+        return self._store(key, surf)
+
+    def shadowed(self, font: pygame.font.Font, text: str, color, shadow_color=(0, 0, 0),
+                 offset: Tuple[int, int] = (2, 2), shadow_alpha: int = 255,
+                 antialias: bool = True) -> pygame.Surface:
+        """Testo + ombra spostata di offset (>= 0): il testo sta nell'angolo in alto a sinistra"""
+        key = (font, text, antialias, tuple(color), 'shadow', tuple(shadow_color), offset, shadow_alpha)
+        surf = self._lookup(key)
+        if surf is not None:
+            return surf
+        inner = font.render(text, antialias, color)
+        shadow = font.render(text, antialias, shadow_color)
+        if shadow_alpha < 255:
+            shadow = self._fade(shadow, shadow_alpha)
+        surf = pygame.Surface((inner.get_width() + offset[0], inner.get_height() + offset[1]), pygame.SRCALPHA)
+        surf.blit(shadow, offset)
+        surf.blit(inner, (0, 0))
+        return self._store(key, surf)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.bytes = 0
+
+    def memory_bytes(self) -> int:
+        return self.bytes
+
+
+TEXT = TextCache()
+
+
+# ============== GRADIENT RENDERER ==============
+class GradientRenderer:
+    """Sfondi a gradiente verticale condivisi: colonna NumPy + LRU di surface full-screen pre-scalate.
+
+    column_fn(t, y, phase) riceve t = y/h (array float), y in pixel e la fase quantizzata,
+    e ritorna (r, g, b) come array o scalari. La fase viene arrotondata a multipli di
+    `quantum`, quindi la surface si ricostruisce solo quando il colore cambia davvero.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._rows: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get_rows(self, h: int) -> Tuple[np.ndarray, np.ndarray]:
+        if h not in self._rows:
+            y = np.arange(h, dtype=np.float64)
+            self._rows[h] = (y / h, y)
+        return self._rows[h]
+
+    def _build(self, size: Tuple[int, int], column_fn, phase: float) -> pygame.Surface:
+        w, h = size
+        t, y = self._get_rows(h)
+        r, g, b = column_fn(t, y, phase)
+
+        column = np.empty((1, h, 3), dtype=np.uint8)
+        for i, channel in enumerate((r, g, b)):
+            column[0, :, i] = np.clip(np.broadcast_to(channel, (h,)), 0, 255)
+
+        full = pygame.transform.scale(pygame.surfarray.make_surface(column), (w, h))
+        if pygame.display.get_surface() is not None:
+            full = full.convert()
+        return full
+
+    def get(self, size: Tuple[int, int], name: str, column_fn, phase: float = 0.0,
+            quantum: float = 0.0, palette=None) -> pygame.Surface:
+        """Surface del gradiente (dalla cache se la chiave non è cambiata)"""
+        step = int(round(phase / quantum)) if quantum > 0 else 0
+        key = (name, palette, size, step)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        full = self._build(size, column_fn, step * quantum)
+        self._cache[key] = full
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return full
+
+    @profiled
+    def draw(self, surface: pygame.Surface, name: str, column_fn, phase: float = 0.0,
+             quantum: float = 0.0, palette=None):
+        """Un solo blit al posto di una draw.line per riga"""
+        surface.blit(self.get(surface.get_size(), name, column_fn, phase, quantum, palette), (0, 0))
+
+    def clear(self):
+        self._cache.clear()
+
+    def memory_bytes(self) -> int:
+        return sum(s.get_bytesize() * s.get_width() * s.get_height() for s in self._cache.values())
+
+
+GRADIENTS = GradientRenderer()
 
 
+def score_screen_gradient(t, y, phase):
+    """Gradiente ondulato comune a NameEntry e HighScore"""
+    wave = np.sin(phase + t * 4) * 10
+    return 15 + wave + t * 5, 15 + wave + t * 8, 35 + wave + t * 15
 
 
 
+# ============== LAYER CACHE ==============
+class LayerCache:
+    """Layer statici o che cambiano di rado (terreno, griglie, arene, intestazioni) composti con un blit.
+
+    draw(surface, name, key, build, rect): finche' `key` resta uguale il layer si ricompone dalla
+    cache; se cambia, build(canvas) ridisegna in coordinate schermo su un canvas condiviso e si
+    conserva solo `rect`. Con debug attivo (F6) i frame in cui un layer viene ricostruito sono
+    tinti di magenta.
+    """
+
+    TINT = (110, 0, 110)
+
+    def __init__(self):
+        self._layers: Dict[str, Tuple[object, pygame.Rect, pygame.Surface]] = {}
+        self._canvas: Dict[Tuple[Tuple[int, int], bool], pygame.Surface] = {}
+        self.debug = False
+        self.hits = 0
+        self.misses = 0
+
+    def _get_canvas(self, size: Tuple[int, int], alpha: bool) -> pygame.Surface:
+        canvas = self._canvas.get((size, alpha))
+        if canvas is None:
+            canvas = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+            if pygame.display.get_surface() is not None:
+                canvas = canvas.convert_alpha() if alpha else canvas.convert()
+            self._canvas[(size, alpha)] = canvas
+        return canvas
+
+    def _build(self, size: Tuple[int, int], rect: pygame.Rect, build, alpha: bool) -> pygame.Surface:
+        canvas = self._get_canvas(size, alpha)
+        canvas.fill((0, 0, 0, 0) if alpha else (0, 0, 0), rect)
+        canvas.set_clip(rect)
+        try:
+            build(canvas)
+        finally:
+            canvas.set_clip(None)
+        layer = canvas.subsurface(rect).copy()
+        if alpha:
+            # RLE: le zone trasparenti (quasi tutto il layer) non costano nulla al blit
+            layer.set_alpha(255, pygame.RLEACCEL)
+        return layer
+
+    def draw(self, surface: pygame.Surface, name: str, key, build, rect=None,
+             alpha: bool = True) -> pygame.Rect:
+        """Compone il layer `name` (ricostruito solo se la chiave e' cambiata); ritorna il rect"""
+        rect = surface.get_rect().clip(pygame.Rect(rect)) if rect is not None else surface.get_rect()
+        entry = self._layers.get(name)
+        if entry is not None and entry[0] == key and entry[1] == rect:
+            self.hits += 1
+            surface.blit(entry[2], rect)
+            return rect
+
+        self.misses += 1
+        layer = self._build(surface.get_size(), rect, build, alpha)
+        self._layers[name] = (key, rect, layer)
+        surface.blit(layer, rect)
+        if self.debug:
+            surface.fill(self.TINT, rect, special_flags=pygame.BLEND_RGB_ADD)
+        return rect
+
+    def invalidate(self, prefix: str = ""):
+        """Scarta i layer il cui nome inizia con `prefix` (tutti se vuoto)"""
+        for name in [n for n in self._layers if n.startswith(prefix)]:
+            del self._layers[name]
+
+    def toggle_debug(self):
+        self.debug = not self.debug
+        print(f"[LayerCache] Debug tint {'ON' if self.debug else 'OFF'}")
+
+    def memory_bytes(self) -> int:
+        surfaces = [entry[2] for entry in self._layers.values()] + list(self._canvas.values())
+        return sum(s.get_bytesize() * s.get_width() * s.get_height() for s in surfaces)
+
+
+LAYERS = LayerCache()
+
+
+# ============== PARTICLE SYSTEM ==============
+class ParticleSystem:
+    """Particelle structure-of-arrays su array NumPy preallocati.
+
+    Integrazione, gravità e cull vettoriali, compattazione swap-remove,
+    capacità fissa con eviction dei più vecchi e draw batched con surface.blits().
+    """
+
+    # Stili di disegno
+    STYLE_FADE = 0     # cerchio pieno, alpha = vita residua
+    STYLE_SHRINK = 1   # cerchio opaco che si rimpicciolisce (colore opzionalmente sfumato)
+    STYLE_GLOW = 2     # alone semitrasparente 2x + nucleo, entrambi si rimpiccioliscono
+
+    ALPHA_LEVELS = 32
+    _sprite_cache: Dict[tuple, pygame.Surface] = {}
+    _SPRITE_CACHE_MAX = 4096
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.count = 0
+        self._serial = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.drag = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.fade = np.zeros(capacity, dtype=bool)
+        self.birth = np.zeros(capacity, dtype=np.int64)
+        self._arrays = (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.size,
+                        self.gravity, self.drag, self.color, self.fade, self.birth)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def bounds(self) -> Optional[pygame.Rect]:
+        """Rettangolo che contiene tutte le particelle (alone di STYLE_GLOW compreso), None se vuoto"""
+        n = self.count
+        if n == 0:
+            return None
+        pad = float(self.size[:n].max()) * 2 + 2
+        x0, y0 = float(self.x[:n].min()) - pad, float(self.y[:n].min()) - pad
+        x1, y1 = float(self.x[:n].max()) + pad, float(self.y[:n].max()) + pad
+        return pygame.Rect(int(x0), int(y0), int(x1 - x0) + 2, int(y1 - y0) + 2)
+
+    @staticmethod
+    def _fit(value, count: int):
+        """Array per-particella tagliato a count (_reserve può ridurre il burst alla capacità);
+        scalari e colori singoli passano invariati, l'assegnazione fa il broadcast"""
+        return value[:count] if isinstance(value, np.ndarray) else value
+
+    @classmethod
+    def _sample(cls, value, count: int) -> np.ndarray:
+        """Scalare, range (min, max) uniforme o array già pronto"""
+        if isinstance(value, tuple):
+            return np.random.uniform(value[0], value[1], count)
+        return cls._fit(value, count)
+
+    def _reserve(self, count: int) -> np.ndarray:
+        """Indici liberi per count particelle: se piena sfratta le più vecchie"""
+        count = min(count, self.capacity)
+        free = self.capacity - self.count
+        if count > free:
+            evict = count - free
+            oldest = np.argpartition(self.birth[:self.count], evict - 1)[:evict]
+            self.life[oldest] = 0.0
+            self._compact()
+        start = self.count
+        self.count += count
+        return np.arange(start, start + count)
+
+    def emit(self, x: float, y: float, count: int, color: Tuple[int, int, int],
+             speed=(80, 200), life=(0.3, 0.7), max_life: Optional[float] = None,
+             size=(2, 5), gravity=0.0, drag: float = 1.0, angle=(0.0, math.pi * 2),
+             vx=None, vy=None, fade=False):
+        """Burst radiale (o con velocità esplicite vx/vy)"""
+        if count <= 0:
+            return
+        idx = self._reserve(count)
+        count = len(idx)
+
+        if vx is None:
+            a = self._sample(angle, count)
+            v = self._sample(speed, count)
+            self.vx[idx] = np.cos(a) * v
+            self.vy[idx] = np.sin(a) * v
+        else:
+            self.vx[idx] = self._sample(vx, count)
+            self.vy[idx] = self._sample(vy, count)
+
+        lives = self._sample(life, count)
+        self.x[idx] = self._fit(x, count)
+        self.y[idx] = self._fit(y, count)
+        self.life[idx] = lives
+        self.max_life[idx] = lives if max_life is None else self._fit(max_life, count)
+        self.size[idx] = self._sample(size, count)
+        self.gravity[idx] = self._sample(gravity, count)
+        self.drag[idx] = self._fit(drag, count)
+        self.color[idx] = self._fit(color, count)
+        self.fade[idx] = self._fit(fade, count)
+        self.birth[idx] = np.arange(self._serial, self._serial + count)
+        self._serial += count
+
+    def _compact(self):
+        """Swap-remove vettoriale: le vive in coda riempiono i buchi in testa"""
+        n = self.count
+        alive = self.life[:n] > 0.0
+        m = int(np.count_nonzero(alive))
+        if m == n:
+            return
+        holes = np.flatnonzero(~alive[:m])
+        movers = m + np.flatnonzero(alive[m:n])
+        if len(holes):
+            for arr in self._arrays:
+                arr[holes] = arr[movers]
+        self.count = m
+
+    def update(self, dt: float):
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.vy[:n] += self.gravity[:n] * dt
+        self.vx[:n] *= self.drag[:n]
+        self.life[:n] -= dt
+        self._compact()
+
+    @classmethod
+    def _sprite(cls, key: tuple) -> pygame.Surface:
+        sprite = cls._sprite_cache.get(key)
+        if sprite is None:
+            if len(cls._sprite_cache) >= cls._SPRITE_CACHE_MAX:
+                cls._sprite_cache.clear()
+            r, g, b, alpha, radius = key
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (r, g, b, alpha), (radius, radius), radius)
+            cls._sprite_cache[key] = sprite
+        return sprite
+
+    @profiled
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0), style: int = STYLE_FADE):
+        """Una sola chiamata blits() per tutte le particelle vive"""
+        n = self.count
+        if n == 0:
+            return
+        ratio = np.clip(self.life[:n] / self.max_life[:n], 0.0, 1.0)
+        step = 255 // self.ALPHA_LEVELS
+        colors = self.color[:n]
+
+        if style == self.STYLE_FADE:
+            radius = self.size[:n].astype(np.int32)
+            alpha = (ratio * 255).astype(np.int32) // step * step
+            layers = [(colors, alpha, radius)]
+        elif style == self.STYLE_SHRINK:
+            radius = (self.size[:n] * ratio).astype(np.int32)
+            shade = np.where(self.fade[:n], (ratio * self.ALPHA_LEVELS).astype(np.int32) / self.ALPHA_LEVELS, 1.0)
+            shaded = (colors * shade[:, None]).astype(np.int32)
+            opaque = np.full(n, 255, dtype=np.int32)
+            # Alone scuro sotto al nucleo per le particelle grandi
+            halo_radius = np.where(radius > 2, radius + 2, 0)
+            halo = (colors * (ratio * 0.5)[:, None]).astype(np.int32) // 8 * 8
+            layers = [(halo, opaque, halo_radius), (shaded, opaque, radius)]
+        else:
+            size = self.size[:n] * ratio
+            visible = size > 0.5
+            core_radius = np.where(visible, np.maximum(1, size.astype(np.int32)), 0)
+            glow_radius = np.where(visible, (size * 2).astype(np.int32), 0)
+            glow_alpha = (ratio * 100).astype(np.int32) // step * step
+            opaque = np.full(n, 255, dtype=np.int32)
+            layers = [(colors, glow_alpha, glow_radius), (colors, opaque, core_radius)]
+
+        ox, oy = offset
+        xs = (self.x[:n] + ox).astype(np.int32)
+        ys = (self.y[:n] + oy).astype(np.int32)
+        batch = []
+        for layer_colors, layer_alpha, layer_radius in layers:
+            keep = np.flatnonzero((layer_radius > 0) & (layer_alpha > 0))
+            if len(keep) == 0:
+                continue
+            rgb = layer_colors[keep].tolist()
+            for (r, g, b), a, rad, px, py in zip(rgb, layer_alpha[keep].tolist(), layer_radius[keep].tolist(),
+                                                 xs[keep].tolist(), ys[keep].tolist()):
+                batch.append((self._sprite((r, g, b, a, rad)), (px - rad, py - rad)))
+        surface.blits(batch, False)
+
+
+# ============== SPATIAL HASH ==============
+class SpatialHash:
+    """Broadphase a griglia uniforme per oggetti puntiformi (dict con 'x'/'y').
+
+    Gli oggetti non devono muoversi tra insert() e remove(): la griglia si ricostruisce a ogni frame.
+    """
+
+    def __init__(self, cell_size: float = 64):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], list] = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, item: dict):
+        self.cells.setdefault(self._cell(item['x'], item['y']), []).append(item)
+
+    def rebuild(self, items: list):
+        self.cells.clear()
+        for item in items:
+            self.insert(item)
+
+    def remove(self, item: dict):
+        bucket = self.cells.get(self._cell(item['x'], item['y']))
+        if bucket:
+            for i, other in enumerate(bucket):
+                if other is item:
+                    del bucket[i]
+                    return
+
+    def query(self, x: float, y: float, radius: float) -> list:
+        """Candidati nelle celle toccate dal quadrato (x, y) ± radius (da filtrare con la distanza).
+
+        Con una sola cella ritorna il bucket stesso: modificarlo solo subito prima di un break.
+        """
+        cs = self.cell_size
+        x0, x1 = int((x - radius) // cs), int((x + radius) // cs)
+        y0, y1 = int((y - radius) // cs), int((y + radius) // cs)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), [])
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+
+# ============== BRICK GRID ==============
+class BrickGrid:
+    """Indice a celle per i mattoni (dict con 'x'/'y'/'w'/'h') disposti su una griglia regolare.
+
+    Ogni mattone vivo sta in tutte le celle che il suo rettangolo tocca; quelli distrutti
+    escono dall'indice e `alive` tiene il conteggio, cosi' il livello completato e' O(1).
+    """
+
+    def __init__(self, origin_x: float, origin_y: float, pitch_x: float, pitch_y: float):
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.pitch_x = pitch_x
+        self.pitch_y = pitch_y
+        self.cells: Dict[Tuple[int, int], list] = {}
+        self.alive = 0
+
+    def _span(self, brick: dict):
+        c0 = int((brick['x'] - self.origin_x) // self.pitch_x)
+        c1 = int((brick['x'] + brick['w'] - self.origin_x) // self.pitch_x)
+        r0 = int((brick['y'] - self.origin_y) // self.pitch_y)
+        r1 = int((brick['y'] + brick['h'] - self.origin_y) // self.pitch_y)
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                yield col, row
+
+    def rebuild(self, bricks: list):
+        self.cells.clear()
+        self.alive = 0
+        for brick in bricks:
+            if brick['alive']:
+                for cell in self._span(brick):
+                    self.cells.setdefault(cell, []).append(brick)
+                self.alive += 1
+
+    def kill(self, brick: dict):
+        """Segna il mattone come distrutto e lo toglie dalle sue celle."""
+        if not brick['alive']:
+            return
+        brick['alive'] = False
+        self.alive -= 1
+        for cell in self._span(brick):
+            bucket = self.cells.get(cell)
+            if bucket:
+                for i, other in enumerate(bucket):
+                    if other is brick:
+                        del bucket[i]
+                        break
+
+    def near(self, left: float, top: float, right: float, bottom: float) -> list:
+        """Mattoni vivi (senza doppioni) nelle celle toccate dal rettangolo dato."""
+        c0 = int((left - self.origin_x) // self.pitch_x)
+        c1 = int((right - self.origin_x) // self.pitch_x)
+        r0 = int((top - self.origin_y) // self.pitch_y)
+        r1 = int((bottom - self.origin_y) // self.pitch_y)
+        cells = self.cells
+        if c0 == c1 and r0 == r1:
+            return cells.get((c0, r0), [])
+        found, seen = [], set()
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                for brick in cells.get((col, row), ()):
+                    if id(brick) not in seen:
+                        seen.add(id(brick))
+                        found.append(brick)
+        return found
+
+    def at(self, x: float, y: float):
+        """Primo mattone vivo che contiene il punto (x, y), altrimenti None."""
+        bucket = self.cells.get((int((x - self.origin_x) // self.pitch_x),
+                                 int((y - self.origin_y) // self.pitch_y)))
+        if bucket:
+            for brick in bucket:
+                if (brick['x'] <= x <= brick['x'] + brick['w'] and
+                        brick['y'] <= y <= brick['y'] + brick['h']):
+                    return brick
+        return None
+
+
+# ============== SWEPT COLLISION ==============
+SWEEP_MAX_STEP = 24.0   # px massimi per sotto-passo di una pallina
+SWEEP_MAX_CONTACTS = 4  # rimbalzi risolti al massimo in un sotto-passo
+SWEEP_EPSILON = 1e-6
+
+
+def sweep_aabb(x: float, y: float, dx: float, dy: float,
+               left: float, top: float, right: float, bottom: float, hit_inside: bool = False):
+    """Segmento (x, y) -> (x + dx, y + dy) contro un rettangolo (metodo degli slab).
+
+    Ritorna (t, nx, ny) con t in [0, 1] il tempo d'impatto e (nx, ny) la normale della faccia
+    colpita, oppure None. Un punto che parte sul bordo e si allontana non conta come contatto.
+    Nemmeno uno che parte gia' dentro: rimbalzerebbe a t=0 a ogni iterazione. Con hit_inside
+    conta (t=0), per i paddle che possono spostarsi sopra la pallina.
+    """
+    if dx == 0 and dy == 0:
+        return None
+    if dx == 0:
+        if x < left or x > right:
+            return None
+        tx1, tx2 = -math.inf, math.inf
+    else:
+        tx1, tx2 = (left - x) / dx, (right - x) / dx
+        if tx1 > tx2:
+            tx1, tx2 = tx2, tx1
+    if dy == 0:
+        if y < top or y > bottom:
+            return None
+        ty1, ty2 = -math.inf, math.inf
+    else:
+        ty1, ty2 = (top - y) / dy, (bottom - y) / dy
+        if ty1 > ty2:
+            ty1, ty2 = ty2, ty1
+    t_near = max(tx1, ty1)
+    t_far = min(tx2, ty2)
+    if t_near > t_far or t_far <= SWEEP_EPSILON or t_near > 1.0:
+        return None
+    if t_near < -SWEEP_EPSILON and not hit_inside:
+        return None
+    if tx1 >= ty1:
+        return max(t_near, 0.0), (-1 if dx > 0 else 1), 0
+    return max(t_near, 0.0), 0, (-1 if dy > 0 else 1)
 
 
+def sweep_steps(dx: float, dy: float, max_step: float = SWEEP_MAX_STEP) -> int:
+    """Numero di sotto-passi perche' nessuno superi max_step pixel."""
+    return max(1, math.ceil(math.hypot(dx, dy) / max_step))
+
 
 # ============== ANIMATED BACKGROUND ==============
 class AnimatedBackground:
@@ -364,13 +1754,14 @@ class AnimatedBackground:
                 line['x'] = 1280 + random.randint(0, 100)
                 line['y'] = random.randint(0, 720)
     
+    @staticmethod
+    def _gradient(t, y, phase):
+        return (5 + np.sin(phase * 0.5 + t) * 3,
+                8 + np.sin(phase * 0.3 + t * 1.5) * 3,
+                25 + np.sin(phase * 0.4 + t * 2) * 5)
+
     def draw(self, surface: pygame.Surface):
-        for y in range(720):
-            factor = y / 720
-            r = int(5 + math.sin(self.time * 0.5 + factor) * 3)
-            g = int(8 + math.sin(self.time * 0.3 + factor * 1.5) * 3)
-            b = int(25 + math.sin(self.time * 0.4 + factor * 2) * 5)
-            pygame.draw.line(surface, (r, g, b), (0, y), (1280, y))
+        GRADIENTS.draw(surface, "menu_background", self._gradient, self.time, quantum=0.1)
         
         for star in self.stars:
             brightness = int(star['brightness'] * 255)
@@ -409,14 +1800,10 @@ class CarouselItem:
         temp_surface.blit(self.image, img_rect)
         
         text_y = 390
-        for offset in [(0, 4), (4, 0), (0, -4), (-4, 0), (3, 3), (-3, 3), (3, -3), (-3, -3)]:
-            outline = self.font_title.render(self.name, True, (0, 0, 0))
-            temp_surface.blit(outline, outline.get_rect(center=(450 + offset[0], text_y + offset[1])))
-        
-        title = self.font_title.render(self.name, True, (255, 230, 0))
+        title = TEXT.outlined(self.font_title, self.name, (255, 230, 0), (0, 0, 0), 4)
         temp_surface.blit(title, title.get_rect(center=(450, text_y)))
         
-        desc = self.font_desc.render(self.description, True, (230, 240, 255))
+        desc = TEXT.render(self.font_desc, self.description, True, (230, 240, 255))
         temp_surface.blit(desc, desc.get_rect(center=(450, text_y + 60)))
         
         if alpha < 1.0:
@@ -473,7 +1860,7 @@ class MenuCarousel:
             pygame.draw.polygon(surface, color, points)
         
         font_huge = pygame.font.Font(None, 150)
-        question = font_huge.render("?", True, (255, 255, 255))
+        question = TEXT.render(font_huge, "?", True, (255, 255, 255))
         surface.blit(question, question.get_rect(center=(center_x, center_y)))
         return surface
     
@@ -519,12 +1906,31 @@ class MenuCarousel:
 class Config:
     CONFIG_FILE = "arcade_config.json"
     VALID_RESOLUTIONS = [(1280, 720), (1920, 1080)]
+    DISPLAY_BACKENDS = ("software", "renderer")
     
-    def __init__(self):
+    def __init__(self, persistent: bool = True):
+        # persistent=False: solo i default, CONFIG_FILE non viene ne' letto ne' scritto (benchmark)
+        self.persistent = persistent
         self.spinner_sensitivity = 50
         self.resolution = (1280, 720)
         self.fullscreen = False
-        self.load()
+        # Game loop: simulazione a passo fisso, rendering limitato a fps_cap (0 = nessun limite se il
+        # vsync e' davvero attivo, altrimenti 60)
+        self.sim_rate = 60
+        self.max_catchup_steps = 5
+        self.fps_cap = 60
+        self.vsync = True
+        self.dirty_rects = False  # opt-in: aggiorna solo le zone cambiate dello schermo
+        self.threaded_present = False  # opt-in: scaling e flip in un thread separato
+        self.adaptive_resolution = True  # risoluzione dinamica guidata dal tempo di frame
+        self.display_backend = "software"  # "renderer" = scaling/letterbox con pygame._sdl2.video
+        self.replay_seconds = 0  # instant replay (F10): secondi tenuti in memoria, 0 = spento
+        self.capture_max_mb = 256  # tetto di memoria del ring buffer del replay
+        self.sound_workers = 0  # processi per il warm-up dei suoni se il bank va rigenerato, 0 = in-process
+        self.stream_block = 1024  # campioni per blocco dell'audio procedurale, al rate del mixer (latenza ~2 blocchi)
+        self.music_cache_mb = 64  # budget RAM delle tracce pre-lette/decodificate, 0 = solo corrente e successiva, compresse
+        if persistent:
+            self.load()
     
     def load(self):
         try:
@@ -534,15 +1940,44 @@ class Config:
                 res = tuple(data.get('resolution', [1280, 720]))
                 self.resolution = res if res in self.VALID_RESOLUTIONS else (1280, 720)
                 self.fullscreen = bool(data.get('fullscreen', False))
+                self.sim_rate = max(30, min(240, int(data.get('sim_rate', 60))))
+                self.max_catchup_steps = max(1, min(10, int(data.get('max_catchup_steps', 5))))
+                self.fps_cap = max(0, min(500, int(data.get('fps_cap', 60))))
+                self.vsync = bool(data.get('vsync', True))
+                self.dirty_rects = bool(data.get('dirty_rects', False))
+                self.threaded_present = bool(data.get('threaded_present', False))
+                self.adaptive_resolution = bool(data.get('adaptive_resolution', True))
+                backend = data.get('display_backend', 'software')
+                self.display_backend = backend if backend in self.DISPLAY_BACKENDS else 'software'
+                self.replay_seconds = max(0, min(60, int(data.get('replay_seconds', 0))))
+                self.capture_max_mb = max(16, min(2048, int(data.get('capture_max_mb', 256))))
+                self.sound_workers = max(0, min(16, int(data.get('sound_workers', 0))))
+                self.stream_block = max(256, min(4096, int(data.get('stream_block', 1024))))
+                self.music_cache_mb = max(0, min(1024, int(data.get('music_cache_mb', 64))))
         except (FileNotFoundError, json.JSONDecodeError):
             self.save()
     
     def save(self):
+        if not self.persistent:
+            return
         with open(self.CONFIG_FILE, 'w') as f:
             json.dump({
                 'spinner_sensitivity': self.spinner_sensitivity,
                 'resolution': list(self.resolution),
-                'fullscreen': self.fullscreen
+                'fullscreen': self.fullscreen,
+                'sim_rate': self.sim_rate,
+                'max_catchup_steps': self.max_catchup_steps,
+                'fps_cap': self.fps_cap,
+                'vsync': self.vsync,
+                'dirty_rects': self.dirty_rects,
+                'threaded_present': self.threaded_present,
+                'adaptive_resolution': self.adaptive_resolution,
+                'display_backend': self.display_backend,
+                'replay_seconds': self.replay_seconds,
+                'capture_max_mb': self.capture_max_mb,
+                'sound_workers': self.sound_workers,
+                'stream_block': self.stream_block,
+                'music_cache_mb': self.music_cache_mb
             }, f, indent=2)
 
 
@@ -596,13 +2031,446 @@ class HighScoreManager:
         scores = self.load_scores(game_name)
         return scores[0]['score'] if scores else 0
 
+# ============== FRAME PRESENTER ==============
+class FramePresenter:
+    """Thread di presentazione a doppio buffer.
+
+    submit() copia il frame virtuale finito in uno dei due buffer di consegna e lo accoda
+    (coda da 1); il thread lo scala e fa il flip mentre il main thread simula il frame dopo.
+    Le trasformazioni di pygame rilasciano il GIL, quindi le due cose si sovrappongono davvero.
+    """
+
+    def __init__(self, display: "DisplayManager"):
+        self.display = display
+        size = display.virtual_surface.get_size()
+        self._free: queue.Queue = queue.Queue()
+        for _ in range(2):
+            self._free.put(pygame.Surface(size))
+        self._pending: queue.Queue = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, name="FramePresenter", daemon=True)
+        self._thread.start()
+
+    def submit(self, surface: pygame.Surface, fps: float, dt: float,
+               dirty: Optional[List[pygame.Rect]], token=None):
+        """Consegna un frame; blocca solo se il presenter ha ancora un frame in coda"""
+        buffer = self._free.get()
+        buffer.blit(surface, (0, 0))
+        self._pending.put((buffer, fps, dt, list(dirty) if dirty is not None else None, token))
+
+    def wait_idle(self):
+        """Aspetta che i frame consegnati siano a schermo (prima di toccare il display)"""
+        self._pending.join()
+
+    def stop(self, timeout: float = 1.0):
+        if self._thread.is_alive():
+            self._pending.put(None)
+            self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._pending.get()
+            try:
+                if item is None:
+                    return
+                buffer, fps, dt, dirty, token = item
+                self.display.present_surface = buffer
+                try:
+                    self.display.render(fps, dt, dirty, token)
+                except Exception as e:
+                    print(f"[FramePresenter] Present error: {e}")
+                self._free.put(buffer)
+            finally:
+                self._pending.task_done()
+
+
+# ============== LATENCY ==============
+class LatencyTracker:
+    """Latenza spinner -> schermo e regolarita' dei frame.
+
+    Ogni lettura dello spinner apre un campione (se ce n'e' gia' uno non consumato resta
+    quello, il piu' vecchio); il primo passo di update che consuma il delta lo chiude in un
+    token (input, update) che viaggia col frame fino al flip, anche sul presenter thread.
+    Dopo il flip presented() registra input->update, input->present, l'intervallo dal flip
+    precedente e i vsync saltati rispetto a frame_period.
+    """
+
+    def __init__(self, history: int = 600):
+        self.samples: deque = deque(maxlen=history)    # (input->update, input->present) in s
+        self.intervals: deque = deque(maxlen=history)  # tempo tra due flip in s
+        self.frame_period = 1.0 / 60.0
+        self.missed_vsync = 0
+        self.presented_frames = 0
+        self.log_on_exit = False
+        self._input_time: Optional[float] = None
+        self._last_present: Optional[float] = None
+
+    def reset(self):
+        self.samples.clear()
+        self.intervals.clear()
+        self.missed_vsync = 0
+        self.presented_frames = 0
+        self._input_time = None
+        self._last_present = None
+
+    def input_sampled(self, t: float):
+        """Lettura di SpinnerInput.update/get_rotation_delta"""
+        if self._input_time is None:
+            self._input_time = t
+
+    def consumed(self, t: float) -> Optional[Tuple[float, float]]:
+        """Update che ha consumato il delta: ritorna il token da passare al present"""
+        if self._input_time is None:
+            return None
+        token = (self._input_time, t)
+        self._input_time = None
+        return token
+
+    def presented(self, token: Optional[Tuple[float, float]]):
+        """Chiamato subito dopo flip / renderer.present (da qualunque thread)"""
+        t = perf_counter()
+        if self._last_present is not None:
+            interval = t - self._last_present
+            self.intervals.append(interval)
+            self.missed_vsync += max(0, int(interval / self.frame_period + 0.5) - 1)
+        self._last_present = t
+        self.presented_frames += 1
+        if token is not None:
+            self.samples.append((token[1] - token[0], t - token[0]))
+
+    @staticmethod
+    def _distribution(values) -> Dict[str, float]:
+        arr = np.asarray(values, dtype=np.float64) * 1000.0
+        p50, p95, p99 = np.percentile(arr, (50, 95, 99))
+        return {"p50": round(float(p50), 3), "p95": round(float(p95), 3),
+                "p99": round(float(p99), 3), "max": round(float(arr.max()), 3)}
+
+    def summary(self) -> Dict:
+        """Distribuzioni in ms sugli ultimi `history` frame"""
+        samples = list(self.samples)
+        intervals = list(self.intervals)
+        report = {
+            "frames": self.presented_frames,
+            "frame_period_ms": round(self.frame_period * 1000.0, 3),
+            "missed_vsync": self.missed_vsync,
+        }
+        if samples:
+            report["input_to_update_ms"] = self._distribution([s[0] for s in samples])
+            report["input_to_present_ms"] = self._distribution([s[1] for s in samples])
+        if len(intervals) > 1:
+            arr = np.asarray(intervals, dtype=np.float64) * 1000.0
+            report["frame_time_ms"] = {"mean": round(float(arr.mean()), 3),
+                                       "jitter": round(float(arr.std()), 3),
+                                       "max": round(float(arr.max()), 3)}
+        return report
+
+    def overlay_lines(self) -> List[str]:
+        report = self.summary()
+        lines = []
+        latency = report.get("input_to_present_ms")
+        if latency:
+            lines.append(f"Input->flip: {latency['p50']:.1f} / {latency['p95']:.1f} / {latency['p99']:.1f}ms")
+        frame = report.get("frame_time_ms")
+        if frame:
+            lines.append(f"Jitter: {frame['jitter']:.2f}ms  Missed vsync: {report['missed_vsync']}")
+        return lines
+
+    def dump(self, path: Optional[str] = None) -> Optional[str]:
+        """Scrive summary() e i campioni grezzi in JSON"""
+        if not self.samples and not self.intervals:
+            return None
+        if path is None:
+            path = f"latency_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        report = self.summary()
+        report["samples_ms"] = [[round(u * 1000.0, 3), round(p * 1000.0, 3)] for u, p in self.samples]
+        report["intervals_ms"] = [round(i * 1000.0, 3) for i in self.intervals]
+        try:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=1)
+        except OSError as e:
+            print(f"[Latency] Dump fallito: {e}")
+            return None
+        print(f"[Latency] {len(self.samples)} campioni salvati in {path}")
+        return path
+
+
+LATENCY = LatencyTracker()
+
+
+# ============== FRAME CAPTURE ==============
+class FrameRecorder:
+    """Screenshot e instant replay senza codifica sul main thread.
+
+    Il main thread fa solo copie di superfici: lo screenshot intero, e per il replay una
+    copia ridotta ogni 1/replay_fps secondi in un ring buffer con tetto in byte. PNG e file
+    raw li scrive un worker thread, che si avvia alla prima richiesta.
+    """
+
+    def __init__(self, directory: str = "screenshots", replay_seconds: float = 0.0,
+                 replay_fps: int = 30, replay_scale: float = 0.5, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.replay_seconds = replay_seconds  # 0 = replay spento, nessuna copia per frame
+        self.replay_fps = replay_fps
+        self.replay_scale = replay_scale
+        self.max_bytes = max_bytes
+        self._ring: deque = deque()
+        self._ring_bytes = 0
+        self._since_sample = 0.0
+        self._jobs: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _timestamp() -> str:
+        return datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+
+    def _submit(self, job: tuple):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="FrameRecorder", daemon=True)
+            self._worker.start()
+        self._jobs.put(job)
+
+    # ---------- MAIN THREAD ----------
+    def screenshot(self, surface: pygame.Surface, filename: Optional[str] = None) -> str:
+        """Copia il frame e ne accoda il salvataggio PNG; ritorna il percorso che verra' scritto"""
+        path = self.directory / (filename or f"screenshot_{self._timestamp()}.png")
+        self._submit(("png", surface.copy(), path))
+        return str(path)
+
+    def record(self, surface: pygame.Surface, dt: float):
+        """Chiamato ogni frame: campiona il replay a replay_fps, scartando i frame piu' vecchi"""
+        if self.replay_seconds <= 0:
+            return
+        self._since_sample += dt
+        if self._since_sample < 1.0 / self.replay_fps:
+            return
+        self._since_sample %= 1.0 / self.replay_fps
+        w, h = surface.get_size()
+        frame = pygame.transform.scale(surface, (int(w * self.replay_scale), int(h * self.replay_scale)))
+        self._ring.append(frame)
+        self._ring_bytes += frame.get_width() * frame.get_height() * frame.get_bytesize()
+        limit = int(self.replay_seconds * self.replay_fps)
+        while self._ring and (len(self._ring) > limit or self._ring_bytes > self.max_bytes):
+            old = self._ring.popleft()
+            self._ring_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+
+    def dump_replay(self, raw: bool = False) -> Optional[str]:
+        """Salva gli ultimi replay_seconds: PNG numerati, o un unico file RGB24 + meta.json"""
+        if not self._ring:
+            print("[Capture] Replay buffer vuoto (replay_seconds = 0?)")
+            return None
+        folder = self.directory / f"replay_{'raw_' if raw else ''}{self._timestamp()}"
+        self._submit(("raw" if raw else "sequence", list(self._ring), folder))
+        return str(folder)
+
+    def memory_bytes(self) -> int:
+        return self._ring_bytes
+
+    def stop(self, timeout: float = 10.0):
+        """Finisce di scrivere quanto gia' accodato (chiamato allo shutdown)"""
+        if self._worker is not None and self._worker.is_alive():
+            self._jobs.put(None)
+            self._worker.join(timeout)
+
+    # ---------- WORKER ----------
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            kind, payload, path = job
+            try:
+                if kind == "png":
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    pygame.image.save(payload, str(path))
+                elif kind == "sequence":
+                    path.mkdir(parents=True, exist_ok=True)
+                    for i, frame in enumerate(payload):
+                        pygame.image.save(frame, str(path / f"frame_{i:05d}.png"))
+                else:
+                    path.mkdir(parents=True, exist_ok=True)
+                    w, h = payload[0].get_size()
+                    with open(path / "frames.rgb", "wb") as f:
+                        for frame in payload:
+                            f.write(pygame.image.tobytes(frame, "RGB"))
+                    with open(path / "meta.json", "w") as f:
+                        json.dump({"width": w, "height": h, "fps": self.replay_fps,
+                                   "frames": len(payload), "format": "RGB24"}, f, indent=2)
+                print(f"[Capture] Saved {path}")
+            except Exception as e:
+                print(f"[Capture] Save failed ({path}): {e}")
+
+
+# ============== DYNAMIC RESOLUTION ==============
+class ResolutionController:
+    """Risoluzione dinamica: un PID sul tempo di lavoro del frame sceglie un gradino di LEVELS.
+
+    L'errore e' (tempo_frame - budget) / budget. L'uscita del PID deve restare oltre
+    down_threshold (o sotto -up_threshold) per hold_frames frame di fila prima di cambiare
+    gradino, e dopo ogni cambio c'e' un cooldown: niente ping-pong tra due livelli vicini.
+    """
+
+    LEVELS = (1.0, 0.85, 0.7)
+
+    def __init__(self, target_fps: int = 60, headroom: float = 0.9,
+                 kp: float = 0.6, ki: float = 0.05, kd: float = 0.2):
+        self.budget = headroom / target_fps
+        self.kp, self.ki, self.kd = kp, ki, kd
+        self.down_threshold = 0.15
+        self.up_threshold = 0.35
+        self.hold_frames = 20
+        self.cooldown_frames = 90
+        self.enabled = True
+        self.floor = self.LEVELS[-1]
+        self.level_index = 0
+        self.output = 0.0
+        self.changes = 0
+        self._integral = 0.0
+        self._prev_error = 0.0
+        self._streak = 0  # frame di fila oltre soglia: >0 troppo lenti, <0 con margine
+        self._cooldown = 0
+
+    @property
+    def scale(self) -> float:
+        return self.LEVELS[self.level_index]
+
+    def reset(self):
+        self._integral = 0.0
+        self._prev_error = 0.0
+        self._streak = 0
+
+    def set_floor(self, floor: float):
+        """Minimo consentito (per gioco); se il livello attuale e' sotto, risale subito"""
+        self.floor = floor
+        while self.level_index > 0 and self.scale < floor - 1e-6:
+            self.level_index -= 1
+        self.reset()
+
+    def update(self, frame_time: float) -> float:
+        """Un campione per frame (secondi di lavoro, senza l'attesa di vsync/cap)"""
+        if not self.enabled:
+            return self.scale
+        # Un singolo hitch non deve saturare l'integrale
+        error = max(-1.0, min(3.0, (frame_time - self.budget) / self.budget))
+        self._integral = max(-20.0, min(20.0, self._integral + error))
+        derivative = error - self._prev_error
+        self._prev_error = error
+        self.output = self.kp * error + self.ki * self._integral + self.kd * derivative
+
+        if self._cooldown:
+            self._cooldown -= 1
+            return self.scale
+        if self.output > self.down_threshold:
+            self._streak = max(1, self._streak + 1)
+        elif self.output < -self.up_threshold:
+            self._streak = min(-1, self._streak - 1)
+        else:
+            self._streak = 0
+
+        index = self.level_index
+        if self._streak >= self.hold_frames and index + 1 < len(self.LEVELS) \
+                and self.LEVELS[index + 1] >= self.floor - 1e-6:
+            index += 1
+        elif self._streak <= -self.hold_frames and index > 0:
+            index -= 1
+        if index != self.level_index:
+            self.level_index = index
+            self.changes += 1
+            self._cooldown = self.cooldown_frames
+            self.reset()
+        return self.scale
+
+
+# ============== CAMERA ==============
+class Camera:
+    """Effetti di camera (shake, zoom, flash) chiesti dai giochi e applicati una volta sola
+    dal DisplayManager in composizione: i giochi disegnano sempre in coordinate stabili.
+
+    Intensita' e offset sono in pixel virtuali (1280x720), i tempi in secondi.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.offset = (0, 0)
+        self._shake = 0.0
+        self._shake_time = 0.0
+        self._shake_duration = 0.0
+        self._shake_decay = False
+        self._zoom = 0.0
+        self._zoom_time = 0.0
+        self._zoom_duration = 0.0
+        self._flash_color = (255, 255, 255)
+        self._flash_alpha = 0
+        self._flash_time = 0.0
+        self._flash_duration = 0.0
+
+    # ---------- RICHIESTE DAI GIOCHI ----------
+    def shake(self, intensity: float, duration: float, decay: bool = False):
+        """Scuote di +-intensity px per duration secondi; decay = ampiezza che cala fino a zero.
+        Una richiesta piu' debole di quella in corso viene ignorata."""
+        if duration > 0 and intensity >= self.shake_amplitude():
+            self._shake = intensity
+            self._shake_time = self._shake_duration = duration
+            self._shake_decay = decay
+
+    def zoom(self, amount: float, duration: float):
+        """Zoom-in di `amount` (0.05 = +5%) che torna a 1x in duration secondi"""
+        if duration > 0:
+            self._zoom = amount
+            self._zoom_time = self._zoom_duration = duration
+
+    def flash(self, color: Tuple[int, int, int], alpha: int, duration: float):
+        """Velo di colore sull'area di gioco che sfuma da alpha a zero"""
+        if duration > 0 and alpha >= self.flash_alpha():
+            self._flash_color = color
+            self._flash_alpha = alpha
+            self._flash_time = self._flash_duration = duration
+
+    # ---------- STATO PER LA COMPOSIZIONE ----------
+    def update(self, dt: float):
+        """Avanza i timer e sceglie l'offset di shake del frame"""
+        self._shake_time = max(0.0, self._shake_time - dt)
+        self._zoom_time = max(0.0, self._zoom_time - dt)
+        self._flash_time = max(0.0, self._flash_time - dt)
+        amplitude = int(self.shake_amplitude())
+        if amplitude > 0:
+            self.offset = (random.randint(-amplitude, amplitude), random.randint(-amplitude, amplitude))
+        else:
+            self.offset = (0, 0)
+
+    @property
+    def active(self) -> bool:
+        return self._shake_time > 0 or self._zoom_time > 0 or self._flash_time > 0
+
+    def shake_amplitude(self) -> float:
+        if self._shake_time <= 0:
+            return 0.0
+        if self._shake_decay:
+            return self._shake * self._shake_time / self._shake_duration
+        return self._shake
+
+    def zoom_factor(self) -> float:
+        if self._zoom_time <= 0:
+            return 1.0
+        return 1.0 + self._zoom * self._zoom_time / self._zoom_duration
+
+    def flash_alpha(self) -> int:
+        if self._flash_time <= 0:
+            return 0
+        return int(self._flash_alpha * self._flash_time / self._flash_duration)
+
+    def flash_rgba(self) -> Optional[Tuple[int, int, int, int]]:
+        alpha = self.flash_alpha()
+        return (*self._flash_color, alpha) if alpha > 0 else None
+
+
+CAMERA = Camera()
+
+
 # ============== DISPLAY MANAGER ==============
 class DisplayManager:
-    # Risoluzioni virtuali supportate (ordine preferenza)
-    VIRTUAL_RESOLUTIONS = [
-        (1920, 1080),  # Full HD
-        (1280, 720),   # HD Ready
-    ]
+    # Spazio logico fisso: tutti i giochi e gli stati disegnano in coordinate 1280x720
+    LOGICAL_SIZE = (1280, 720)
     
     # Modalità scaling
     SCALE_NEAREST = 0
@@ -614,21 +2482,41 @@ class DisplayManager:
     PROFILE_BALANCED = 1
     PROFILE_PERFORMANCE = 2
     
+    # Cap del loop quando fps_cap e' 0 ma il vsync non e' applicato (pygame non espone il refresh)
+    DEFAULT_FRAME_CAP = 60
+    
     def __init__(self, config: Config):
         self.config = config
         
-        # Detect optimal virtual resolution PRIMA di inizializzare pygame.display
-        self.VIRTUAL_WIDTH, self.VIRTUAL_HEIGHT = self._detect_optimal_resolution()
-        print(f"[DisplayManager] Virtual resolution: {self.VIRTUAL_WIDTH}x{self.VIRTUAL_HEIGHT}")
+        # Superficie logica: un solo scaling verso l'uscita fisica, qualunque sia il monitor
+        self.VIRTUAL_WIDTH, self.VIRTUAL_HEIGHT = self.LOGICAL_SIZE
+        print(f"[DisplayManager] Logical resolution: {self.VIRTUAL_WIDTH}x{self.VIRTUAL_HEIGHT}")
         
         # Virtual surfaces
         self.virtual_surface = pygame.Surface((self.VIRTUAL_WIDTH, self.VIRTUAL_HEIGHT))
         self._back_buffer = pygame.Surface((self.VIRTUAL_WIDTH, self.VIRTUAL_HEIGHT))
         
+        # Superficie letta dalla presentazione: quella virtuale, o il buffer di consegna del presenter
+        self.present_surface = self.virtual_surface
+        self._presenter: Optional[FramePresenter] = None
+        
+        # Backend "renderer": finestra pygame._sdl2.video, il frame va in una texture streaming
+        # e lo scaling/letterbox/shake li fa il Renderer. self.screen diventa la tela RGBA degli overlay.
+        self.backend = config.display_backend
+        self._window = None
+        self._renderer = None
+        self._frame_texture = None
+        self._overlay_texture = None
+        
         # Screen
         self.screen = None
         self._screen_buffer = None
         
+        # Present diretto: scala nella subsurface del display, niente _screen_buffer intermedio
+        self.direct_present = True
+        self._screen_target = None
+        self._letterbox_bars: List[pygame.Rect] = []
+        
         # Letterbox calculations
         self.scale = 1.0
         self.scaled_w = self.VIRTUAL_WIDTH
@@ -650,7 +2538,11 @@ class DisplayManager:
         self._adaptive_quality = True
         
         # Vsync
-        self.vsync_enabled = True
+        self.vsync_enabled = config.vsync
+        
+        # Risoluzione dinamica (ResolutionController.scale): letta dai giochi e dallo scaling adattivo
+        self.resolution = ResolutionController()
+        self.resolution.enabled = config.adaptive_resolution
         self._target_fps = 60
         
         # FPS display
@@ -661,9 +2553,24 @@ class DisplayManager:
         self._last_fps_update = 0
         self._fps_update_interval = 0.1
         
-        # Screen shake
-        self._shake_intensity = 0.0
-        self._shake_duration = 0.0
+        # Camera (shake/zoom/flash) condivisa coi giochi, applicata in composizione
+        self.camera = CAMERA
+        self.latency = LATENCY  # input -> flip, chiuso in render()
+        
+        # Cattura: screenshot e instant replay, codificati su un worker thread
+        self.capture = FrameRecorder(replay_seconds=config.replay_seconds,
+                                     max_bytes=config.capture_max_mb * 1024 * 1024)
+        self._flash_surface = None
+        
+        # Dirty rects: griglia 16x9 di tile virtuali, confronto con l'ultimo frame presentato
+        self.dirty_rects_enabled = config.dirty_rects
+        self.dirty_tiles = (16, 9)
+        self.dirty_full_threshold = 0.5  # oltre questa frazione di tile cambiati si ridisegna tutto
+        self.dirty_backoff = 30  # frame interi (senza confronto) dopo una schermata quasi tutta cambiata
+        self._dirty_skip = 0
+        self._prev_frame = None
+        self._full_redraw = True
+        self.last_dirty_count = 0
         
         # Letterbox
         self.letterbox_color = (0, 0, 0)
@@ -674,33 +2581,6 @@ class DisplayManager:
         # Initialize display
         self.update_display()
     
-    def _detect_optimal_resolution(self) -> tuple:
-        """Detect optimal virtual resolution based on monitor"""
-        try:
-            # Initialize display info (non crea finestra)
-            pygame.display.init()
-            display_info = pygame.display.Info()
-            monitor_w = display_info.current_w
-            monitor_h = display_info.current_h
-            
-            print(f"[DisplayManager] Monitor: {monitor_w}x{monitor_h}")
-            
-            # Strategia: usa la risoluzione più alta che sta nel monitor
-            for virt_w, virt_h in self.VIRTUAL_RESOLUTIONS:
-                # Check if this resolution fits comfortably
-                if monitor_w >= virt_w and monitor_h >= virt_h:
-                    print(f"[DisplayManager] → Using {virt_w}x{virt_h}")
-                    return (virt_w, virt_h)
-            
-            # Se nessuna sta perfettamente, usa la più piccola
-            fallback = self.VIRTUAL_RESOLUTIONS[-1]
-            print(f"[DisplayManager] → Fallback to {fallback[0]}x{fallback[1]}")
-            return fallback
-        
-        except Exception as e:
-            print(f"[DisplayManager] Detection failed: {e}")
-            return (1280, 720)  # Safe fallback
-    
     def _get_monitor_info(self) -> dict:
         """Get monitor information"""
         try:
@@ -723,6 +2603,9 @@ class DisplayManager:
     
     def update_display(self):
         """Update display mode"""
+        if self._presenter is not None:
+            self._presenter.wait_idle()
+        self._destroy_renderer()
         if self.screen is not None:
             try:
                 pygame.display.quit()
@@ -731,15 +2614,19 @@ class DisplayManager:
         
         pygame.display.init()
         
-        flags = self._get_display_flags()
-        
-        try:
-            self.screen = self._create_display(flags)
-            pygame.display.set_caption("Spinner Overdrive - Arcade System")
-            self._set_display_icon()
-        except pygame.error as e:
-            print(f"[DisplayManager] Display creation failed: {e}")
-            self.screen = self._create_fallback_display()
+        if self.backend == "renderer" and self._create_renderer():
+            self.screen = pygame.Surface(self.config.resolution, pygame.SRCALPHA)
+        else:
+            self.backend = "software"
+            flags = self._get_display_flags()
+            
+            try:
+                self.screen = self._create_display(flags)
+                pygame.display.set_caption("Spinner Overdrive - Arcade System")
+                self._set_display_icon()
+            except pygame.error as e:
+                print(f"[DisplayManager] Display creation failed: {e}")
+                self.screen = self._create_fallback_display()
         
         self._screen_buffer = pygame.Surface(self.config.resolution)
         self._setup_mouse()
@@ -750,6 +2637,52 @@ class DisplayManager:
         
         print(f"[DisplayManager] Display ready: {self.config.resolution[0]}x{self.config.resolution[1]}")
     
+    @property
+    def vsync_active(self) -> bool:
+        """Il vsync lo applica solo il Renderer SDL2: il display software senza SCALED/OPENGL
+        ignora vsync=1, e li' un loop senza cap girerebbe a vuoto al 100% di CPU"""
+        return self.vsync_enabled and self._renderer is not None
+    
+    def frame_cap(self, fps_cap: int) -> int:
+        """Limite per clock.tick(): quello configurato, 0 solo se a dare il ritmo e' il vsync"""
+        if fps_cap:
+            return fps_cap
+        return 0 if self.vsync_active else self.DEFAULT_FRAME_CAP
+    
+    def _create_renderer(self) -> bool:
+        """Finestra + Renderer SDL2 (accelerato se c'e', altrimenti il software renderer di SDL)"""
+        try:
+            from pygame._sdl2 import video
+            # Filtro delle texture: lineare come smoothscale, nearest se lo scaling e' nearest
+            smooth = self._scale_mode != self.SCALE_NEAREST
+            os.environ["SDL_RENDER_SCALE_QUALITY"] = "1" if smooth else "0"
+            # Finestra nascosta del modulo display: serve solo a convert()/convert_alpha()
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            self._window = video.Window("Spinner Overdrive - Arcade System", size=self.config.resolution,
+                                        fullscreen=self.config.fullscreen)
+            self._renderer = video.Renderer(self._window, vsync=self.vsync_enabled)
+            self._overlay_texture = video.Texture(self._renderer, self.config.resolution, streaming=True)
+            self._overlay_texture.blend_mode = 1  # SDL_BLENDMODE_BLEND
+            self._frame_texture = None  # creata al primo frame, della misura della sorgente
+            self._window.grab = True
+            print("[DisplayManager] SDL2 renderer backend")
+            return True
+        except Exception as e:
+            print(f"[DisplayManager] SDL2 renderer non disponibile ({e}), uso il backend software")
+            self._destroy_renderer()
+            return False
+    
+    def _destroy_renderer(self):
+        self._frame_texture = None
+        self._overlay_texture = None
+        self._renderer = None
+        if self._window is not None:
+            try:
+                self._window.destroy()
+            except Exception:
+                pass
+            self._window = None
+    
     def _get_display_flags(self) -> int:
         """Get display flags"""
         flags = 0
@@ -776,21 +2709,14 @@ class DisplayManager:
         """Fallback display creation"""
         self.config.fullscreen = False
         
-        # Prova native resolution
+        # Prova la risoluzione logica in finestra
         try:
-            if self.VIRTUAL_WIDTH == 1920:
-                self.config.resolution = (1920, 1080)
-            else:
-                self.config.resolution = (1280, 720)
-            return pygame.display.set_mode(self.config.resolution, 0)
+            self.config.resolution = self.LOGICAL_SIZE
+            return pygame.display.set_mode(self.LOGICAL_SIZE, 0)
         except:
             # Ultimate fallback
-            self.config.resolution = (1280, 720)
-            try:
-                return pygame.display.set_mode((1280, 720), 0)
-            except:
-                self.config.resolution = (800, 600)
-                return pygame.display.set_mode((800, 600), 0)
+            self.config.resolution = (800, 600)
+            return pygame.display.set_mode((800, 600), 0)
     
     def _set_display_icon(self):
         """Set window icon"""
@@ -805,6 +2731,8 @@ class DisplayManager:
     
     def _setup_mouse(self):
         """Setup mouse"""
+        if self._window is not None:
+            self._window.focus()
         try:
             pygame.mouse.set_visible(False)
             pygame.event.set_grab(True)
@@ -845,12 +2773,28 @@ class DisplayManager:
         self.offset_x = (screen_w - self.scaled_w) // 2
         self.offset_y = (screen_h - self.scaled_h) // 2
         
+        # Bande del letterbox (le uniche zone da pulire col present diretto)
+        game = pygame.Rect(self.offset_x, self.offset_y, self.scaled_w, self.scaled_h)
+        self._letterbox_bars = [r for r in (
+            pygame.Rect(0, 0, screen_w, game.top),
+            pygame.Rect(0, game.bottom, screen_w, screen_h - game.bottom),
+            pygame.Rect(0, game.top, game.left, game.height),
+            pygame.Rect(game.right, game.top, screen_w - game.right, game.height),
+        ) if r.w > 0 and r.h > 0]
+        self._screen_target = None
+        
         self._scale_dirty = True
     
     def _clear_cache(self):
         """Clear cache"""
         self._scaled_cache.clear()
         self._scale_dirty = True
+        self.invalidate()
+    
+    def invalidate(self):
+        """Forza un frame completo al prossimo render (cambio stato, cambio modalita')"""
+        self._full_redraw = True
+        self._dirty_skip = 0
     
     def set_scale_mode(self, mode: int):
         """Set scale mode"""
@@ -890,11 +2834,8 @@ class DisplayManager:
         if self._scale_mode != self.SCALE_ADAPTIVE:
             return self._scale_mode
         
-        if not self._render_times:
-            return self.SCALE_SMOOTH
-        
-        avg_time = sum(self._render_times[-30:]) / min(len(self._render_times), 30)
-        return self.SCALE_NEAREST if avg_time > 0.014 else self.SCALE_SMOOTH
+        # Sotto il 100% di risoluzione dinamica anche lo scaling finale passa al nearest
+        return self.SCALE_NEAREST if self.resolution.scale < 1.0 else self.SCALE_SMOOTH
     
     def _scale_surface(self) -> pygame.Surface:
         """Scale surface with cache"""
@@ -903,76 +2844,284 @@ class DisplayManager:
         
         import time
         start = time.perf_counter()
+        source = self._camera_source()
         
         try:
             if mode == self.SCALE_SMOOTH:
-                scaled = pygame.transform.smoothscale(self.virtual_surface, target_size)
+                scaled = pygame.transform.smoothscale(source, target_size)
             else:
-                scaled = pygame.transform.scale(self.virtual_surface, target_size)
+                scaled = pygame.transform.scale(source, target_size)
         except:
-            scaled = pygame.transform.scale(self.virtual_surface, target_size)
+            scaled = pygame.transform.scale(source, target_size)
         
         self._last_scale_time = time.perf_counter() - start
         return scaled
     
     def start_screen_shake(self, intensity: float, duration: float):
-        """Start screen shake"""
-        self._shake_intensity = intensity
-        self._shake_duration = duration
+        """Start screen shake (pixel virtuali)"""
+        self.camera.shake(intensity, duration)
     
     def _apply_screen_shake(self) -> tuple:
-        """Apply screen shake"""
-        if self._shake_duration <= 0:
-            return (0, 0)
-        
-        import random
-        shake_x = random.randint(-int(self._shake_intensity), int(self._shake_intensity))
-        shake_y = random.randint(-int(self._shake_intensity), int(self._shake_intensity))
-        return (shake_x, shake_y)
+        """Offset di shake della camera, in pixel dello schermo"""
+        x, y = self.camera.offset
+        return (int(x * self.scale), int(y * self.scale))
     
     def update_shake(self, dt: float):
         """Update shake"""
-        if self._shake_duration > 0:
-            self._shake_duration -= dt
+        self.camera.update(dt)
     
-    def render(self, fps: float = 0.0, dt: float = 0.0):
-        """Render frame"""
+    def _camera_crop(self, size: Tuple[int, int]) -> Optional[pygame.Rect]:
+        """Zona centrale della sorgente da mostrare con lo zoom della camera (None = tutta)"""
+        zoom = self.camera.zoom_factor()
+        if zoom <= 1.0:
+            return None
+        w, h = size
+        cw, ch = int(w / zoom), int(h / zoom)
+        return pygame.Rect((w - cw) // 2, (h - ch) // 2, cw, ch)
+    
+    def _camera_source(self) -> pygame.Surface:
+        source = self.present_surface
+        crop = self._camera_crop(source.get_size())
+        return source if crop is None else source.subsurface(crop)
+    
+    def _draw_camera_flash(self):
+        """Flash della camera sull'area di gioco, dopo lo scaling"""
+        rgba = self.camera.flash_rgba()
+        if rgba is None:
+            return
+        area = (self.offset_x, self.offset_y, self.scaled_w, self.scaled_h)
+        if self._renderer is not None:
+            self._renderer.draw_blend_mode = 1  # SDL_BLENDMODE_BLEND
+            self._renderer.draw_color = rgba
+            self._renderer.fill_rect(area)
+            return
+        if self._flash_surface is None or self._flash_surface.get_size() != area[2:]:
+            self._flash_surface = pygame.Surface(area[2:])
+        self._flash_surface.fill(rgba[:3])
+        self._flash_surface.set_alpha(rgba[3])
+        self.screen.blit(self._flash_surface, area[:2])
+    
+    def render(self, fps: float = 0.0, dt: float = 0.0, dirty: Optional[List[pygame.Rect]] = None,
+               token=None):
+        """Render frame
+        
+        In modalita' dirty-rect `dirty` sono le zone (coordinate virtuali) cambiate secondo lo stato;
+        None = le trova il display confrontando il frame con il precedente. `token` e' il campione
+        di LatencyTracker del frame, chiuso subito dopo il flip.
+        """
         import time
         start = time.perf_counter()
         
         if dt > 0:
             self.update_shake(dt)
         
-        self._screen_buffer.fill(self.letterbox_color)
+        if self._renderer is not None:
+            self._render_sdl2(fps)
+        elif self.dirty_rects_enabled and self._render_dirty(dirty):
+            pass
+        else:
+            self._render_software(fps)
+        self.latency.presented(token)
         
-        try:
-            scaled = self._scale_surface()
-            shake_x, shake_y = self._apply_screen_shake()
-            self._screen_buffer.blit(scaled, (self.offset_x + shake_x, self.offset_y + shake_y))
-            
+        self._render_times.append(time.perf_counter() - start)
+        if len(self._render_times) > self._max_render_samples:
+            self._render_times.pop(0)
+    
+    def _render_sdl2(self, fps: float):
+        """Backend renderer: upload del frame in texture, scaling/letterbox/shake sul Renderer"""
+        shake_x, shake_y = self._apply_screen_shake()
+        renderer = self._renderer
+        with PROFILER.zone("scale"):
+            source = self.present_surface
+            if self._frame_texture is None or self._frame_texture.get_rect().size != source.get_size():
+                from pygame._sdl2 import video
+                self._frame_texture = video.Texture(renderer, source.get_size(), streaming=True)
+            self._frame_texture.update(source)
+            renderer.draw_color = (*self.letterbox_color[:3], 255)
+            renderer.clear()
+            self._frame_texture.draw(srcrect=self._camera_crop(source.get_size()),
+                                     dstrect=(self.offset_x + shake_x, self.offset_y + shake_y,
+                                              self.scaled_w, self.scaled_h))
+        self._draw_camera_flash()
+        
+        # Overlay (fps, statistiche, bordo, profiler) su tela trasparente, caricata solo se serve
+        if self.show_fps or self.show_detailed_stats or self.show_border or PROFILER.show_overlay:
+            self.screen.fill((0, 0, 0, 0))
             if self.show_border:
-                self._draw_border(self._screen_buffer)
-        except pygame.error as e:
-            print(f"[DisplayManager] Render error: {e}")
-            self._screen_buffer.blit(self.virtual_surface, (self.offset_x, self.offset_y))
-        
-        self.screen.blit(self._screen_buffer, (0, 0))
+                self._draw_border(self.screen)
+            self._draw_overlays(fps)
+            self._overlay_texture.update(self.screen)
+            self._overlay_texture.draw()
         
+        with PROFILER.zone("flip"):
+            renderer.present()
+    
+    def _draw_overlays(self, fps: float):
         if self.show_fps and self.fps_font:
             self._draw_fps(fps)
         
         if self.show_detailed_stats and self.fps_font:
             self._draw_detailed_stats(fps)
         
+        PROFILER.draw_overlay(self.screen)
+    
+    def _render_software(self, fps: float):
+        """Backend software: scaling su CPU nel display (diretto) o nel buffer se c'e' shake"""
+        shake_x, shake_y = self._apply_screen_shake()
+        presented = False
+        if self.direct_present and not (shake_x or shake_y):
+            with PROFILER.zone("scale"):
+                presented = self._present_direct()
+        
+        if not presented:
+            # Percorso con buffer: serve solo quando lo shake sposta il frame fuori dalla sua area
+            self._screen_buffer.fill(self.letterbox_color)
+            
+            try:
+                with PROFILER.zone("scale"):
+                    scaled = self._scale_surface()
+                self._screen_buffer.blit(scaled, (self.offset_x + shake_x, self.offset_y + shake_y))
+                
+                if self.show_border:
+                    self._draw_border(self._screen_buffer)
+            except pygame.error as e:
+                print(f"[DisplayManager] Render error: {e}")
+                self._screen_buffer.blit(self.present_surface, (self.offset_x, self.offset_y))
+            
+            self.screen.blit(self._screen_buffer, (0, 0))
+        
+        self._draw_camera_flash()
+        self._draw_overlays(fps)
+        
+        with PROFILER.zone("flip"):
+            try:
+                pygame.display.flip()
+            except:
+                pygame.display.update()
+        
+        if self.dirty_rects_enabled and not self._dirty_skip:
+            self._store_frame()
+            self._full_redraw = False
+    
+    def _present_direct(self) -> bool:
+        """Scala il frame virtuale direttamente nella subsurface di gioco del display
+        e pulisce solo le bande del letterbox. False se il formato non lo permette."""
+        import time
+        start = time.perf_counter()
         try:
-            pygame.display.flip()
-        except:
-            pygame.display.update()
+            target = self._screen_target
+            if target is None:
+                area = pygame.Rect(self.offset_x, self.offset_y, self.scaled_w, self.scaled_h)
+                target = self._screen_target = self.screen.subsurface(area.clip(self.screen.get_rect()))
+            for bar in self._letterbox_bars:
+                self.screen.fill(self.letterbox_color, bar)
+            
+            size = target.get_size()
+            source = self._camera_source()
+            if size == source.get_size():
+                target.blit(source, (0, 0))
+            elif self._get_effective_scale_mode() == self.SCALE_SMOOTH:
+                pygame.transform.smoothscale(source, size, target)
+            else:
+                pygame.transform.scale(source, size, target)
+        except (pygame.error, ValueError) as e:
+            print(f"[DisplayManager] Present diretto non disponibile ({e}), uso il buffer")
+            self.direct_present = False
+            self._screen_target = None
+            return False
         
-        render_time = time.perf_counter() - start
-        self._render_times.append(render_time)
-        if len(self._render_times) > self._max_render_samples:
-            self._render_times.pop(0)
+        if self.show_border:
+            self._draw_border(self.screen)
+        self._last_scale_time = time.perf_counter() - start
+        return True
+    
+    # ---------- DIRTY RECTS ----------
+    def _tile_size(self) -> Tuple[int, int]:
+        return self.VIRTUAL_WIDTH // self.dirty_tiles[0], self.VIRTUAL_HEIGHT // self.dirty_tiles[1]
+    
+    def _store_frame(self):
+        """Copia del frame virtuale appena presentato, base per il confronto successivo"""
+        try:
+            current = pygame.surfarray.pixels2d(self.present_surface)
+        except (ValueError, pygame.error):
+            self.dirty_rects_enabled = False
+            print("[DisplayManager] Dirty rects non supportati da questa surface, disattivati")
+            return
+        if self._prev_frame is None or self._prev_frame.shape != current.shape:
+            self._prev_frame = current.copy()
+        else:
+            np.copyto(self._prev_frame, current)
+        del current
+    
+    def _changed_tiles(self, dirty: Optional[List[pygame.Rect]]) -> np.ndarray:
+        """Maschera (tile_x, tile_y) dei tile da ripresentare"""
+        nx, ny = self.dirty_tiles
+        tw, th = self._tile_size()
+        if dirty is not None:
+            tiles = np.zeros((nx, ny), dtype=bool)
+            for rect in dirty:
+                r = pygame.Rect(rect).clip(0, 0, nx * tw, ny * th)
+                if r.w and r.h:
+                    tiles[r.left // tw:(r.right - 1) // tw + 1, r.top // th:(r.bottom - 1) // th + 1] = True
+            return tiles
+        current = pygame.surfarray.pixels2d(self.present_surface)
+        try:
+            view = current[:nx * tw, :ny * th]
+            prev = self._prev_frame[:nx * tw, :ny * th]
+            return (view != prev).reshape(nx, tw, ny, th).any(axis=(1, 3))
+        finally:
+            del current
+    
+    def _render_dirty(self, dirty: Optional[List[pygame.Rect]]) -> bool:
+        """Ripresenta solo i tile cambiati; False se serve il frame completo"""
+        if self._dirty_skip:
+            self._dirty_skip -= 1
+            return False
+        if (self._full_redraw or self._prev_frame is None or self.camera.active
+                or self.show_fps or self.show_detailed_stats or self.show_border or PROFILER.show_overlay):
+            return False
+        
+        with PROFILER.zone("dirty_diff"):
+            tiles = self._changed_tiles(dirty)
+        count = int(tiles.sum())
+        self.last_dirty_count = count
+        if count > tiles.size * self.dirty_full_threshold:
+            # Schermata animata: inutile confrontare ogni frame, riprova tra dirty_backoff frame
+            self._dirty_skip = self.dirty_backoff
+            return False
+        if count == 0:
+            return True
+        
+        tw, th = self._tile_size()
+        scale = self.scale
+        smooth = self._get_effective_scale_mode() == self.SCALE_SMOOTH
+        bounds = self.present_surface.get_rect()
+        # Margine minimo che cade su pixel interi anche scalato (1.5x -> 2 px), cosi' i tile restano allineati
+        margin = next((m for m in range(1, 9) if abs(m * scale - round(m * scale)) < 1e-6), 2)
+        rects = []
+        with PROFILER.zone("scale"):
+            for tx, ty in np.argwhere(tiles):
+                tile = pygame.Rect(int(tx) * tw, int(ty) * th, tw, th)
+                x0, y0 = int(tile.left * scale), int(tile.top * scale)
+                dest = pygame.Rect(self.offset_x + x0, self.offset_y + y0,
+                                   int(tile.right * scale) - x0, int(tile.bottom * scale) - y0)
+                if scale == 1.0:
+                    self.screen.blit(self.present_surface, dest, tile)
+                else:
+                    # Margine attorno al tile: il filtro di smoothscale non crea cuciture tra i tile
+                    src = tile.inflate(margin * 2, margin * 2).clip(bounds)
+                    sx0, sy0 = int(src.left * scale), int(src.top * scale)
+                    size = (int(src.right * scale) - sx0, int(src.bottom * scale) - sy0)
+                    sub = self.present_surface.subsurface(src)
+                    scaled = pygame.transform.smoothscale(sub, size) if smooth else pygame.transform.scale(sub, size)
+                    self.screen.blit(scaled, dest, pygame.Rect(x0 - sx0, y0 - sy0, dest.w, dest.h))
+                rects.append(dest)
+        
+        with PROFILER.zone("flip"):
+            pygame.display.update(rects)
+        with PROFILER.zone("dirty_store"):
+            self._store_frame()
+        return True
     
     def _draw_border(self, surface: pygame.Surface):
         """Draw border"""
@@ -1002,8 +3151,11 @@ class DisplayManager:
         color = (0, 255, 0) if avg >= 58 else ((255, 255, 0) if avg >= 45 else (255, 0, 0))
         
         try:
-            text = self.fps_font.render(f"FPS: {avg:.1f}", True, color)
-            self._draw_overlay_box(text, self.offset_x + self.scaled_w - 90, self.offset_y + 10)
+            label = f"FPS: {avg:.1f}"
+            if self.resolution.enabled:
+                label += f"  Res {self.resolution.scale:.0%}"
+            text = TEXT.render(self.fps_font, label, True, color)
+            self._draw_overlay_box(text, self.offset_x + self.scaled_w - text.get_width() - 10, self.offset_y + 10)
         except:
             pass
     
@@ -1019,15 +3171,20 @@ class DisplayManager:
             lines = [
                 f"Render: {avg*1000:.2f}ms",
                 f"Scale: {self._last_scale_time*1000:.2f}ms",
-                f"Virtual: {self.VIRTUAL_WIDTH}x{self.VIRTUAL_HEIGHT}",
+                f"Logical: {self.VIRTUAL_WIDTH}x{self.VIRTUAL_HEIGHT}",
+                f"Res: {self.resolution.scale:.0%} (PID {self.resolution.output:+.2f}, min {self.resolution.floor:.0%})",
                 f"Screen: {self.config.resolution[0]}x{self.config.resolution[1]}",
-                f"Scale: {self.scale:.2f}x"
-            ]
+                f"Scale: {self.scale:.2f}x",
+                f"Layers: {LAYERS.hits} hit / {LAYERS.misses} rebuild, {LAYERS.memory_bytes() / 1e6:.1f} MB",
+                VOICES.overlay_line(),
+                STREAM.overlay_line(),
+                MUSIC.overlay_line()
+            ] + self.latency.overlay_lines()
             
             y = self.offset_y + 50
             for line in lines:
-                text = self.fps_font.render(line, True, (200, 200, 200))
-                self._draw_overlay_box(text, self.offset_x + self.scaled_w - 180, y)
+                text = TEXT.render(self.fps_font, line, True, (200, 200, 200))
+                self._draw_overlay_box(text, self.offset_x + self.scaled_w - text.get_width() - 15, y)
                 y += 25
         except:
             pass
@@ -1040,6 +3197,32 @@ class DisplayManager:
         self.screen.blit(bg, (x - 5, y - 3))
         self.screen.blit(text, (x, y))
     
+    # ---------- PRESENTER THREAD ----------
+    def start_presenter(self):
+        """Sposta scaling e flip su FramePresenter"""
+        if self._renderer is not None:
+            # Il Renderer SDL va usato dal thread che l'ha creato
+            print("[DisplayManager] Threaded presentation non disponibile col backend renderer")
+            return
+        if self._presenter is None:
+            self._presenter = FramePresenter(self)
+            print("[DisplayManager] Threaded presentation ON")
+    
+    def stop_presenter(self):
+        """Ferma il thread dopo l'ultimo frame in coda e torna alla presentazione diretta"""
+        if self._presenter is not None:
+            self._presenter.stop()
+            self._presenter = None
+            self.present_surface = self.virtual_surface
+    
+    def present(self, fps: float = 0.0, dt: float = 0.0, dirty: Optional[List[pygame.Rect]] = None,
+                token=None):
+        """Presenta il frame disegnato: nel thread se attivo, altrimenti subito con render()"""
+        if self._presenter is not None:
+            self._presenter.submit(self.virtual_surface, fps, dt, dirty, token)
+        else:
+            self.render(fps, dt, dirty, token)
+    
     def get_virtual_surface(self) -> pygame.Surface:
         """Get virtual surface"""
         return self.virtual_surface
@@ -1053,19 +3236,11 @@ class DisplayManager:
         return self.scale
     
     def take_screenshot(self, filename: str = None) -> str:
-        """Take screenshot"""
-        if filename is None:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{timestamp}.png"
-        
+        """Take screenshot (PNG scritto in background da FrameRecorder)"""
         try:
-            from pathlib import Path
-            Path("screenshots").mkdir(exist_ok=True)
-            path = Path("screenshots") / filename
-            pygame.image.save(self.virtual_surface, str(path))
+            path = self.capture.screenshot(self.virtual_surface, filename)
             print(f"[DisplayManager] Screenshot: {path}")
-            return str(path)
+            return path
         except Exception as e:
             print(f"[DisplayManager] Screenshot failed: {e}")
             return None
@@ -1111,9 +3286,7 @@ class SpinnerInput:
         # Assicura che il mouse sia sempre nascosto
         self.ensure_mouse_hidden()
         
-        self.left_clicked = False
-        self.right_clicked = False
-        
+        # I click restano validi finche' un passo di simulazione non li consuma (clear_clicks)
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
@@ -1138,6 +3311,11 @@ class SpinnerInput:
     def is_right_clicked(self) -> bool:
         return self.right_clicked
     
+    def clear_clicks(self):
+        """Chiamato dopo ogni passo di simulazione: un click vale per un solo passo"""
+        self.left_clicked = False
+        self.right_clicked = False
+    
     def is_left_pressed(self) -> bool:
         return self.left_pressed
     
@@ -1153,6 +3331,18 @@ class SpinnerInput:
 
 # ============== BASE MINIGAME ==============
 class MiniGame(ABC):
+    # Frazione [0, 1) di passo fisso trascorsa dall'ultimo update: draw() disegna gli oggetti
+    # in movimento tra la posizione del passo precedente e quella corrente (vedi interpolate)
+    render_alpha = 0.0
+    # Risoluzione dinamica: scala corrente (impostata prima di draw) per i buffer interni
+    # costosi, e minimo sotto cui il gioco non deve scendere. Di default 1.0: scende solo chi
+    # disegna davvero i suoi layer a dynamic_scale, per gli altri cambierebbe solo il filtro finale
+    dynamic_scale = 1.0
+    min_dynamic_scale = 1.0
+    # Modalita' dirty-rect attiva (impostata prima di draw): i giochi che riportano le zone
+    # cambiate fermano le animazioni di sfondo, che cambierebbero tutto lo schermo
+    dirty_mode = False
+    
     def __init__(self):
         self.score = 0
         self.game_over = False
@@ -1182,9 +3372,22 @@ class MiniGame(ABC):
     
     def is_game_over(self) -> bool:
         return self.game_over
+    
+    def interpolate(self, previous: float, current: float) -> float:
+        """Posizione da disegnare tra il passo precedente e l'ultimo (un passo di ritardo, niente scatti)"""
+        return previous + (current - previous) * self.render_alpha
+    
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Vedi GameState.get_dirty_rects"""
+        return None
 
 # ============== BASE STATE ==============
 class GameState(ABC):
+    render_alpha = 0.0  # vedi MiniGame.render_alpha, impostato da GameManager prima di draw()
+    dynamic_scale = 1.0  # vedi MiniGame.dynamic_scale
+    dirty_mode = False  # vedi MiniGame.dirty_mode
+    min_dynamic_scale = 1.0  # menu e schermate: sempre a piena risoluzione
+    
     @abstractmethod
     def update(self, dt: float, spinner_delta: float, spinner: SpinnerInput) -> Optional[str]:
         pass
@@ -1198,6 +3401,12 @@ class GameState(ABC):
     
     def on_exit(self):
         pass
+    
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Zone cambiate nell'ultimo draw (coordinate virtuali) per la modalita' dirty-rect.
+        None = non lo so, il display confronta il frame con il precedente; [] = niente di nuovo.
+        Vanno incluse anche le zone lasciate libere da cio' che si e' spostato."""
+        return None
 
 # ============== NAME ENTRY STATE (FIXED LAYOUT) ==============
 class NameEntryState(GameState):
@@ -1251,7 +3460,7 @@ class NameEntryState(GameState):
         self.sparkles = []
         self.letter_float = [0.0, 0.0, 0.0]
         self._spawn_sparkles()
-        self.synth.create_high_score().play()
+        self.synth.play("high_score")
     
     def _spawn_sparkles(self):
         """Spawn celebration sparkles"""
@@ -1315,12 +3524,13 @@ class NameEntryState(GameState):
             new_idx = (current_idx + steps) % len(self.ALPHABET)
             self.letters[self.current_position] = self.ALPHABET[new_idx]
             self.rotation_accumulator -= steps * THRESHOLD
-            self.synth.create_blip(steps).play()
+            # Pitch limitato ai blip pre-renderizzati: uno spin veloce non sintetizza a runtime
+            self.synth.play_blip(max(-3, min(3, steps)))
         
         # Confirm
         if spinner.is_left_clicked():
             self.current_position += 1
-            self.synth.create_select().play()
+            self.synth.play("select")
             if self.current_position >= 3:
                 self.player_name = ''.join(self.letters).strip()
                 if not self.player_name:
@@ -1331,7 +3541,7 @@ class NameEntryState(GameState):
         # Back
         if spinner.is_right_clicked() and self.current_position > 0:
             self.current_position -= 1
-            self.synth.create_back().play()
+            self.synth.play("back")
         
         return None
     
@@ -1365,13 +3575,13 @@ class NameEntryState(GameState):
         
         # Game name
         game_y = 130
-        game_name = self.font_small.render(self.game_name.upper(), True, (150, 200, 255))
+        game_name = TEXT.render(self.font_small, self.game_name.upper(), True, (150, 200, 255))
         surface.blit(game_name, (640 - game_name.get_width()//2, game_y))
         
         # Score
         score_y = 170
-        score_label = self.font_small.render("SCORE", True, (150, 180, 200))
-        score_text = self.font_score.render(f"{self.score:,}", True, (150, 255, 200))
+        score_label = TEXT.render(self.font_small, "SCORE", True, (150, 180, 200))
+        score_text = TEXT.render(self.font_score, f"{self.score:,}", True, (150, 255, 200))
         surface.blit(score_label, (640 - score_label.get_width()//2, score_y))
         surface.blit(score_text, (640 - score_text.get_width()//2, score_y + 26))
         
@@ -1384,7 +3594,7 @@ class NameEntryState(GameState):
         
         # Instruction
         inst_y = 270
-        inst = self.font_small.render("Enter Your Name", True, (200, 220, 240))
+        inst = TEXT.render(self.font_small, "Enter Your Name", True, (200, 220, 240))
         surface.blit(inst, (640 - inst.get_width()//2, inst_y))
         
         # Letters
@@ -1397,13 +3607,8 @@ class NameEntryState(GameState):
     
     def _draw_background(self, surface: pygame.Surface):
         """Background gradient animato"""
-        for y in range(720):
-            factor = y / 720
-            wave = math.sin(self.bg_wave_offset * 0.015 + factor * 4) * 10
-            r = int(15 + wave + factor * 5)
-            g = int(15 + wave + factor * 8)
-            b = int(35 + wave + factor * 15)
-            pygame.draw.line(surface, (r, g, b), (0, y), (1280, y))
+        phase = (self.bg_wave_offset * 0.015) % (math.pi * 2)
+        GRADIENTS.draw(surface, "score_screen_wave", score_screen_gradient, phase, quantum=0.05)
     
     def _draw_glowing_title(self, surface: pygame.Surface, text: str, y: float, color: tuple):
         """Title con glow"""
@@ -1418,11 +3623,11 @@ class NameEntryState(GameState):
                 surface.blit(glow_surf, (640 - glow_surf.get_width()//2 + offset[0], int(y) + offset[1]))
         
         # Shadow
-        shadow = self.font_title.render(text, True, (20, 20, 0))
+        shadow = TEXT.render(self.font_title, text, True, (20, 20, 0))
         surface.blit(shadow, (640 - shadow.get_width()//2 + 2, int(y) + 2))
         
         # Main
-        title = self.font_title.render(text, True, color)
+        title = TEXT.render(self.font_title, text, True, color)
         surface.blit(title, (640 - title.get_width()//2, int(y)))
     
     def _draw_sparkle(self, surface: pygame.Surface, x: float, y: float, size: int, 
@@ -1655,6 +3860,7 @@ class HighScoreState(GameState):
         
         # Row animations
         self.row_animations = []
+        self._sparkle_rects = None  # zone delle scintille al frame precedente (dirty rects)
         
         # Initialize star field
         for _ in range(80):
@@ -1673,6 +3879,7 @@ class HighScoreState(GameState):
         self.glow_pulse = 0.0
         self.wave_offset = 0.0
         self.sparkles = []
+        self._sparkle_rects = None
         
         # Initialize row animations with stagger
         self.row_animations = []
@@ -1717,15 +3924,16 @@ class HighScoreState(GameState):
         
         # Pulse and waves
         self.glow_pulse += dt * 2.5
-        self.wave_offset += dt * 60
         
-        # Update stars
-        for star in self.stars:
-            star['x'] -= star['speed'] * dt * 15
-            star['twinkle_phase'] += dt * 2
-            if star['x'] < 0:
-                star['x'] = 1280
-                star['y'] = random.randint(0, 720)
+        # Sfondo e stelle: fermi in modalita' dirty-rect (cambierebbero tutto lo schermo)
+        if not self.dirty_mode:
+            self.wave_offset += dt * 60
+            for star in self.stars:
+                star['x'] -= star['speed'] * dt * 15
+                star['twinkle_phase'] += dt * 2
+                if star['x'] < 0:
+                    star['x'] = 1280
+                    star['y'] = random.randint(0, 720)
         
         # Update sparkles
         for sp in self.sparkles[:]:
@@ -1751,7 +3959,7 @@ class HighScoreState(GameState):
         
         # Exit
         if spinner.is_left_clicked() or spinner.is_right_clicked():
-            self.synth.create_back().play()
+            self.synth.play("back")
             return "main_menu"
         
         return None
@@ -1784,29 +3992,9 @@ class HighScoreState(GameState):
         title_y = 30 + (1 - intro_ease) * -50
         self._draw_glowing_title(surface, "HIGH SCORES", title_y, (255, 215, 0))
         
-        # === GAME NAME with underline ===
-        game_y = 110
-        game_title = self.font_header.render(self.game_name, True, (150, 200, 255))
-        game_shadow = self.font_header.render(self.game_name, True, (0, 0, 50))
-        surface.blit(game_shadow, (640 - game_title.get_width()//2 + 2, game_y + 2))
-        surface.blit(game_title, (640 - game_title.get_width()//2, game_y))
-        
-        # Animated underline
-        underline_width = int(game_title.get_width() * intro_ease)
-        underline_y = game_y + 50
-        pygame.draw.line(surface, (100, 150, 255), 
-                        (640 - underline_width//2, underline_y),
-                        (640 + underline_width//2, underline_y), 3)
-        
-        # === TABLE HEADER ===
-        header_y = 190
-        self._draw_table_header(surface, header_y, intro_ease)
-        
-        # === DECORATIVE LINE ===
-        line_y = header_y + 45
-        line_width = int(1100 * intro_ease)
-        pygame.draw.line(surface, (100, 120, 180), 
-                        (90, line_y), (90 + line_width, line_y), 2)
+        # === GAME NAME, TABLE HEADER (layer: cambia solo durante l'intro) ===
+        LAYERS.draw(surface, "highscore.header", (self.game_name, round(intro_ease, 3)),
+                    lambda target: self._build_header(target, intro_ease), (0, 105, 1280, 135))
         
         # === SCORE ROWS ===
         base_y = 250
@@ -1823,15 +4011,25 @@ class HighScoreState(GameState):
         if len(self.scores) == 0:
             self._draw_empty_state(surface)
     
+    # Zone animate anche a schermata ferma: titolo pulsante (alone compreso) e hint lampeggiante
+    TITLE_RECT = pygame.Rect(0, 18, 1280, 82)
+    HINT_RECT = pygame.Rect(0, 674, 1280, 46)
+    
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Finiti intro e ingresso delle righe cambiano solo titolo, hint e scintille (nuove e vecchie
+        posizioni); prima, e al primo frame fermo, None: confronta il display"""
+        sparkles = [pygame.Rect(int(sp['x']) - sp['size'] * 2 - 1, int(sp['y']) - sp['size'] * 2 - 1,
+                                sp['size'] * 4 + 2, sp['size'] * 4 + 2) for sp in self.sparkles]
+        settled = self.intro_progress >= 1.0 and all(a['progress'] >= 1.0 for a in self.row_animations)
+        previous, self._sparkle_rects = self._sparkle_rects, (sparkles if settled else None)
+        if not settled or previous is None:
+            return None
+        return [self.TITLE_RECT, self.HINT_RECT] + sparkles + previous
+    
     def _draw_background(self, surface: pygame.Surface):
         """Animated gradient background"""
-        for y in range(720):
-            factor = y / 720
-            wave = math.sin(self.wave_offset * 0.015 + factor * 4) * 10
-            r = int(15 + wave + factor * 5)
-            g = int(15 + wave + factor * 8)
-            b = int(35 + wave + factor * 15)
-            pygame.draw.line(surface, (r, g, b), (0, y), (1280, y))
+        phase = (self.wave_offset * 0.015) % (math.pi * 2)
+        GRADIENTS.draw(surface, "score_screen_wave", score_screen_gradient, phase, quantum=0.05)
     
     def _draw_glowing_title(self, surface: pygame.Surface, text: str, y: float, color: tuple):
         """Draw title with pulsing glow"""
@@ -1846,13 +4044,38 @@ class HighScoreState(GameState):
                 surface.blit(glow_surf, (640 - glow_surf.get_width()//2 + offset[0], int(y) + offset[1]))
         
         # Shadow
-        shadow = self.font_title.render(text, True, (20, 20, 0))
+        shadow = TEXT.render(self.font_title, text, True, (20, 20, 0))
         surface.blit(shadow, (640 - shadow.get_width()//2 + 3, int(y) + 3))
         
         # Main text
-        title = self.font_title.render(text, True, color)
+        title = TEXT.render(self.font_title, text, True, color)
         surface.blit(title, (640 - title.get_width()//2, int(y)))
     
+    def _build_header(self, surface: pygame.Surface, intro_ease: float):
+        """Nome del gioco sottolineato, intestazioni e linea decorativa"""
+        game_y = 110
+        game_title = TEXT.render(self.font_header, self.game_name, True, (150, 200, 255))
+        game_shadow = TEXT.render(self.font_header, self.game_name, True, (0, 0, 50))
+        surface.blit(game_shadow, (640 - game_title.get_width()//2 + 2, game_y + 2))
+        surface.blit(game_title, (640 - game_title.get_width()//2, game_y))
+        
+        # Animated underline
+        underline_width = int(game_title.get_width() * intro_ease)
+        underline_y = game_y + 50
+        pygame.draw.line(surface, (100, 150, 255), 
+                        (640 - underline_width//2, underline_y),
+                        (640 + underline_width//2, underline_y), 3)
+        
+        # === TABLE HEADER ===
+        header_y = 190
+        self._draw_table_header(surface, header_y, intro_ease)
+        
+        # === DECORATIVE LINE ===
+        line_y = header_y + 45
+        line_width = int(1100 * intro_ease)
+        pygame.draw.line(surface, (100, 120, 180), 
+                        (90, line_y), (90 + line_width, line_y), 2)
+    
     def _draw_table_header(self, surface: pygame.Surface, y: int, intro_ease: float):
         """Draw table header - PULITO SENZA BORDI E SFONDI"""
         headers = [
@@ -1956,8 +4179,8 @@ class HighScoreState(GameState):
         pygame.draw.circle(medal_surf, (255, 255, 255), (size, size), size, 3)
         
         # Rank number on medal
-        font_small = pygame.font.Font(None, 22)
-        rank_num = font_small.render(str(rank + 1), True, (50, 50, 50))
+        font_small = TEXT.font(22)
+        rank_num = TEXT.render(font_small, str(rank + 1), True, (50, 50, 50))
         medal_surf.blit(rank_num, (size - rank_num.get_width()//2, size - rank_num.get_height()//2))
         
         # Crown for first place
@@ -2009,10 +4232,10 @@ class HighScoreState(GameState):
         pygame.draw.circle(surface, (100, 100, 120), (640, empty_y + 15), 5)
         
         # Message
-        msg = self.font_header.render("No high scores yet!", True, (150, 150, 170))
+        msg = TEXT.render(self.font_header, "No high scores yet!", True, (150, 150, 170))
         surface.blit(msg, (640 - msg.get_width()//2, empty_y + 80))
         
-        hint = self.font_score.render("Be the first to set a record!", True, (120, 140, 160))
+        hint = TEXT.render(self.font_score, "Be the first to set a record!", True, (120, 140, 160))
         surface.blit(hint, (640 - hint.get_width()//2, empty_y + 130))
     
     def _ease_out_cubic(self, t: float) -> float:
@@ -2072,10 +4295,10 @@ class MainMenuState(GameState):
                 self.carousel.navigate(direction)
                 self.rotation_accumulator -= steps * THRESHOLD
                 self.selection_cooldown = 0.2
-                self.synth.create_blip(direction).play()
+                self.synth.play_blip(direction)
         
         if spinner.is_left_clicked() and self.selection_cooldown <= 0:
-            self.synth.create_select().play()
+            self.synth.play("select")
             current = self.carousel.get_current_index()
             if current < len(self.games):
                 return f"game:{current}"
@@ -2087,7 +4310,7 @@ class MainMenuState(GameState):
         if spinner.is_right_clicked():
             current = self.carousel.get_current_index()
             if current < len(self.games):
-                self.synth.create_back().play()
+                self.synth.play("back")
                 return f"view_scores:{self.games[current].get_name()}"
         return None
     
@@ -2102,8 +4325,8 @@ class MainMenuState(GameState):
             surface.blit(self.logo_image, (logo_x, logo_y))
         else:
             logo_text = "SPINNER OVERDOSE"
-            logo = self.font_logo.render(logo_text, True, (255, 230, 0))
-            shadow = self.font_logo.render(logo_text, True, (0, 0, 0))
+            logo = TEXT.render(self.font_logo, logo_text, True, (255, 230, 0))
+            shadow = TEXT.render(self.font_logo, logo_text, True, (0, 0, 0))
             surface.blit(shadow, (640 - logo.get_width()//2 + 3, logo_y + 3))
             surface.blit(logo, (640 - logo.get_width()//2, logo_y))
         
@@ -2121,7 +4344,7 @@ class MainMenuState(GameState):
             float_offset = math.sin(self.pulse_timer * 1.5) * 2
             
             # Record text
-            score_text = self.font_info.render(f"RECORD: {high_score:,}", True, (255, 255, 240))
+            score_text = TEXT.render(self.font_info, f"RECORD: {high_score:,}", True, (255, 255, 240))
             
             # Box dimensions
             box_width = score_text.get_width() + 30
@@ -2208,7 +4431,7 @@ class MainMenuState(GameState):
                 int(255 * text_intensity),
                 int(240 * text_intensity)
             )
-            final_text = self.font_info.render(f"RECORD: {high_score:,}", True, text_color)
+            final_text = TEXT.render(self.font_info, f"RECORD: {high_score:,}", True, text_color)
             final_rect = final_text.get_rect(center=(text_x, text_y))
             surface.blit(final_text, final_rect)
 
@@ -2220,7 +4443,7 @@ class MainMenuState(GameState):
         pygame.draw.rect(counter_bg, (0, 0, 0, 150), (0, 0, 80, 45), 0, 8)
         pygame.draw.rect(counter_bg, (255, 200, 0), (0, 0, 80, 45), 3, 8)
         surface.blit(counter_bg, (1180, 20))
-        counter = self.font_counter.render(counter_text, True, (255, 255, 255))
+        counter = TEXT.render(self.font_counter, counter_text, True, (255, 255, 255))
         surface.blit(counter, (1220 - counter.get_width()//2, 32))
         
         # === ARROWS ===
@@ -2237,7 +4460,7 @@ class MainMenuState(GameState):
         pygame.draw.polygon(surface, (255, 255, 255), right_points, 3)
         
         # === HINTS ===
-        hints = self.font_hint.render("SPINNER: Navigate  •  LEFT: Select  •  RIGHT: High Scores", True, (180, 230, 180))
+        hints = TEXT.render(self.font_hint, "SPINNER: Navigate  •  LEFT: Select  •  RIGHT: High Scores", True, (180, 230, 180))
         surface.blit(hints, (640 - hints.get_width()//2, 695))
 
 
@@ -2262,10 +4485,27 @@ class ConfigMenuState(GameState):
         self.adjustment_cooldown = 0.0
         self.needs_display_update = False
         self.last_selected = -1
+        self._dirty_key = None  # opzioni all'ultimo frame presentato (dirty rects)
+    
+    # Opzioni, indicatore "ADJUSTING", barra della sensibilita' e hint
+    OPTIONS_RECT = pygame.Rect(0, 200, 1280, 480)
+    
+    def on_enter(self):
+        self._dirty_key = None
+    
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Con lo sfondo fermo cambia solo il blocco opzioni, e solo quando cambia un valore"""
+        key = (self.selected, self.adjusting, int(self.config.spinner_sensitivity),
+               self.config.resolution, self.config.fullscreen)
+        previous, self._dirty_key = self._dirty_key, key
+        if previous is None:
+            return None
+        return [self.OPTIONS_RECT] if key != previous else []
     
     def update(self, dt: float, spinner_delta: float, spinner: SpinnerInput) -> Optional[str]:
-        # Aggiorna lo sfondo animato
-        self.background.update(dt)
+        # Aggiorna lo sfondo animato (fermo in modalita' dirty-rect)
+        if not self.dirty_mode:
+            self.background.update(dt)
         
         if self.adjustment_cooldown > 0:
             self.adjustment_cooldown -= dt
@@ -2282,16 +4522,16 @@ class ConfigMenuState(GameState):
                 self.selected = (self.selected + steps) % 3
                 self.rotation_accumulator -= steps * THRESHOLD
                 if self.selected != self.last_selected:
-                    self.synth.create_blip(0).play()
+                    self.synth.play_blip(0)
                     self.last_selected = self.selected
             
             if spinner.is_left_clicked():
                 self.adjusting = True
                 self.rotation_accumulator = 0.0
-                self.synth.create_select().play()
+                self.synth.play("select")
             if spinner.is_right_clicked():
                 self.config.save()
-                self.synth.create_back().play()
+                self.synth.play("back")
                 return "main_menu"
         else:
             if self.selected == 0:
@@ -2306,27 +4546,27 @@ class ConfigMenuState(GameState):
                     self.config.resolution = self.resolutions[new_idx]
                     self.rotation_accumulator = 0.0
                     self.needs_display_update = True
-                    self.synth.create_blip(direction).play()
+                    self.synth.play_blip(direction)
             elif self.selected == 2:
                 self.rotation_accumulator += spinner_delta
                 if abs(self.rotation_accumulator) >= 50.0 and self.adjustment_cooldown <= 0:
                     self.config.fullscreen = not self.config.fullscreen
                     self.rotation_accumulator = 0.0
                     self.needs_display_update = True
-                    self.synth.create_blip(0).play()
+                    self.synth.play_blip(0)
             
             if spinner.is_left_clicked():
                 self.adjusting = False
                 self.rotation_accumulator = 0.0
                 self.config.save()
-                self.synth.create_select().play()
+                self.synth.play("select")
         return None
     
     def draw(self, surface: pygame.Surface):
         # Disegna lo sfondo animato invece del colore solido
         self.background.draw(surface)
         
-        title = self.font_title.render("SETTINGS", True, (255, 215, 0))
+        title = TEXT.render(self.font_title, "SETTINGS", True, (255, 215, 0))
         surface.blit(title, (640 - title.get_width()//2, 80))
         
         options = [
@@ -2342,10 +4582,10 @@ class ConfigMenuState(GameState):
             font = self.font_item_selected if is_selected else self.font_item
             
             if is_adjusting:
-                ind_txt = self.font_indicator.render("< ADJUSTING >", True, (0, 255, 100))
+                ind_txt = TEXT.render(self.font_indicator, "< ADJUSTING >", True, (0, 255, 100))
                 surface.blit(ind_txt, (640 - ind_txt.get_width()//2, y - 35))
             
-            text = font.render(option, True, color)
+            text = TEXT.render(font, option, True, color)
             surface.blit(text, (640 - text.get_width()//2, y))
             
             if i == 0 and is_selected:
@@ -2359,7 +4599,7 @@ class ConfigMenuState(GameState):
         y = 600
         hints = ["SPINNER: Navigate", "LEFT: Adjust | RIGHT: Back to Menu"] if not self.adjusting else ["SPINNER: Modify", "LEFT: Confirm"]
         for hint_text in hints:
-            hint = self.font_hint.render(hint_text, True, (100, 200, 100))
+            hint = TEXT.render(self.font_hint, hint_text, True, (100, 200, 100))
             surface.blit(hint, (640 - hint.get_width()//2, y))
             y += 35
 
@@ -2372,7 +4612,7 @@ class PlayingState(GameState):
     
     def on_enter(self):
         self.game.reset()
-        self.synth.create_game_start().play()
+        self.synth.play("game_start")
     
     def update(self, dt: float, spinner_delta: float, spinner: SpinnerInput) -> Optional[str]:
         continue_playing = self.game.update(dt, spinner_delta, spinner)
@@ -2382,14 +4622,24 @@ class PlayingState(GameState):
                 if self.high_score_mgr.is_high_score(self.game.get_name(), score):
                     return f"name_entry:{self.game.get_name()}:{score}"
                 else:
-                    self.synth.create_game_over().play()
+                    self.synth.play("game_over")
                     return f"view_scores:{self.game.get_name()}"
-            self.synth.create_back().play()
+            self.synth.play("back")
             return "main_menu"
         return None
     
+    @property
+    def min_dynamic_scale(self) -> float:
+        return self.game.min_dynamic_scale
+    
     def draw(self, surface: pygame.Surface):
+        self.game.render_alpha = self.render_alpha
+        self.game.dynamic_scale = self.dynamic_scale
+        self.game.dirty_mode = self.dirty_mode
         self.game.draw(surface)
+    
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        return self.game.get_dirty_rects()
 
 
 
@@ -2423,11 +4673,13 @@ class BreakoutSpinner(MiniGame):
         
         # Core game state
         self.paddle_x = 640
+        self.prev_paddle_x = 640  # posizione al passo precedente, per l'interpolazione in draw
         self.paddle_width = 120
         self.paddle_target_width = 120
         self.balls = []
         self.bricks = []
-        self.particles = []
+        self.brick_grid = BrickGrid(40, 80, 120, 35)
+        self.particles = ParticleSystem()
         self.powerups = []
         self.lasers = []
         self.floating_texts = []
@@ -2450,7 +4702,6 @@ class BreakoutSpinner(MiniGame):
         self.powerup_spawn_timer = 0
         
         # Visual effects
-        self.screen_shake = 0
         self.flash_timer = 0
         self.time = 0
         self.paddle_pulse = 0
@@ -2473,12 +4724,6 @@ class BreakoutSpinner(MiniGame):
         self.font_hint = pygame.font.Font(None, 24)
         self.font_powerup = pygame.font.Font(None, 20)
         
-        # === CACHE SUPERFICI HUD ===
-        self._hud_cache = {}
-        self._last_score = -1
-        self._last_level = -1
-        self._last_combo = -1
-        
         self.reset()
     
     def get_name(self) -> str:
@@ -2504,20 +4749,23 @@ class BreakoutSpinner(MiniGame):
         self.paddle_target_width = 120
         self.active_powerups = {}
         self.time = 0
-        self.screen_shake = 0
         self.balls = []
         self.bricks = []
-        self.particles = []
+        self.particles = ParticleSystem()
         self.powerups = []
         self.lasers = []
         self.floating_texts = []
-        self._hud_cache.clear()
-        self._last_score = -1
-        self._last_level = -1
-        self._last_combo = -1
         self.generate_level(self.level)
         self.spawn_ball()
     
+    def _store_previous(self):
+        """Posizioni di inizio passo: draw() interpola da qui a quelle correnti con render_alpha"""
+        self.prev_paddle_x = self.paddle_x
+        for ball in self.balls:
+            ball['px'], ball['py'] = ball['x'], ball['y']
+        for laser in self.lasers:
+            laser['py'] = laser['y']
+    
     def spawn_ball(self):
         """Spawn a new ball from paddle"""
         angle = random.uniform(-60, -120)
@@ -2558,6 +4806,7 @@ class BreakoutSpinner(MiniGame):
             brick['alive'] = True
             brick['pulse'] = random.uniform(0, math.pi * 2)
             brick['hit_flash'] = 0
+        self.brick_grid.rebuild(self.bricks)
     
     def pattern_standard(self, level: int):
         """Standard grid pattern"""
@@ -2744,60 +4993,49 @@ class BreakoutSpinner(MiniGame):
                         'glow': 0
                     })
             self.create_floating_text(self.paddle_x, 650, "+2 BALLS!", (255, 200, 100))
-            self.synth.create_multiball().play()
+            self.synth.play("multiball")
         
         elif pu_type == 'bigpaddle':
             self.paddle_target_width = 180
             self.active_powerups['bigpaddle'] = duration
             self.create_floating_text(self.paddle_x, 650, "BIG PADDLE!", (100, 200, 255))
-            self.synth.create_powerup().play()
+            self.synth.play("powerup")
         
         elif pu_type == 'slowball':
             self.active_powerups['slowball'] = duration
             self.create_floating_text(self.paddle_x, 650, "SLOW BALL!", (150, 255, 150))
-            self.synth.create_powerup().play()
+            self.synth.play("powerup")
         
         elif pu_type == 'fireball':
             self.active_powerups['fireball'] = duration
             self.create_floating_text(self.paddle_x, 650, "FIREBALL!", (255, 100, 50))
-            self.synth.create_powerup().play()
+            self.synth.play("powerup")
         
         elif pu_type == 'magnet':
             self.active_powerups['magnet'] = duration
             self.create_floating_text(self.paddle_x, 650, "MAGNET!", (255, 150, 255))
-            self.synth.create_shield_activate().play()
+            self.synth.play("shield_activate")
         
         elif pu_type == 'laser':
             self.active_powerups['laser'] = duration
             self.create_floating_text(self.paddle_x, 650, "LASER!", (255, 255, 100))
-            self.synth.create_powerup().play()
+            self.synth.play("powerup")
         
         elif pu_type == 'extralife':
             if self.lives < self.max_lives:
                 self.lives += 1
                 self.create_floating_text(self.paddle_x, 650, "+1 LIFE!", (255, 50, 50))
-                self.synth.create_high_score().play()
+                self.synth.play("high_score")
         
         elif pu_type == 'scoreup':
             self.active_powerups['scoreup'] = duration
             self.create_floating_text(self.paddle_x, 650, "SCORE x2!", (255, 215, 0))
-            self.synth.create_powerup().play()
+            self.synth.play("powerup")
     
     def create_particles(self, x: float, y: float, color: tuple, count: int = 15):
         """Create particle burst"""
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(80, 200)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'lifetime': random.uniform(0.3, 0.7),
-                'max_lifetime': 0.7,
-                'color': color,
-                'size': random.uniform(2, 5)
-            })
+        self.particles.emit(x, y, count, color, speed=(80, 200), life=(0.3, 0.7),
+                            max_life=0.7, size=(2, 5), gravity=400)
     
     def create_floating_text(self, x: float, y: float, text: str, color: tuple):
         """Create floating score text"""
@@ -2810,7 +5048,115 @@ class BreakoutSpinner(MiniGame):
             'vy': -80
         })
     
+    def _move_ball(self, ball: dict, dt: float, fireball_active: bool):
+        """Muove la pallina a sotto-passi con collisioni continue contro paddle e mattoni.
+
+        Il segmento percorso viene intersecato (ray vs AABB) con tutto cio' che attraversa,
+        quindi nemmeno a velocita' alte o con dt grande la pallina salta paddle o mattoni.
+        """
+        steps = sweep_steps(ball['vx'] * dt, ball['vy'] * dt)
+        last = None  # mattone appena colpito: non si ricolpisce nello stesso movimento
+        for _ in range(steps):
+            left = dt / steps
+            for _ in range(SWEEP_MAX_CONTACTS):
+                x, y = ball['x'], ball['y']
+                sx, sy = ball['vx'] * left, ball['vy'] * left
+                hit, target = None, None
+                
+                if sy > 0:
+                    half = self.paddle_width // 2
+                    hit = sweep_aabb(x, y, sx, sy, self.paddle_x - half, 670, self.paddle_x + half, 690,
+                                     hit_inside=True)
+                
+                for brick in self.brick_grid.near(min(x, x + sx), min(y, y + sy),
+                                                  max(x, x + sx), max(y, y + sy)):
+                    if brick is last:
+                        continue
+                    h = sweep_aabb(x, y, sx, sy, brick['x'], brick['y'],
+                                   brick['x'] + brick['w'], brick['y'] + brick['h'])
+                    if h is not None and (hit is None or h[0] < hit[0]):
+                        hit, target = h, brick
+                
+                if hit is None:
+                    ball['x'] = x + sx
+                    ball['y'] = y + sy
+                    break
+                
+                t, nx, ny = hit
+                ball['x'] = x + sx * t
+                ball['y'] = y + sy * t
+                left *= 1.0 - t
+                if target is None:
+                    self._paddle_bounce(ball)
+                else:
+                    self._hit_brick(ball, target, fireball_active, nx, ny)
+                    last = target
+            
+            # Wall collisions
+            if ball['x'] <= 10 or ball['x'] >= 1270:
+                ball['vx'] *= -1
+                ball['x'] = max(10, min(1270, ball['x']))
+                self.synth.play("wall_bounce")
+                self.create_particles(ball['x'], ball['y'], (150, 200, 255), 8)
+            
+            if ball['y'] <= 10:
+                ball['vy'] *= -1
+                ball['y'] = 10
+                self.synth.play("wall_bounce")
+                self.create_particles(ball['x'], ball['y'], (150, 200, 255), 8)
+    
+    def _paddle_bounce(self, ball: dict):
+        ball['vy'] = abs(ball['vy']) * -1
+        offset = (ball['x'] - self.paddle_x) / (self.paddle_width // 2)
+        ball['vx'] = offset * 400
+        self.synth.play("paddle_hit")
+        self.create_particles(ball['x'], ball['y'], (255, 255, 100), 10)
+        self.paddle_pulse = 0
+    
+    def _hit_brick(self, ball: dict, brick: dict, fireball_active: bool, nx: int, ny: int):
+        # Hit brick
+        if fireball_active:
+            brick['strength'] = 0
+        else:
+            brick['strength'] -= 1
+        
+        brick['hit_flash'] = 0.2
+        
+        if brick['strength'] <= 0:
+            self.brick_grid.kill(brick)
+            self.total_bricks_broken += 1
+            
+            # Score with combo
+            points = int(10 * self.combo_multiplier * (2 if 'scoreup' in self.active_powerups else 1))
+            self.score += points
+            
+            # Combo system
+            self.combo += 1
+            self.combo_timer = 2.0
+            self.max_combo = max(self.max_combo, self.combo)
+            self.combo_multiplier = 1.0 + (self.combo // 5) * 0.5
+            
+            # Effects - RIDOTTO SCREEN SHAKE
+            color = self.get_brick_color(brick)
+            self.create_particles(brick['x'] + brick['w'] // 2, brick['y'] + brick['h'] // 2, color, 20)
+            self.create_floating_text(brick['x'] + brick['w'] // 2, brick['y'], f"+{points}", (255, 255, 100))
+            CAMERA.shake(3, 0.08)
+            self.synth.play("score_point")
+            
+            self.spawn_powerup(brick['x'] + brick['w'] // 2, brick['y'] + brick['h'] // 2)
+        else:
+            self.synth.play("hit")
+            self.create_particles(ball['x'], ball['y'], (255, 150, 100), 8)
+            CAMERA.shake(3, 0.04)
+        
+        if not fireball_active:
+            if nx:
+                ball['vx'] = -ball['vx']
+            if ny:
+                ball['vy'] = -ball['vy']
+    
     def update(self, dt: float, spinner_delta: float, spinner: SpinnerInput) -> bool:
+        self._store_previous()
         if self.game_over:
             return not spinner.is_right_clicked()
         
@@ -2825,12 +5171,12 @@ class BreakoutSpinner(MiniGame):
         
         if self.paused:
             if spinner.is_left_clicked():
-                self.synth.create_back().play()
+                self.synth.play("back")
                 self.game_over = True
                 return False
             if spinner.is_right_clicked():
                 self.paused = False
-                self.synth.create_select().play()
+                self.synth.play("select")
             return True
         
         # Level complete check
@@ -2877,6 +5223,7 @@ class BreakoutSpinner(MiniGame):
         
         # Ball speed modifier
         speed_mult = 0.7 if 'slowball' in self.active_powerups else 1.0
+        fireball_active = 'fireball' in self.active_powerups
         
         # Update balls
         for ball in self.balls[:]:
@@ -2894,31 +5241,8 @@ class BreakoutSpinner(MiniGame):
                     pull_force = (self.paddle_x - ball['x']) * 3
                     ball['vx'] += pull_force * dt
             
-            ball['x'] += ball['vx'] * dt * speed_mult
-            ball['y'] += ball['vy'] * dt * speed_mult
-            
-            # Wall collisions
-            if ball['x'] <= 10 or ball['x'] >= 1270:
-                ball['vx'] *= -1
-                ball['x'] = max(10, min(1270, ball['x']))
-                self.synth.create_wall_bounce().play()
-                self.create_particles(ball['x'], ball['y'], (150, 200, 255), 8)
-            
-            if ball['y'] <= 10:
-                ball['vy'] *= -1
-                ball['y'] = 10
-                self.synth.create_wall_bounce().play()
-                self.create_particles(ball['x'], ball['y'], (150, 200, 255), 8)
-            
-            # Paddle collision
-            if (670 <= ball['y'] <= 690 and 
-                self.paddle_x - self.paddle_width // 2 <= ball['x'] <= self.paddle_x + self.paddle_width // 2):
-                ball['vy'] = abs(ball['vy']) * -1
-                offset = (ball['x'] - self.paddle_x) / (self.paddle_width // 2)
-                ball['vx'] = offset * 400
-                self.synth.create_paddle_hit().play()
-                self.create_particles(ball['x'], ball['y'], (255, 255, 100), 10)
-                self.paddle_pulse = 0
+            # Movement, walls, paddle and bricks (swept)
+            self._move_ball(ball, dt * speed_mult, fireball_active)
             
             # Ball lost
             if ball['y'] > 720:
@@ -2929,67 +5253,17 @@ class BreakoutSpinner(MiniGame):
                     self.combo_timer = 0
                     if self.lives <= 0:
                         self.game_over = True
-                        self.synth.create_game_over().play()
+                        self.synth.play("game_over")
                     else:
                         self.spawn_ball()
-                        self.synth.create_ball_lost().play()
-        
-        # Brick collisions
-        fireball_active = 'fireball' in self.active_powerups
-        
-        for ball in self.balls:
-            for brick in self.bricks:
-                if not brick['alive']:
-                    continue
-                
-                if (brick['x'] <= ball['x'] <= brick['x'] + brick['w'] and
-                    brick['y'] <= ball['y'] <= brick['y'] + brick['h']):
-                    
-                    # Hit brick
-                    if fireball_active:
-                        brick['strength'] = 0
-                    else:
-                        brick['strength'] -= 1
-                    
-                    brick['hit_flash'] = 0.2
-                    
-                    if brick['strength'] <= 0:
-                        brick['alive'] = False
-                        self.total_bricks_broken += 1
-                        
-                        # Score with combo
-                        points = int(10 * self.combo_multiplier * (2 if 'scoreup' in self.active_powerups else 1))
-                        self.score += points
-                        
-                        # Combo system
-                        self.combo += 1
-                        self.combo_timer = 2.0
-                        self.max_combo = max(self.max_combo, self.combo)
-                        self.combo_multiplier = 1.0 + (self.combo // 5) * 0.5
-                        
-                        # Effects - RIDOTTO SCREEN SHAKE
-                        color = self.get_brick_color(brick)
-                        self.create_particles(brick['x'] + brick['w'] // 2, brick['y'] + brick['h'] // 2, color, 20)
-                        self.create_floating_text(brick['x'] + brick['w'] // 2, brick['y'], f"+{points}", (255, 255, 100))
-                        self.screen_shake = 0.08
-                        self.synth.create_score_point().play()
-                        
-                        self.spawn_powerup(brick['x'] + brick['w'] // 2, brick['y'] + brick['h'] // 2)
-                    else:
-                        self.synth.create_hit().play()
-                        self.create_particles(ball['x'], ball['y'], (255, 150, 100), 8)
-                        self.screen_shake = 0.04
-                    
-                    if not fireball_active:
-                        ball['vy'] *= -1
-                    break
+                        self.synth.play("ball_lost")
         
         # Check level complete
-        if all(not brick['alive'] for brick in self.bricks) and self.level_complete_timer == 0:
+        if self.brick_grid.alive == 0 and self.level_complete_timer == 0:
             self.level_complete_timer = 2.0
             self.score += 500 * self.level
             self.create_floating_text(640, 360, f"LEVEL {self.level} COMPLETE!", (255, 215, 0))
-            self.synth.create_level_complete().play()
+            self.synth.play("level_complete")
         
         # Update powerups falling
         for pu in self.powerups[:]:
@@ -3011,27 +5285,25 @@ class BreakoutSpinner(MiniGame):
         if 'laser' in self.active_powerups and spinner.is_left_clicked():
             self.lasers.append({'x': self.paddle_x - 20, 'y': 670, 'vy': -800})
             self.lasers.append({'x': self.paddle_x + 20, 'y': 670, 'vy': -800})
-            self.synth.create_laser_shoot().play()
+            self.synth.play("laser_shoot")
         
         # Update lasers
         for laser in self.lasers[:]:
             laser['y'] += laser['vy'] * dt
             
-            for brick in self.bricks:
-                if (brick['alive'] and
-                    brick['x'] <= laser['x'] <= brick['x'] + brick['w'] and
-                    brick['y'] <= laser['y'] <= brick['y'] + brick['h']):
-                    brick['strength'] -= 1
-                    if brick['strength'] <= 0:
-                        brick['alive'] = False
-                        self.score += 10
-                        self.total_bricks_broken += 1
-                        color = self.get_brick_color(brick)
-                        self.create_particles(brick['x'] + brick['w'] // 2, brick['y'] + brick['h'] // 2, color, 15)
-                        self.synth.create_score_point().play()
-                        self.spawn_powerup(brick['x'] + brick['w'] // 2, brick['y'] + brick['h'] // 2)
-                    self.lasers.remove(laser)
-                    break
+            brick = self.brick_grid.at(laser['x'], laser['y'])
+            if brick is not None:
+                brick['strength'] -= 1
+                if brick['strength'] <= 0:
+                    self.brick_grid.kill(brick)
+                    self.score += 10
+                    self.total_bricks_broken += 1
+                    color = self.get_brick_color(brick)
+                    self.create_particles(brick['x'] + brick['w'] // 2, brick['y'] + brick['h'] // 2, color, 15)
+                    self.synth.play("score_point")
+                    self.spawn_powerup(brick['x'] + brick['w'] // 2, brick['y'] + brick['h'] // 2)
+                self.lasers.remove(laser)
+                continue
             
             if laser['y'] < 0:
                 self.lasers.remove(laser)
@@ -3044,13 +5316,7 @@ class BreakoutSpinner(MiniGame):
                 self.combo_multiplier = 1.0
         
         # Update particles
-        for p in self.particles[:]:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] += 400 * dt
-            p['lifetime'] -= dt
-            if p['lifetime'] <= 0:
-                self.particles.remove(p)
+        self.particles.update(dt)
         
         # Update floating texts
         for ft in self.floating_texts[:]:
@@ -3065,10 +5331,6 @@ class BreakoutSpinner(MiniGame):
             if brick['hit_flash'] > 0:
                 brick['hit_flash'] -= dt
         
-        # Screen shake
-        if self.screen_shake > 0:
-            self.screen_shake -= dt
-        
         return not spinner.is_right_clicked()
     
     def get_brick_color(self, brick: dict) -> tuple:
@@ -3155,19 +5417,18 @@ class BreakoutSpinner(MiniGame):
 
     def draw(self, surface: pygame.Surface):
         """Metodo principale di disegno - Scomposto in moduli"""
-        # Calcolo shake
-        shake_x, shake_y = self._get_shake_offset()
+        # Lo screen shake lo applica la camera in composizione (CAMERA.shake)
 
         # 1. Sfondo e elementi livello
         self._draw_background_layers(surface)
         
         # 2. Elementi di gioco dinamici
-        self._draw_bricks(surface, shake_x, shake_y)
-        self._draw_powerups(surface, shake_x, shake_y)
-        self._draw_lasers(surface, shake_x, shake_y)
-        self._draw_paddle(surface, shake_x, shake_y)
-        self._draw_balls(surface, shake_x, shake_y)
-        self._draw_particles(surface, shake_x, shake_y)
+        self._draw_bricks(surface)
+        self._draw_powerups(surface)
+        self._draw_lasers(surface)
+        self._draw_paddle(surface)
+        self._draw_balls(surface)
+        self._draw_particles(surface)
         self._draw_floating_texts(surface)
         
         # 3. Interfaccia utente (HUD)
@@ -3176,13 +5437,6 @@ class BreakoutSpinner(MiniGame):
         # 4. Overlay (Pause, Level Complete, Game Over)
         self._draw_overlays(surface)
 
-    def _get_shake_offset(self):
-        """Calcola l'offset per lo screen shake"""
-        shake_x = shake_y = 0
-        if self.screen_shake > 0:
-            shake_x = random.randint(-3, 3)
-            shake_y = random.randint(-3, 3)
-        return shake_x, shake_y
 
 
 
@@ -3196,6 +5450,7 @@ class BreakoutSpinner(MiniGame):
 
 
 
+    @profiled
     def _draw_background_layers(self, surface):
         """Ultra-optimized 6-level backgrounds: No white glare, 60+fps, error-free"""
         base_color, accent_color = self._get_background_colors(self.level)
@@ -3203,15 +5458,19 @@ class BreakoutSpinner(MiniGame):
 
         star_cache = {}
 
-        for y in range(0, 720, 2):
-            factor = y / 720
-            noise1 = 18 * math.sin(self.background_wave * 1.1 + factor * 1.4)
-            noise2 = 12 * math.cos(self.background_wave * 0.9 + factor * 1.7)
-            r = max(8, min(255, int(base_color[0] + noise1 + noise2 * 0.6)))
-            g = max(8, min(255, int(base_color[1] + noise1 * 0.7 + noise2)))
-            b = max(8, min(255, int(base_color[2] + noise1 * 0.5 + noise2 * 1.2)))
-            pygame.draw.line(surface, (r, g, b), (0, y), (1280, y))
-            pygame.draw.line(surface, (max(0,r-2), max(0,g-2), max(0,b-2)), (0, y+1), (1280, y+1))
+        def gradient(t, y, phase):
+            # Coppie di righe: la seconda riga è 2 livelli più scura
+            even = y - (y % 2)
+            factor = even / 720
+            noise1 = 18 * np.sin(phase * 1.1 + factor * 1.4)
+            noise2 = 12 * np.cos(phase * 0.9 + factor * 1.7)
+            darken = (y % 2) * 2
+            return (np.maximum(8, np.trunc(base_color[0] + noise1 + noise2 * 0.6)) - darken,
+                    np.maximum(8, np.trunc(base_color[1] + noise1 * 0.7 + noise2)) - darken,
+                    np.maximum(8, np.trunc(base_color[2] + noise1 * 0.5 + noise2 * 1.2)) - darken)
+
+        GRADIENTS.draw(surface, "breakout_background", gradient, self.background_wave,
+                       quantum=0.04, palette=tuple(base_color))
 
         level_type = self.level % 6
         accent_dark = tuple(max(20, int(c * 0.75)) for c in accent_color)
@@ -3351,7 +5610,8 @@ class BreakoutSpinner(MiniGame):
 
 
 
-    def _draw_bricks(self, surface, shake_x, shake_y):
+    @profiled
+    def _draw_bricks(self, surface):
         """Disegna i mattoni usando la cache"""
         for brick in self.bricks:
             if not brick['alive']: continue
@@ -3359,31 +5619,32 @@ class BreakoutSpinner(MiniGame):
             pulse = abs(math.sin(brick['pulse'])) * 5
             brick_surf = self._get_cached_brick(color, brick['w'], brick['h'], 
                                               brick['pulse'], brick['hit_flash'])
-            surface.blit(brick_surf, (brick['x'] + shake_x, brick['y'] + shake_y - pulse))
+            surface.blit(brick_surf, (brick['x'], brick['y'] - pulse))
             
             if brick['max_strength'] > 1:
                 for i in range(brick['strength']):
                     dot_x = brick['x'] + 10 + i * 8
                     dot_y = brick['y'] + brick['h'] // 2
                     pygame.draw.circle(surface, (255, 255, 255), 
-                                     (int(dot_x) + shake_x, int(dot_y) + shake_y), 2)
+                                     (int(dot_x), int(dot_y)), 2)
 
-    def _draw_powerups(self, surface, shake_x, shake_y):
+    def _draw_powerups(self, surface):
         """Disegna i powerup cadenti"""
         for pu in self.powerups:
             pulse_size = 15 + abs(math.sin(pu['pulse'])) * 5
             pu_surf = self._get_cached_powerup(pu['type'], pu['rotation'], pulse_size)
-            x_offset = pu['x'] - pu_surf.get_width() // 2 + shake_x
-            y_offset = pu['y'] - pu_surf.get_height() // 2 + shake_y
+            x_offset = pu['x'] - pu_surf.get_width() // 2
+            y_offset = pu['y'] - pu_surf.get_height() // 2
             surface.blit(pu_surf, (x_offset, y_offset))
 
-    def _draw_lasers(self, surface, shake_x, shake_y):
+    def _draw_lasers(self, surface):
         """Disegna i laser"""
         for laser in self.lasers:
+            y = self.interpolate(laser.get('py', laser['y']), laser['y'])
             pygame.draw.rect(surface, (255, 255, 100), 
-                           (laser['x'] - 3 + shake_x, laser['y'] + shake_y, 6, 20))
+                           (laser['x'] - 3, y, 6, 20))
             pygame.draw.rect(surface, (255, 255, 255), 
-                           (laser['x'] - 2 + shake_x, laser['y'] + shake_y, 4, 20))
+                           (laser['x'] - 2, y, 4, 20))
 
 
 
@@ -3395,11 +5656,12 @@ class BreakoutSpinner(MiniGame):
 
 
 
-    def _draw_paddle(self, surface, shake_x, shake_y):
+    def _draw_paddle(self, surface):
         """Disegna il paddle con effetti"""
         pulse_offset = abs(math.sin(self.paddle_pulse)) * 3
-        paddle_rect = (self.paddle_x - self.paddle_width // 2 + shake_x, 
-                      670 - pulse_offset + shake_y, 
+        paddle_x = self.interpolate(self.prev_paddle_x, self.paddle_x)
+        paddle_rect = (paddle_x - self.paddle_width // 2, 
+                      670 - pulse_offset, 
                       self.paddle_width, 20)
         
         paddle_color = (255, 255, 255)
@@ -3413,11 +5675,12 @@ class BreakoutSpinner(MiniGame):
         
         if 'magnet' in self.active_powerups:
             for i in range(3):
-                arc_rect = (self.paddle_x - 80 + shake_x, 670 - 60 + shake_y, 160, 60)
+                arc_rect = (paddle_x - 80, 670 - 60, 160, 60)
                 pygame.draw.arc(surface, (255, 150, 255), arc_rect, 0, math.pi, 2)
 
 
-    def _draw_balls(self, surface, shake_x, shake_y):
+    @profiled
+    def _draw_balls(self, surface):
         """Disegna le palline con trail"""
         for ball in self.balls:
             # Trail
@@ -3426,7 +5689,7 @@ class BreakoutSpinner(MiniGame):
                 trail_color = (255, 255, 100) if 'fireball' not in self.active_powerups else (255, 100, 50)
                 trail_surf = pygame.Surface((12, 12), pygame.SRCALPHA)
                 pygame.draw.circle(trail_surf, (*trail_color, alpha // 2), (6, 6), 6)
-                surface.blit(trail_surf, (tx - 6 + shake_x, ty - 6 + shake_y))
+                surface.blit(trail_surf, (tx - 6, ty - 6))
             
             # Glow
             glow_color = (255, 255, 150) if 'fireball' not in self.active_powerups else (255, 150, 50)
@@ -3434,14 +5697,16 @@ class BreakoutSpinner(MiniGame):
             glow_surf = pygame.Surface((int(glow_size * 2), int(glow_size * 2)), pygame.SRCALPHA)
             pygame.draw.circle(glow_surf, (*glow_color, 40), 
                              (int(glow_size), int(glow_size)), int(glow_size))
-            surface.blit(glow_surf, (ball['x'] - glow_size + shake_x, ball['y'] - glow_size + shake_y))
+            x = self.interpolate(ball.get('px', ball['x']), ball['x'])
+            y = self.interpolate(ball.get('py', ball['y']), ball['y'])
+            surface.blit(glow_surf, (x - glow_size, y - glow_size))
             
             # Ball core
             ball_color = (255, 255, 100) if 'fireball' not in self.active_powerups else (255, 100, 50)
             pygame.draw.circle(surface, ball_color, 
-                             (int(ball['x']) + shake_x, int(ball['y']) + shake_y), 8)
+                             (int(x), int(y)), 8)
             pygame.draw.circle(surface, (255, 255, 255), 
-                             (int(ball['x']) + shake_x, int(ball['y']) + shake_y), 8, 2)
+                             (int(x), int(y)), 8, 2)
 
 
 
@@ -3453,14 +5718,9 @@ class BreakoutSpinner(MiniGame):
 
 
 
-    def _draw_particles(self, surface, shake_x, shake_y):
+    def _draw_particles(self, surface):
         """Disegna particelle"""
-        for p in self.particles:
-            alpha = int(255 * (p['lifetime'] / p['max_lifetime']))
-            p_surf = pygame.Surface((int(p['size'] * 2), int(p['size'] * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(p_surf, (*p['color'], alpha), 
-                             (int(p['size']), int(p['size'])), int(p['size']))
-            surface.blit(p_surf, (p['x'] - p['size'] + shake_x, p['y'] - p['size'] + shake_y))
+        self.particles.draw(surface)
 
     def _draw_floating_texts(self, surface):
         """Disegna testi fluttuanti"""
@@ -3482,7 +5742,7 @@ class BreakoutSpinner(MiniGame):
             overlay.fill((0, 0, 0, 100))
             surface.blit(overlay, (0, 0))
             
-            complete_text = self.font_pause.render(f"LEVEL {self.level} COMPLETE!", True, (255, 215, 0))
+            complete_text = TEXT.render(self.font_pause, f"LEVEL {self.level} COMPLETE!", True, (255, 215, 0))
             surface.blit(complete_text, (640 - complete_text.get_width() // 2, 300))
         
         # Game Over
@@ -3491,10 +5751,10 @@ class BreakoutSpinner(MiniGame):
             overlay.fill((0, 0, 0, 180))
             surface.blit(overlay, (0, 0))
             
-            win_text = self.font_pause.render("YOU WIN!", True, (255, 215, 0))
+            win_text = TEXT.render(self.font_pause, "YOU WIN!", True, (255, 215, 0))
             surface.blit(win_text, (640 - win_text.get_width() // 2, 250))
             
-            final_score = self.font_level.render(f"Final Score: {self.score}", True, (255, 255, 255))
+            final_score = TEXT.render(self.font_level, f"Final Score: {self.score}", True, (255, 255, 255))
             surface.blit(final_score, (640 - final_score.get_width() // 2, 350))
 
 
@@ -3524,6 +5784,7 @@ class BreakoutSpinner(MiniGame):
 
 
 
+    @profiled
     def draw_hud(self, surface: pygame.Surface):
         """HUD 90s definitivo: visibile, trasparente, centrato, NO bug, completo."""
         
@@ -3544,20 +5805,14 @@ class BreakoutSpinner(MiniGame):
         
         # === SCORE sinistra ===
         score_str = f"SCORE {self.score:,}"
-        score_text = font_main.render(score_str, True, (245, 245, 255))
-        score_glow = font_main.render(score_str, True, (140, 160, 220))
-        score_glow.set_alpha(120)
-        surface.blit(score_glow, (32, center_y - score_text.get_height()//2 + 1))
-        surface.blit(score_text, (30, center_y - score_text.get_height()//2))
+        score_text = TEXT.shadowed(font_main, score_str, (245, 245, 255), (140, 160, 220), (2, 1), 120)
+        surface.blit(score_text, (30, center_y - font_main.get_height()//2))
         
         # === LEVEL centro ===
         level_str = f"L {self.level}/{self.max_level}"
-        level_text = font_main.render(level_str, True, (255, 235, 140))
-        level_glow = font_main.render(level_str, True, (210, 180, 90))
-        level_glow.set_alpha(110)
-        tx = 640 - level_text.get_width() // 2
-        surface.blit(level_glow, (tx + 2, center_y - level_text.get_height()//2 + 1))
-        surface.blit(level_text, (tx, center_y - level_text.get_height()//2))
+        level_text = TEXT.shadowed(font_main, level_str, (255, 235, 140), (210, 180, 90), (2, 1), 110)
+        tx = 640 - (level_text.get_width() - 2) // 2
+        surface.blit(level_text, (tx, center_y - font_main.get_height()//2))
         
         # === LIVES cuori perfetti (spazio 26px) ===
         for i in range(self.lives):
@@ -3567,17 +5822,15 @@ class BreakoutSpinner(MiniGame):
         # === COMBO visibile SEMPRE se >0 (spazio dedicato 1150 centro) ===
         if self.combo > 0:
             combo_str = f"{self.combo}x"
-            combo_text = self.font_combo.render(combo_str, True, (255, 255, 160))
-            combo_glow = self.font_combo.render(combo_str, True, (180, 220, 255))
-            combo_glow.set_alpha(130)
-            cx = 1150 - combo_text.get_width() // 2
-            surface.blit(combo_glow, (cx + 1, center_y - combo_text.get_height()//2 + 1))
-            surface.blit(combo_text, (cx, center_y - combo_text.get_height()//2))
+            combo_text = TEXT.shadowed(self.font_combo, combo_str, (255, 255, 160), (180, 220, 255), (1, 1), 130)
+            text_w = combo_text.get_width() - 1
+            cx = 1150 - text_w // 2
+            surface.blit(combo_text, (cx, center_y - self.font_combo.get_height()//2))
             
             # Timer barra orizzontale sotto (visibile)
             ratio = max(0, self.combo_timer / 2.0)
             bar_x = cx - 8
-            bar_w = combo_text.get_width() + 16
+            bar_w = text_w + 16
             pygame.draw.rect(surface, (50, 50, 70, 160), (bar_x, center_y + 12, bar_w, 3))
             fill_w = int(bar_w * ratio)
             bar_col = (255, 255, 100) if ratio > 0.5 else (255, 200, 80)
@@ -3616,7 +5869,7 @@ class BreakoutSpinner(MiniGame):
         overlay.fill((0, 0, 0, 180))
         surface.blit(overlay, (0, 0))
         
-        pause_text = self.font_pause.render("PAUSED", True, (255, 255, 255))
+        pause_text = TEXT.render(self.font_pause, "PAUSED", True, (255, 255, 255))
         surface.blit(pause_text, (640 - pause_text.get_width() // 2, 150))
         
         # Stats panel
@@ -3630,13 +5883,13 @@ class BreakoutSpinner(MiniGame):
         
         y = 280
         for stat in stats:
-            stat_text = self.font_combo.render(stat, True, (255, 255, 255))
+            stat_text = TEXT.render(self.font_combo, stat, True, (255, 255, 255))
             surface.blit(stat_text, (640 - stat_text.get_width() // 2, y))
             y += 40
         
         # Buttons
-        exit_text = self.font_level.render("LEFT CLICK - Exit", True, (255, 100, 100))
-        continue_text = self.font_level.render("RIGHT CLICK - Continue", True, (100, 255, 100))
+        exit_text = TEXT.render(self.font_level, "LEFT CLICK - Exit", True, (255, 100, 100))
+        continue_text = TEXT.render(self.font_level, "RIGHT CLICK - Continue", True, (100, 255, 100))
         
         surface.blit(exit_text, (640 - exit_text.get_width() // 2, 550))
         surface.blit(continue_text, (640 - continue_text.get_width() // 2, 600))
@@ -3656,6 +5909,7 @@ class Kaleidoscope(MiniGame):
 
     BLEND_ADD = 1
     BLEND_MULT = 4
+    min_dynamic_scale = 0.7  # specchi e bloom seguono dynamic_scale
     
     def __init__(self, synth: SoundSynthesizer):
         super().__init__()
@@ -3683,6 +5937,7 @@ class Kaleidoscope(MiniGame):
         
         self.buf_cx = buf_size // 2
         self.buf_cy = buf_size // 2
+        self._bloom_layer = None  # layer del bloom a risoluzione dinamica ridotta
         
         # FONTS
         self.font_pause = pygame.font.Font(None, 80)
@@ -3757,6 +6012,7 @@ class Kaleidoscope(MiniGame):
                 new_grid[y][x] = sum_n / count * 0.95
         self.liquid = new_grid
 
+    @profiled
     def render_liquid(self, surf: pygame.Surface, cx: int, cy: int):
         surf.fill((0, 0, 0, 0))
         cell = 512 / self.liquid_size
@@ -3770,6 +6026,7 @@ class Kaleidoscope(MiniGame):
                 size = int(cell * 0.5)
                 pygame.draw.circle(surf, (*color, 180), (int(px), int(py)), size)
 
+    @profiled
     def render_particle_layer(self, surf: pygame.Surface, cx: int, cy: int):
         surf.fill((0,0,0,0))
         scale = 260
@@ -3782,6 +6039,7 @@ class Kaleidoscope(MiniGame):
             cc = self._hsv2rgb(ch, p['sat'], 0.75 * l + 0.5)
             pygame.draw.circle(surf, (*cc, int(220 * l)), (px, py), s)
 
+    @profiled
     def render_mandala_simple(self, surf: pygame.Surface, cx: int, cy: int):
         surf.fill((0, 0, 0, 0))
         for r in range(8):
@@ -3818,17 +6076,23 @@ class Kaleidoscope(MiniGame):
 
     def update(self, dt: float, spinner_delta: float, spinner: SpinnerInput) -> bool:
         if self.paused:
-            return spinner.is_left_clicked() and (self.synth.create_back().play() or False)
+            STREAM.set(gain=0.0)
+            return spinner.is_left_clicked() and (self.synth.play("back") or False)
         
         if spinner.is_right_clicked():
             self.paused = not self.paused
-            if not self.paused: self.synth.create_select().play()
+            if not self.paused: self.synth.play("select")
             return True
 
-        if abs(spinner_delta) < 0.01: return True
+        if abs(spinner_delta) < 0.01:
+            STREAM.set(gain=0.0)
+            return True
         
         self.time += dt
         self.global_hue += dt * 28 * abs(spinner_delta)
+        # Drone che segue la tinta (due ottave sul giro di colore) e si apre con la velocita'
+        STREAM.set(freq=110.0 * 2 ** ((self.global_hue % 360) / 180.0), gain=0.12,
+                   brightness=min(1.0, abs(spinner_delta) / 20.0))
         self.rotation_master += spinner_delta * dt * 120
         self.zoom_pulse = 0.92 + 0.16 * (math.sin(self.time * 3.5) ** 2)
         
@@ -3842,11 +6106,11 @@ class Kaleidoscope(MiniGame):
         ov.fill((0,0,0,220))
         surface.blit(ov, (0,0))
         
-        t = self.font_pause.render("PAUSED", True, (200,255,200))
+        t = TEXT.render(self.font_pause, "PAUSED", True, (200,255,200))
         surface.blit(t, (self.cx-t.get_width()//2, 160))
         
         for i, txt in enumerate([f"L/R Click: Resume/Exit", f"T:{int(self.time)}s", f"P:{self.num_particles}"]):
-            t = self.font_stats.render(txt, True, (150,220,150))
+            t = TEXT.render(self.font_stats, txt, True, (150,220,150))
             surface.blit(t, (self.cx-t.get_width()//2, 450+i*32))
 
     def draw(self, surface: pygame.Surface):
@@ -3873,20 +6137,35 @@ class Kaleidoscope(MiniGame):
             self.render_mandala_simple(self.buffer_2, self.buf_cx, self.buf_cy)
             self.buffer_1.blit(self.buffer_2, (0,0), special_flags=self.BLEND_ADD)
         
-        effect = self._mirrors_fast(self.buffer_1)
+        res = self.dynamic_scale
+        effect = self._mirrors_fast(self.buffer_1, int(1200 * res))
         
         # FULL OVERLAP BLOOM (pad hides edges)
+        # Risoluzione dinamica < 100%: il bloom si compone in un layer ridotto, poi un solo upscale
+        if res < 1.0:
+            size = (int(self.screen_w * res), int(self.screen_h * res))
+            if self._bloom_layer is None or self._bloom_layer.get_size() != size:
+                self._bloom_layer = pygame.Surface(size)
+            target = self._bloom_layer
+            target.fill((0, 0, 0))
+        else:
+            target = surface
+        tcx, tcy = self.cx * res, self.cy * res
         scales = [1.3, 1.6]  # Slightly larger for coverage
         alphas = [200, 140]
         for scale, alpha in zip(scales, alphas):
-            b = pygame.transform.smoothscale(effect, (int(1200*scale), int(1200*scale)))
+            b = pygame.transform.smoothscale(effect, (int(1200*scale*res), int(1200*scale*res)))
             b.set_alpha(alpha)
-            bx = self.cx - b.get_width()//2
-            by = self.cy - b.get_height()//2
-            surface.blit(b, (int(bx), int(by)), special_flags=self.BLEND_ADD)
+            bx = tcx - b.get_width()//2
+            by = tcy - b.get_height()//2
+            target.blit(b, (int(bx), int(by)), special_flags=self.BLEND_ADD)
+        if target is not surface:
+            surface.blit(pygame.transform.smoothscale(target, (self.screen_w, self.screen_h)), (0, 0),
+                         special_flags=self.BLEND_ADD)
 
 
-    def _mirrors_fast(self, inp: pygame.Surface) -> pygame.Surface:
+    @profiled
+    def _mirrors_fast(self, inp: pygame.Surface, size: int = 1200) -> pygame.Surface:
         out = self.buffer_2
         out.fill((0, 0, 0, 0))
         
@@ -3921,7 +6200,7 @@ class Kaleidoscope(MiniGame):
             blit_func(w_surf, wr.topleft, special_flags=blend_mode)
         
         # Nota: smoothscale è comunque lento, ma necessario per il risultato finale
-        return pygame.transform.smoothscale(out, (1200, 1200))
+        return pygame.transform.smoothscale(out, (size, size))
 
 
 
@@ -4003,11 +6282,11 @@ class YahtzeeSpinner(MiniGame):
         self.roll_animation = 0
         
         # Visual
-        self.particles = []
+        self.particles = ParticleSystem()
         self.floating_texts = []
-        self.screen_shake = 0
         self.time = 0
         self.bg_wave = 0
+        self._dirty_state = None  # (chiave di HUD/tabellone, zone animate) all'ultimo frame
         
         # Fonts
         self.font_huge = pygame.font.Font(None, 68)
@@ -4046,9 +6325,8 @@ class YahtzeeSpinner(MiniGame):
         self.phase = 'roll'
         self.paused = False
         self.roll_animation = 0
-        self.particles = []
+        self.particles = ParticleSystem()
         self.floating_texts = []
-        self.screen_shake = 0
         self.time = 0
         self.bg_wave = 0
         
@@ -4116,10 +6394,10 @@ class YahtzeeSpinner(MiniGame):
         # Effetti proporzionali
         particles = 20 + len(free_dice_indices) * 15
         self.create_particles(640, 420, (255, 255, 100), particles)
-        self.screen_shake = min(0.2 + len(free_dice_indices)*0.08, 0.4)
+        CAMERA.shake(6, min(0.2 + len(free_dice_indices)*0.08, 0.4))
         
         if self.synth:
-            self.synth.create_score_point().play()
+            self.synth.play("score_point")
         
         # Prossima fase
         if self.rolls_left == 0:
@@ -4211,26 +6489,26 @@ class YahtzeeSpinner(MiniGame):
                 self.upper_bonus = 35
                 self.create_floating_text(640, 300, "BONUS +35!", (255, 215, 0))
                 if self.synth:
-                    self.synth.create_high_score().play()
+                    self.synth.play("high_score")
         else:
             self.lower_total += points
             if cat_id == 'yahtzee' and points == 50:
                 self.create_floating_text(640, 360, "YAHTZEE!!!", (255, 50, 50))
-                self.screen_shake = 0.6
+                CAMERA.shake(6, 0.6)
                 if self.synth:
-                    self.synth.create_level_complete().play()
+                    self.synth.play("level_complete")
         
         self.score = self.upper_total + self.upper_bonus + self.lower_total
         
         if self.synth:
-            self.synth.create_powerup().play()
+            self.synth.play("powerup")
         
         # Controlla se partita finita (ora turn parte da 0 e arriva a 13 dopo ultima categoria)
         if self.turn >= 13:  # ← Corretto: 13 categorie = turn 13 dopo ultima
             self.game_over = True
             self.create_floating_text(640, 400, "GAME COMPLETE!", (255, 215, 0))
             if self.synth:
-                self.synth.create_game_over().play()
+                self.synth.play("game_over")
         else:
             # Reset per nuovo turno
             self.rolls_left = 3
@@ -4244,18 +6522,8 @@ class YahtzeeSpinner(MiniGame):
 
     
     def create_particles(self, x: float, y: float, color: tuple, count: int):
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(120, 300)
-            self.particles.append({
-                'x': x, 'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.uniform(0.5, 1.2),
-                'max_life': 1.2,
-                'color': color,
-                'size': random.uniform(3, 8)
-            })
+        self.particles.emit(x, y, count, color, speed=(120, 300), life=(0.5, 1.2),
+                            max_life=1.2, size=(3, 8), gravity=500)
     
     def create_floating_text(self, x: float, y: float, text: str, color: tuple):
         self.floating_texts.append({
@@ -4278,7 +6546,8 @@ class YahtzeeSpinner(MiniGame):
             return not spinner.is_right_clicked()
         
         self.time += dt
-        self.bg_wave += dt * 0.5
+        if not self.dirty_mode:  # sfondo fermo in modalita' dirty-rect
+            self.bg_wave += dt * 0.5
         
         # Pause
         if spinner.is_right_clicked() and not self.paused:
@@ -4288,13 +6557,13 @@ class YahtzeeSpinner(MiniGame):
         if self.paused:
             if spinner.is_left_clicked():
                 if self.synth:
-                    self.synth.create_back().play()
+                    self.synth.play("back")
                 self.game_over = True
                 return False
             if spinner.is_right_clicked():
                 self.paused = False
                 if self.synth:
-                    self.synth.create_select().play()
+                    self.synth.play("select")
             return True
         
         # Animazioni
@@ -4325,7 +6594,7 @@ class YahtzeeSpinner(MiniGame):
                 self.selected_die = (self.selected_die + direction) % 5
                 
                 if old != self.selected_die and self.synth:
-                    self.synth.create_wall_bounce().play()
+                    self.synth.play("wall_bounce")
                     self.create_particles(90 + self.selected_die * 220 + 70, 420 + 70, (255, 255, 100), 15)
                 
                 self.spinner_accumulator -= direction * self.spinner_select_threshold  # Rimuovi step consumato
@@ -4347,7 +6616,7 @@ class YahtzeeSpinner(MiniGame):
                     self.left_hold_timer = 0.0
                     self.click_registered = False
                     if self.synth:
-                        self.synth.create_select().play()
+                        self.synth.play("select")
                     self.create_particles(640, 620, (100, 255, 255), 35)
                 
                 elif self.left_hold_timer < 0.2 and not self.click_registered:
@@ -4359,8 +6628,7 @@ class YahtzeeSpinner(MiniGame):
                     if self.click_registered:
                         self.dice_held[self.selected_die] = not self.dice_held[self.selected_die]
                         if self.synth:
-                            sound = self.synth.create_powerup() if self.dice_held[self.selected_die] else self.synth.create_hit()
-                            sound.play()
+                            self.synth.play("powerup" if self.dice_held[self.selected_die] else "hit")
                         
                         die_x = 90 + self.selected_die * 220
                         die_y = 420
@@ -4369,7 +6637,7 @@ class YahtzeeSpinner(MiniGame):
                         
                         if all(self.dice_held):
                             if self.synth:
-                                self.synth.create_select().play()
+                                self.synth.play("select")
                 
                 self.left_hold_timer = 0.0
                 self.click_registered = False
@@ -4388,7 +6656,7 @@ class YahtzeeSpinner(MiniGame):
                 self.selected_category = (self.selected_category + direction) % 13
                 
                 if old != self.selected_category and self.synth:
-                    self.synth.create_wall_bounce().play()
+                    self.synth.play("wall_bounce")
                     # Particelle opzionali per feedback visivo
                     self.create_particles(640, 200 + self.selected_category * 30, (255, 255, 100), 12)
                 
@@ -4400,18 +6668,12 @@ class YahtzeeSpinner(MiniGame):
                 if cat_id not in self.scores:
                     self.score_category(cat_id)
                     if self.synth:
-                        self.synth.create_select().play()
+                        self.synth.play("select")
                     self.create_particles(640, 300, (100, 255, 255), 25)
                     # Transizione automatica? self.phase = 'next_turn' o simile
 
         # Update effects
-        for p in self.particles[:]:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] += 500 * dt
-            p['life'] -= dt
-            if p['life'] <= 0:
-                self.particles.remove(p)
+        self.particles.update(dt)
         
         for ft in self.floating_texts[:]:
             ft['y'] += ft['vy'] * dt
@@ -4419,9 +6681,6 @@ class YahtzeeSpinner(MiniGame):
             if ft['life'] <= 0:
                 self.floating_texts.remove(ft)
         
-        if self.screen_shake > 0:
-            self.screen_shake -= dt
-        
         return True
         
 
@@ -4516,12 +6775,46 @@ class YahtzeeSpinner(MiniGame):
 
 
 
-    def _draw_scorecard(self, surface, sx, sy):
+    HUD_RECT = pygame.Rect(0, 0, 1280, 110)  # turno, tiri, punteggio e indicatore di fase
+    SCORECARD_RECT = pygame.Rect(250, 120, 780, 320)
+    
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Fase scoring: HUD e tabellone solo quando cambiano, piu' particelle e testi fluttuanti
+        (nuove e vecchie zone). Nelle altre fasi dadi e barre si animano: None, confronta il display"""
+        if self.phase != 'scoring' or self.paused or self.game_over:
+            self._dirty_state = None
+            return None
+        key = (self.selected_category, tuple(sorted(self.scores.items())), self.score, self.turn)
+        moving = []
+        particles = self.particles.bounds()
+        if particles is not None:
+            moving.append(particles)
+        for ft in self.floating_texts:
+            w, h = self.font_large.size(ft['text'])
+            moving.append(pygame.Rect(int(ft['x'] - w // 2) - 1, int(ft['y']) - 1, w + 2, h + 2))
+        previous, self._dirty_state = self._dirty_state, (key, moving)
+        if previous is None:
+            return None
+        rects = moving + previous[1]
+        if key != previous[0]:
+            rects += [self.HUD_RECT, self.SCORECARD_RECT]
+        return rects
+    
+    @profiled
+    def _draw_scorecard(self, surface):
+        """Scorecard dal layer cache: si ridisegna solo se cambiano dadi, punteggi o selezione"""
+        card_w, card_h = 780, 320
+        selected = self.selected_category if self.phase == 'scoring' else None
+        key = (selected, tuple(self.dice), tuple(sorted(self.scores.items())), self.upper_bonus)
+        LAYERS.draw(surface, "yahtzee.scorecard", key, self._build_scorecard,
+                    ((1280 - card_w) // 2, 120, card_w, card_h))
+
+    def _build_scorecard(self, surface):
         """Scorecard minimalista con colonna DADI, Upper colorato, senza TOTAL e senza header"""
 
         card_w, card_h = 780, 320
-        x = (1280 - card_w) // 2 + sx
-        y = 120 + sy
+        x = (1280 - card_w) // 2
+        y = 120
 
         pygame.draw.rect(surface, (255,255,255),
                         (x,y,card_w,card_h), border_radius=6)
@@ -4575,8 +6868,8 @@ class YahtzeeSpinner(MiniGame):
                 dcol = (110,110,110)
 
             # category + description
-            surface.blit(self.font_tiny.render(cat_name.upper(),True,ccol),(col_cat,ty))
-            surface.blit(self.font_tiny.render(desc_map[cat_id],True,dcol),(col_desc,ty))
+            surface.blit(TEXT.render(self.font_tiny, cat_name.upper(),True,ccol),(col_cat,ty))
+            surface.blit(TEXT.render(self.font_tiny, desc_map[cat_id],True,dcol),(col_desc,ty))
 
             # ---- DICE COLUMN ----
             dice_used = self._dice_used_for_category(cat_id, self.dice)
@@ -4589,7 +6882,7 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.rect(surface,(120,120,120),rect,1,border_radius=3)
 
                 # pip = valore del dado
-                pip = self.font_tiny.render(str(val),True,(30,30,30))
+                pip = TEXT.render(self.font_tiny, str(val),True,(30,30,30))
                 surface.blit(pip,(rect.centerx-pip.get_width()//2,
                                 rect.centery-pip.get_height()//2))
 
@@ -4605,7 +6898,7 @@ class YahtzeeSpinner(MiniGame):
             box = pygame.Rect(col_score, ry+3, 70, row_h-6)
             pygame.draw.rect(surface,bg,box,border_radius=4)
             pygame.draw.rect(surface,fg,box,1,border_radius=4)
-            txt = self.font_tiny.render(str(pts),True,fg)
+            txt = TEXT.render(self.font_tiny, str(pts),True,fg)
             surface.blit(txt,(box.centerx-txt.get_width()//2,ty))
 
         # ---- BONUS ----
@@ -4614,25 +6907,20 @@ class YahtzeeSpinner(MiniGame):
                         (x+12,by),(x+card_w-12,by),1)
 
         if self.upper_bonus:
-            b = self.font_tiny.render(f"UPPER BONUS +{self.upper_bonus}",True,(50,50,50))
+            b = TEXT.render(self.font_tiny, f"UPPER BONUS +{self.upper_bonus}",True,(50,50,50))
             surface.blit(b,(x+card_w//2-b.get_width()//2,by+4))
 
 
 
 
 
+    @profiled
     def _draw_background(self, surface):
         w, h = 1280, 720
         theme_id = self.turn % 13
         
         if theme_id == 0:  # NEON GRID (cyberpunk)
-            surface.fill((5, 5, 15))
-            for y in range(h):
-                t = y / h
-                r = int(10 + 40 * t)
-                g = int(5 + 10 * t)
-                b = int(40 + 120 * t)
-                pygame.draw.line(surface, (r, g, b), (0, y), (w, y))
+            GRADIENTS.draw(surface, "yahtzee_0", lambda t, y, p: (10 + 40 * t, 5 + 10 * t, 40 + 120 * t))
             
             horizon_y = int(h * 0.45)
             spacing = 40
@@ -4648,6 +6936,8 @@ class YahtzeeSpinner(MiniGame):
             radius = 80 + int(math.sin(self.bg_wave * 0.7) * 6)
             pygame.draw.circle(surface, (255, 140, 200), (w // 2, horizon_y - 60), radius, 4)
             
+            if self.dirty_mode:  # stelle fisse come negli altri temi, altrimenti cambia tutto il cielo
+                random.seed(1010)
             for _ in range(30):
                 x = random.randint(0, w)
                 y = random.randint(0, horizon_y)
@@ -4655,13 +6945,7 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.circle(surface, (pulse, pulse//2, 255), (x, y), 1)
         
         elif theme_id == 1:  # SPAZIO PROFONDO
-            surface.fill((4, 6, 12))
-            for y in range(h):
-                t = y / h
-                r = int(10 + 40 * (1 - t))
-                g = int(10 + 20 * t)
-                b = int(30 + 80 * t)
-                pygame.draw.line(surface, (r, g, b), (0, y), (w, y))
+            GRADIENTS.draw(surface, "yahtzee_1", lambda t, y, p: (10 + 40 * (1 - t), 10 + 20 * t, 30 + 80 * t))
             
             random.seed(1234)
             for _ in range(180):
@@ -4677,13 +6961,11 @@ class YahtzeeSpinner(MiniGame):
                     pygame.draw.circle(surface, col, (int(cx), int(cy)), r, 2)
         
         elif theme_id == 2:  # GRADIENT MORBIDO + PARTICELLE
-            for y in range(h):
-                t = y / h
-                wave = math.sin(self.bg_wave + t * 6) * 0.1
-                r = int(20 + 60 * (t + wave))
-                g = int(30 + 80 * (1 - t + wave))
-                b = int(50 + 90 * t)
-                pygame.draw.line(surface, (r, g, b), (0, y), (w, y))
+            def gradient(t, y, phase):
+                wave = np.sin(phase + t * 6) * 0.1
+                return 20 + 60 * (t + wave), 30 + 80 * (1 - t + wave), 50 + 90 * t
+
+            GRADIENTS.draw(surface, "yahtzee_2", gradient, self.bg_wave % (math.pi * 2), quantum=0.05)
             
             random.seed(5678)
             for i in range(60):
@@ -4694,13 +6976,11 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.circle(surface, (200, 230, 255), (base_x, base_y + off_y), size, 1)
         
         elif theme_id == 3:  # LAVA/FUOCO
-            for y in range(h):
-                t = y / h
-                wave = math.sin(self.bg_wave*1.5 + y * 0.01) * 0.15
-                r = int(120 + 135 * (t + wave))
-                g = int(20 + 60 * (1 - t))
-                b = int(5)
-                pygame.draw.line(surface, (min(255, r), max(0, g), b), (0, y), (w, y))
+            def gradient(t, y, phase):
+                wave = np.sin(phase + y * 0.01) * 0.15
+                return 120 + 135 * (t + wave), 20 + 60 * (1 - t), 5
+
+            GRADIENTS.draw(surface, "yahtzee_3", gradient, (self.bg_wave * 1.5) % (math.pi * 2), quantum=0.02)
             
             random.seed(3333)
             for _ in range(40):
@@ -4715,12 +6995,7 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.line(surface, (255, 150, 0), (x, int(h*0.7)), (x + 40, h), 2)
         
         elif theme_id == 4:  # FORESTA MISTICA (verde)
-            for y in range(h):
-                t = y / h
-                r = int(10 + 30 * t)
-                g = int(40 + 80 * t)
-                b = int(20 + 40 * t)
-                pygame.draw.line(surface, (r, g, b), (0, y), (w, y))
+            GRADIENTS.draw(surface, "yahtzee_4", lambda t, y, p: (10 + 30 * t, 40 + 80 * t, 20 + 40 * t))
             
             random.seed(4444)
             for _ in range(100):
@@ -4739,11 +7014,7 @@ class YahtzeeSpinner(MiniGame):
                     pygame.draw.circle(surface, (20, 100, 40), (x, y), width//2)
         
         elif theme_id == 5:  # TECH CIRCUITI (matrix verde)
-            surface.fill((0, 8, 0))
-            for y in range(h):
-                t = y / h
-                g = int(10 + 40 * t)
-                pygame.draw.line(surface, (0, g, 0), (0, y), (w, y))
+            GRADIENTS.draw(surface, "yahtzee_5", lambda t, y, p: (0, 10 + 40 * t, 0))
             
             random.seed(5555)
             for _ in range(50):
@@ -4760,13 +7031,11 @@ class YahtzeeSpinner(MiniGame):
                     pygame.draw.rect(surface, (0, brightness, 0), (x, j, 2, 2))
         
         elif theme_id == 6:  # OCEANO PROFONDO
-            for y in range(h):
-                t = y / h
-                wave = math.sin(self.bg_wave + y * 0.008) * 0.1
-                r = int(5 + 20 * t)
-                g = int(40 + 80 * (t + wave))
-                b = int(100 + 155 * t)
-                pygame.draw.line(surface, (r, min(255, g), b), (0, y), (w, y))
+            def gradient(t, y, phase):
+                wave = np.sin(phase + y * 0.008) * 0.1
+                return 5 + 20 * t, 40 + 80 * (t + wave), 100 + 155 * t
+
+            GRADIENTS.draw(surface, "yahtzee_6", gradient, self.bg_wave % (math.pi * 2), quantum=0.05)
             
             random.seed(6666)
             for _ in range(80):
@@ -4783,12 +7052,7 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.circle(surface, (50, 150, 200), (x, y), 20, 2)
         
         elif theme_id == 7:  # AURORA BOREALE
-            for y in range(h):
-                t = y / h
-                r = int(10 + 40 * (1-t))
-                g = int(5 + 30 * t)
-                b = int(20 + 60 * t)
-                pygame.draw.line(surface, (r, g, b), (0, y), (w, y))
+            GRADIENTS.draw(surface, "yahtzee_7", lambda t, y, p: (10 + 40 * (1 - t), 5 + 30 * t, 20 + 60 * t))
             
             for band in range(4):
                 base_y = int(h * (0.2 + band * 0.15))
@@ -4809,17 +7073,13 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.circle(surface, (200, 200, 220), (x, y), 1)
         
         elif theme_id == 8:  # DESERTO TRAMONTO
-            for y in range(h):
-                t = y / h
-                if t < 0.5:
-                    r = int(255 - 50 * t)
-                    g = int(180 - 100 * t)
-                    b = int(100 - 80 * t)
-                else:
-                    r = int(200 - 150 * (t-0.5))
-                    g = int(120 - 80 * (t-0.5))
-                    b = int(40 + 40 * (t-0.5))
-                pygame.draw.line(surface, (r, g, b), (0, y), (w, y))
+            def gradient(t, y, phase):
+                top = t < 0.5
+                return (np.where(top, 255 - 50 * t, 200 - 150 * (t - 0.5)),
+                        np.where(top, 180 - 100 * t, 120 - 80 * (t - 0.5)),
+                        np.where(top, 100 - 80 * t, 40 + 40 * (t - 0.5)))
+
+            GRADIENTS.draw(surface, "yahtzee_8", gradient)
             
             sun_y = int(h * 0.35)
             for r in range(100, 20, -5):
@@ -4836,13 +7096,11 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.line(surface, (140, 100, 50), dune_points[i], dune_points[i+1], 3)
         
         elif theme_id == 9:  # TEMPESTA ELETTRICA (viola)
-            for y in range(h):
-                t = y / h
-                wave = math.sin(self.bg_wave*2 + y*0.01) * 0.1
-                r = int(40 + 60 * (t + wave))
-                g = int(10 + 30 * t)
-                b = int(60 + 100 * (t + wave))
-                pygame.draw.line(surface, (min(255, r), g, min(255, b)), (0, y), (w, y))
+            def gradient(t, y, phase):
+                wave = np.sin(phase + y * 0.01) * 0.1
+                return 40 + 60 * (t + wave), 10 + 30 * t, 60 + 100 * (t + wave)
+
+            GRADIENTS.draw(surface, "yahtzee_9", gradient, (self.bg_wave * 2) % (math.pi * 2), quantum=0.03)
             
             random.seed(9999)
             for _ in range(8):
@@ -4866,12 +7124,7 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.circle(surface, (pulse, pulse//2, 255), (x, y), 2)
         
         elif theme_id == 10:  # CRISTALLI GHIACCIO
-            for y in range(h):
-                t = y / h
-                r = int(180 + 75 * t)
-                g = int(220 + 35 * t)
-                b = 255
-                pygame.draw.line(surface, (r, g, b), (0, y), (w, y))
+            GRADIENTS.draw(surface, "yahtzee_10", lambda t, y, p: (180 + 75 * t, 220 + 35 * t, 255))
             
             random.seed(10101)
             for _ in range(25):
@@ -4893,14 +7146,13 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.circle(surface, (sparkle, sparkle, 255), (x, y), 1)
         
         elif theme_id == 11:  # PSICHEDELICO
-            for y in range(h):
-                t = y / h
-                wave1 = math.sin(self.bg_wave + t * 10) * 0.5
-                wave2 = math.cos(self.bg_wave*1.3 + t * 8) * 0.5
-                r = int(128 + 127 * wave1)
-                g = int(128 + 127 * wave2)
-                b = int(128 + 127 * math.sin(self.bg_wave*0.7 + t*12))
-                pygame.draw.line(surface, (r, g, b), (0, y), (w, y))
+            def gradient(t, y, phase):
+                wave1 = np.sin(phase + t * 10) * 0.5
+                wave2 = np.cos(phase * 1.3 + t * 8) * 0.5
+                return 128 + 127 * wave1, 128 + 127 * wave2, 128 + 127 * np.sin(phase * 0.7 + t * 12)
+
+            # Fasi non commensurabili: niente modulo, quantum piccolo (colori ad alta escursione)
+            GRADIENTS.draw(surface, "yahtzee_11", gradient, self.bg_wave, quantum=0.02)
             
             for ring in range(1, 8):
                 radius = ring * 60 + int(math.sin(self.bg_wave + ring) * 20)
@@ -4919,13 +7171,13 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.circle(surface, col, (x, y), size)
         
         else:  # theme_id == 12: MINIMALISTA SCURO
-            surface.fill((12, 18, 32))
-            for y in range(0, 720, 3):
-                wave = math.sin(self.bg_wave + y * 0.006) * 12
-                r = int(12 + wave)
-                g = int(18 + wave * 0.9)
-                b = int(32 + wave * 1.1)
-                pygame.draw.line(surface, (max(0,r), max(0,g), max(0,b)), (0, y), (1280, y), 3)
+            def gradient(t, y, phase):
+                # Bande da 3 righe centrate su multipli di 3
+                band = ((y + 1) // 3) * 3
+                wave = np.sin(phase + band * 0.006) * 12
+                return np.trunc(12 + wave), np.trunc(18 + wave * 0.9), np.trunc(32 + wave * 1.1)
+
+            GRADIENTS.draw(surface, "yahtzee_12", gradient, self.bg_wave % (math.pi * 2), quantum=0.05)
 
 
 
@@ -4937,17 +7189,12 @@ class YahtzeeSpinner(MiniGame):
 
 
     def draw(self, surface: pygame.Surface):
-        shake_x, shake_y = 0, 0
-        if self.screen_shake > 0:
-            shake_x = random.randint(-6, 6)
-            shake_y = random.randint(-6, 6)
-        
         self._draw_background(surface)
         self._draw_hud(surface)
-        self._draw_scorecard(surface, shake_x, shake_y)
+        self._draw_scorecard(surface)
         self._draw_phase_indicator(surface)
-        self._draw_dice(surface, shake_x, shake_y)
-        self._draw_particles(surface, shake_x, shake_y)
+        self._draw_dice(surface)
+        self._draw_particles(surface)
         self._draw_floating_texts(surface)
         
         if self.paused:
@@ -4961,14 +7208,14 @@ class YahtzeeSpinner(MiniGame):
 
 
     def _draw_hud(self, surface):
-        turn = self.font_small.render(f"Turn {self.turn+1}/13", True, (180, 200, 255))
+        turn = TEXT.render(self.font_small, f"Turn {self.turn+1}/13", True, (180, 200, 255))
         surface.blit(turn, (25, 20))
         
         rolls_col = (120, 255, 120) if self.rolls_left > 0 else (255, 120, 120)
-        rolls = self.font_small.render(f"Rolls: {self.rolls_left}/3", True, rolls_col)
+        rolls = TEXT.render(self.font_small, f"Rolls: {self.rolls_left}/3", True, rolls_col)
         surface.blit(rolls, (25, 48))
         
-        score = self.font_large.render(f"SCORE: {self.score}", True, (255, 255, 100))
+        score = TEXT.render(self.font_large, f"SCORE: {self.score}", True, (255, 255, 100))
         surface.blit(score, (640 - score.get_width()//2, 18))
             
 
@@ -4992,7 +7239,7 @@ class YahtzeeSpinner(MiniGame):
             txt = "SPIN: SELECT CATEGORY • CLICK: CONFIRM"
             col = (255, 150, 255)
         
-        text_surf = self.font_small.render(txt, True, col)
+        text_surf = TEXT.render(self.font_small, txt, True, col)
         surface.blit(text_surf, (640 - text_surf.get_width()//2, y))
 
 
@@ -5004,16 +7251,16 @@ class YahtzeeSpinner(MiniGame):
 
 
 
+    @profiled
     def draw_roll_the_dice(self, surface):
         """ROLL THE DICE! screen PRO: testo fumetto + 3 dadi rotanti luminosi"""
 
         # Background gradient roll (nero->blu scuro per profondità arcade)
-        grad = pygame.Surface((1280, 720))
-        for y in range(720):
-            alpha = int(255 * (y / 720))
-            col = (10, 10 + alpha // 4, 20 + alpha // 2)
-            pygame.draw.line(grad, col, (0, y), (1280, y))
-        surface.blit(grad, (0, 0))
+        def gradient(t, y, phase):
+            alpha = np.trunc(255 * t)
+            return 10, 10 + alpha // 4, 20 + alpha // 2
+
+        GRADIENTS.draw(surface, "yahtzee_roll", gradient)
 
         # Testo principale
         pulse = abs(math.sin(self.time * 6)) * 0.25 + 0.75
@@ -5022,7 +7269,7 @@ class YahtzeeSpinner(MiniGame):
 
         text = "ROLL THE DICE!"
         base_font = self.font_huge
-        textsurf = base_font.render(text, True, (255, 255, 255))
+        textsurf = TEXT.render(base_font, text, True, (255, 255, 255))
         w, h = textsurf.get_size()
 
         scale = 1.4 + pulse * 0.3 + bounce * 0.15
@@ -5056,7 +7303,7 @@ class YahtzeeSpinner(MiniGame):
                 rgb = (value, p, q)
 
             char_color = tuple(int(255 * c) for c in rgb)
-            char_surf = base_font.render(char, True, char_color)
+            char_surf = TEXT.render(base_font, char, True, char_color)
             color_surfs.append((char_surf, char_color))
 
         border_width = 3
@@ -5217,17 +7464,18 @@ class YahtzeeSpinner(MiniGame):
 
 
 
-    def _draw_dice(self, surface, sx, sy):
+    @profiled
+    def _draw_dice(self, surface):
         """Progress SOTTO dadi (visibile), istruzioni SOPRA dadi ben disegnate"""
         
-        dice_y = 540 + sy  # DADI SPOSTATI: 540-680px (più spazio sopra e sotto)
+        dice_y = 540  # DADI SPOSTATI: 540-680px (più spazio sopra e sotto)
         
 
         # PROGRESS BAR SOTTO DADI (più distanziata)
         if self.phase == 'roll' and self.can_roll:
             bar_w, bar_h = 400, 22
-            bar_x = 640 - bar_w // 2 + sx
-            bar_y = dice_y + 148 + sy
+            bar_x = 640 - bar_w // 2
+            bar_y = dice_y + 148
             
             pygame.draw.rect(surface, (30, 35, 50), (bar_x, bar_y, bar_w, bar_h), 0, 12)
             
@@ -5240,7 +7488,7 @@ class YahtzeeSpinner(MiniGame):
                 pygame.draw.rect(surface, col, (bar_x + 2, bar_y + 2, fill_w - 2, bar_h - 4), 0, 10)
             
             pygame.draw.rect(surface, (130, 140, 170), (bar_x, bar_y, bar_w, bar_h), 2, 12)
-            pct_txt = self.font_tiny.render(f"{int(progress*100)}%", True, (255, 255, 255))
+            pct_txt = TEXT.render(self.font_tiny, f"{int(progress*100)}%", True, (255, 255, 255))
             surface.blit(pct_txt, (bar_x + bar_w//2 - pct_txt.get_width()//2, bar_y + 5))
 
             self.draw_roll_the_dice(surface)
@@ -5248,8 +7496,8 @@ class YahtzeeSpinner(MiniGame):
 
         elif self.phase == 'selecting' and self.left_hold_timer > 0:
             bar_w, bar_h = 420, 24
-            bar_x = 640 - bar_w // 2 + sx
-            bar_y = dice_y + 148 + sy
+            bar_x = 640 - bar_w // 2
+            bar_y = dice_y + 148
             
             pygame.draw.rect(surface, (35, 40, 55), (bar_x, bar_y, bar_w, bar_h), 0, 12)
             
@@ -5259,12 +7507,12 @@ class YahtzeeSpinner(MiniGame):
             pygame.draw.rect(surface, grad_col, (bar_x + 2, bar_y + 2, fill_w - 2, bar_h - 4), 0, 10)
             
             pygame.draw.rect(surface, (140, 150, 180), (bar_x, bar_y, bar_w, bar_h), 2, 12)
-            pct_txt = self.font_tiny.render(f"HOLD {int(progress*100)}%", True, (255, 255, 255))
+            pct_txt = TEXT.render(self.font_tiny, f"HOLD {int(progress*100)}%", True, (255, 255, 255))
             surface.blit(pct_txt, (bar_x + bar_w//2 - pct_txt.get_width()//2, bar_y + 4))
         
         # DADI centrati (posizione ottimizzata)
         dice_spacing = 200
-        start_x = 640 - (4 * dice_spacing // 2) - 70 + sx
+        start_x = 640 - (4 * dice_spacing // 2) - 70
         for i in range(5):
             x = start_x + i * dice_spacing
             y = dice_y - 50
@@ -5285,11 +7533,11 @@ class YahtzeeSpinner(MiniGame):
             pygame.draw.rect(surface, border_col, rect, border_w, 18)
             
             if self.dice_held[i]:
-                held = self.font_small.render("HELD", True, (180, 255, 180))
+                held = TEXT.render(self.font_small, "HELD", True, (180, 255, 180))
                 surface.blit(held, (x + 70 - held.get_width()//2, y - 32))
             
             self._draw_die_face(surface, x + 70, y + 70, self.dice[i])
-            num = self.font_tiny.render(str(i+1), True, (130, 130, 150))
+            num = TEXT.render(self.font_tiny, str(i+1), True, (130, 130, 150))
             surface.blit(num, (x + 10, y + 10))
 
 
@@ -5317,13 +7565,8 @@ class YahtzeeSpinner(MiniGame):
 
 
 
-    def _draw_particles(self, surface, sx, sy):
-        for p in self.particles:
-            alpha = int(255 * (p['life'] / p['max_life']))
-            size = int(p['size'])
-            surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*p['color'], alpha), (size, size), size)
-            surface.blit(surf, (int(p['x']-size+sx), int(p['y']-size+sy)))
+    def _draw_particles(self, surface):
+        self.particles.draw(surface)
     
     def _draw_floating_texts(self, surface):
         for ft in self.floating_texts:
@@ -5338,11 +7581,11 @@ class YahtzeeSpinner(MiniGame):
         overlay.set_alpha(210)
         surface.blit(overlay, (0, 0))
         
-        txt = self.font_pause.render("PAUSED", True, (255, 255, 255))
+        txt = TEXT.render(self.font_pause, "PAUSED", True, (255, 255, 255))
         surface.blit(txt, (640 - txt.get_width()//2, 260))
         
-        exit_txt = self.font_medium.render("LEFT CLICK - Exit", True, (255, 100, 100))
-        cont_txt = self.font_medium.render("RIGHT CLICK - Continue", True, (100, 255, 100))
+        exit_txt = TEXT.render(self.font_medium, "LEFT CLICK - Exit", True, (255, 100, 100))
+        cont_txt = TEXT.render(self.font_medium, "RIGHT CLICK - Continue", True, (100, 255, 100))
         surface.blit(exit_txt, (640 - exit_txt.get_width()//2, 400))
         surface.blit(cont_txt, (640 - cont_txt.get_width()//2, 450))
     
@@ -5352,19 +7595,19 @@ class YahtzeeSpinner(MiniGame):
         overlay.set_alpha(230)
         surface.blit(overlay, (0, 0))
         
-        title = self.font_pause.render("GAME OVER!", True, (255, 215, 0))
+        title = TEXT.render(self.font_pause, "GAME OVER!", True, (255, 215, 0))
         surface.blit(title, (640 - title.get_width()//2, 220))
         
-        final = self.font_huge.render(f"{self.score}", True, (255, 255, 100))
+        final = TEXT.render(self.font_huge, f"{self.score}", True, (255, 255, 100))
         surface.blit(final, (640 - final.get_width()//2, 320))
         
-        upper = self.font_small.render(f"Upper: {self.upper_total} + Bonus: {self.upper_bonus}", 
+        upper = TEXT.render(self.font_small, f"Upper: {self.upper_total} + Bonus: {self.upper_bonus}", 
                                        True, (190, 190, 255))
-        lower = self.font_small.render(f"Lower: {self.lower_total}", True, (190, 190, 255))
+        lower = TEXT.render(self.font_small, f"Lower: {self.lower_total}", True, (190, 190, 255))
         surface.blit(upper, (640 - upper.get_width()//2, 430))
         surface.blit(lower, (640 - lower.get_width()//2, 465))
         
-        hint = self.font_small.render("RIGHT CLICK to continue", True, (170, 170, 170))
+        hint = TEXT.render(self.font_small, "RIGHT CLICK to continue", True, (170, 170, 170))
         surface.blit(hint, (640 - hint.get_width()//2, 580))
 
 
@@ -5511,12 +7754,10 @@ class SpinDuel(MiniGame):
         self.score = 0  # Score per MiniGame interface
 
         # === VISUAL EFFECTS ===
-        self.particles = []
+        self.particles = ParticleSystem()
         self.floating_texts = []
-        self.screen_shake = 0.0
         self.time = 0.0
         self.bg_wave = 0.0
-        self.flash_white = 0.0  # Flash schermo su colpo critico
         self.slow_motion = 1.0  # Slow-mo effect (1.0 = normale)
 
         # === FONTS ===
@@ -5573,10 +7814,8 @@ class SpinDuel(MiniGame):
         self.hit_cooldown_ai = 0.0
 
         # Effects reset
-        self.particles = []
+        self.particles = ParticleSystem()
         self.floating_texts = []
-        self.screen_shake = 0.0
-        self.flash_white = 0.0
         self.slow_motion = 1.0
 
     # ==================== PHYSICS & MOVEMENT ====================
@@ -5619,6 +7858,10 @@ class SpinDuel(MiniGame):
         # Calcola velocità visiva lama (per lunghezza dinamica)
         self.player_blade_speed = abs(self.spinner_velocity)
 
+        # Ronzio della lama: pitch, volume e brillantezza salgono con la velocità
+        speed = self.player_blade_speed / max_vel
+        STREAM.set(freq=55.0 + 165.0 * speed, gain=0.04 + 0.08 * speed, brightness=speed)
+
     def update_ai_blade(self, dt: float):
         """AI blade movement con comportamento adattivo"""
         if self.ai_stagger > 0:
@@ -5745,20 +7988,20 @@ class SpinDuel(MiniGame):
                 power *= 0.3
                 self.create_floating_text(self.ai_x, self.ai_y - 50, "PARRIED!", (100, 200, 255))
                 if self.synth:
-                    self.synth.create_wall_bounce().play()
+                    self.synth.play("wall_bounce")
             else:
                 # Colpo pieno
                 self.ai_stagger = 0.3
-                self.screen_shake = 0.4
+                CAMERA.shake(8, 0.4)
                 if power > 25:
                     self.create_floating_text(self.ai_x, self.ai_y - 50, "CRITICAL!", (255, 100, 100))
-                    self.flash_white = 0.3
+                    CAMERA.flash((255, 255, 255), 45, 0.15)  # flash schermo su colpo critico
                     self.slow_motion = 0.5
                     if self.synth:
-                        self.synth.create_high_score().play()
+                        self.synth.play("high_score")
                 else:
                     if self.synth:
-                        self.synth.create_hit().play()
+                        self.synth.play("hit")
 
             self.ai_energy -= power
             self.ai_energy = max(0, self.ai_energy)
@@ -5778,15 +8021,15 @@ class SpinDuel(MiniGame):
                 self.player_is_parrying = False
                 self.player_parry_cooldown = 1.0
                 if self.synth:
-                    self.synth.create_wall_bounce().play()
+                    self.synth.play("wall_bounce")
             else:
                 # Colpo pieno
                 self.player_stagger = 0.4
-                self.screen_shake = 0.5
+                CAMERA.shake(8, 0.5)
                 if power > 25:
-                    self.flash_white = 0.2
+                    CAMERA.flash((255, 255, 255), 30, 0.1)
                 if self.synth:
-                    self.synth.create_hit().play()
+                    self.synth.play("hit")
 
             self.player_energy -= power
             self.player_energy = max(0, self.player_energy)
@@ -5818,30 +8061,28 @@ class SpinDuel(MiniGame):
 
         self.time += dt
         self.bg_wave += dt * 0.5
-
-        # Flash decay
-        if self.flash_white > 0:
-            self.flash_white -= dt * 2
+        if self.paused or self.state != self.STATE_FIGHT:
+            STREAM.set(gain=0.0)
 
         # Pause handling
         if spinner.is_right_clicked() and not self.paused and self.state == self.STATE_FIGHT:
             self.paused = True
             if self.synth:
-                self.synth.create_select().play()
+                self.synth.play("select")
             return True
 
         if self.paused:
             if spinner.is_left_clicked():
                 # Exit game
                 if self.synth:
-                    self.synth.create_back().play()
+                    self.synth.play("back")
                 self.game_over = True
                 return False
             if spinner.is_right_clicked():
                 # Resume
                 self.paused = False
                 if self.synth:
-                    self.synth.create_select().play()
+                    self.synth.play("select")
             return True
 
         # ===== STATE MACHINE =====
@@ -5852,7 +8093,7 @@ class SpinDuel(MiniGame):
                 self.state = self.STATE_FIGHT
                 self.reset_round()
                 if self.synth:
-                    self.synth.create_level_complete().play()
+                    self.synth.play("level_complete")
             return True
 
         elif self.state == self.STATE_FIGHT:
@@ -5885,7 +8126,7 @@ class SpinDuel(MiniGame):
                     if self.player_parry_cooldown <= 0 and self.player_stagger <= 0:
                         self.player_is_parrying = True
                         if self.synth:
-                            self.synth.create_powerup().play()
+                            self.synth.play("powerup")
 
                 # Hold: carica attacco
                 self.click_timer += dt
@@ -5906,7 +8147,7 @@ class SpinDuel(MiniGame):
                         if self.player_charge > 0.5:
                             self.create_floating_text(self.player_x, self.player_y - 70, "CHARGED!", (255, 255, 100))
                             if self.synth:
-                                self.synth.create_score_point().play()
+                                self.synth.play("score_point")
 
                     self.is_clicking = False
                     self.click_timer = 0.0
@@ -5926,14 +8167,14 @@ class SpinDuel(MiniGame):
                 self.ai_wins += 1
                 self.create_floating_text(640, 200, "AI WINS ROUND!", (255, 100, 100))
                 if self.synth:
-                    self.synth.create_game_over().play()
+                    self.synth.play("game_over")
             elif self.ai_energy <= 0:
                 self.state = self.STATE_ROUND_END
                 self.player_wins += 1
                 self.score += 1000
                 self.create_floating_text(640, 200, "PLAYER WINS ROUND!", (100, 255, 100))
                 if self.synth:
-                    self.synth.create_level_complete().play()
+                    self.synth.play("level_complete")
 
         elif self.state == self.STATE_ROUND_END:
             # Attesa tra round
@@ -5948,7 +8189,7 @@ class SpinDuel(MiniGame):
                     self.reset_round()
                     self.state = self.STATE_FIGHT
                 if self.synth:
-                    self.synth.create_select().play()
+                    self.synth.play("select")
             return True
 
         elif self.state == self.STATE_GAME_OVER:
@@ -5959,8 +8200,6 @@ class SpinDuel(MiniGame):
         # Update particles & effects
         self.update_particles(dt)
         self.update_floating_texts(dt)
-        if self.screen_shake > 0:
-            self.screen_shake -= dt
 
         return True
 
@@ -5968,18 +8207,8 @@ class SpinDuel(MiniGame):
 
     def create_particles(self, x: float, y: float, color: tuple, count: int, speed_mult: float = 1.0):
         """Crea particelle esplosive"""
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(100, 400) * speed_mult
-            self.particles.append({
-                'x': x, 'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.uniform(0.3, 0.8),
-                'max_life': 0.8,
-                'color': color,
-                'size': random.uniform(3, 10)
-            })
+        self.particles.emit(x, y, count, color, speed=(100 * speed_mult, 400 * speed_mult),
+                            life=(0.3, 0.8), max_life=0.8, size=(3, 10), gravity=600)
 
     def create_floating_text(self, x: float, y: float, text: str, color: tuple):
         """Testo fluttuante"""
@@ -5989,13 +8218,7 @@ class SpinDuel(MiniGame):
         })
 
     def update_particles(self, dt: float):
-        for p in self.particles[:]:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] += 600 * dt  # Gravity
-            p['life'] -= dt
-            if p['life'] <= 0:
-                self.particles.remove(p)
+        self.particles.update(dt)
 
     def update_floating_texts(self, dt: float):
         for ft in self.floating_texts[:]:
@@ -6007,12 +8230,7 @@ class SpinDuel(MiniGame):
     # ==================== RENDERING ====================
 
     def draw(self, surface: pygame.Surface):
-        """Main render function"""
-        shake_x, shake_y = 0, 0
-        if self.screen_shake > 0:
-            shake_x = random.randint(-8, 8)
-            shake_y = random.randint(-8, 8)
-
+        """Main render function (shake e flash li applica la camera in composizione)"""
         # Background
         self._draw_background(surface)
 
@@ -6020,43 +8238,34 @@ class SpinDuel(MiniGame):
         if self.state == self.STATE_INTRO:
             self._draw_intro(surface)
         elif self.state == self.STATE_FIGHT:
-            self._draw_arena(surface, shake_x, shake_y)
-            self._draw_fighters(surface, shake_x, shake_y)
+            self._draw_arena(surface)
+            self._draw_fighters(surface)
             self._draw_hud(surface)
         elif self.state == self.STATE_ROUND_END:
-            self._draw_arena(surface, shake_x, shake_y)
-            self._draw_fighters(surface, shake_x, shake_y)
+            self._draw_arena(surface)
+            self._draw_fighters(surface)
             self._draw_hud(surface)
             self._draw_round_end(surface)
         elif self.state == self.STATE_GAME_OVER:
             self._draw_game_over(surface)
 
         # Effects (always on top)
-        self._draw_particles(surface, shake_x, shake_y)
+        self._draw_particles(surface)
         self._draw_floating_texts(surface)
 
-        # Flash overlay
-        if self.flash_white > 0:
-            alpha = int(self.flash_white * 150)
-            flash = pygame.Surface((1280, 720))
-            flash.fill((255, 255, 255))
-            flash.set_alpha(alpha)
-            surface.blit(flash, (0, 0))
-
         # Pause overlay
         if self.paused:
             self._draw_pause(surface)
 
+    @profiled
     def _draw_background(self, surface: pygame.Surface):
         """Background dinamico stile arcade"""
         # Gradient scuro con wave
-        for y in range(720):
-            t = y / 720
-            wave = math.sin(self.bg_wave + t * 4) * 0.05
-            r = int(15 + 25 * (t + wave))
-            g = int(10 + 20 * (1 - t + wave))
-            b = int(25 + 40 * t)
-            pygame.draw.line(surface, (r, g, b), (0, y), (1280, y))
+        def gradient(t, y, phase):
+            wave = np.sin(phase + t * 4) * 0.05
+            return 15 + 25 * (t + wave), 10 + 20 * (1 - t + wave), 25 + 40 * t
+
+        GRADIENTS.draw(surface, "duel_background", gradient, self.bg_wave % (math.pi * 2), quantum=0.2)
 
         # Grid centrale (arena)
         grid_color = (60, 70, 90)
@@ -6078,23 +8287,28 @@ class SpinDuel(MiniGame):
             c = int(150 * twinkle)
             pygame.draw.circle(surface, (c, c, c+50), (x, y), 1)
 
-    def _draw_arena(self, surface: pygame.Surface, sx: int, sy: int):
-        """Arena di combattimento"""
+    def _draw_arena(self, surface: pygame.Surface):
+        """Arena di combattimento (statica: un blit dal layer cache)"""
+        key = (int(self.player_x), int(self.player_y), int(self.ai_x), int(self.ai_y))
+        LAYERS.draw(surface, "duel.arena", key, self._build_arena)
+
+    def _build_arena(self, surface: pygame.Surface):
         # Linea centrale
         center_x = 640
         pygame.draw.line(surface, (80, 100, 130), 
-                        (center_x + sx, 100 + sy), (center_x + sx, 620 + sy), 3)
+                        (center_x, 100), (center_x, 620), 3)
 
         # Cerchi posizione fighters
         pygame.draw.circle(surface, (70, 90, 120), 
-                          (int(self.player_x) + sx, int(self.player_y) + sy), 50, 2)
+                          (int(self.player_x), int(self.player_y)), 50, 2)
         pygame.draw.circle(surface, (120, 90, 70), 
-                          (int(self.ai_x) + sx, int(self.ai_y) + sy), 50, 2)
+                          (int(self.ai_x), int(self.ai_y)), 50, 2)
 
-    def _draw_fighters(self, surface: pygame.Surface, sx: int, sy: int):
+    @profiled
+    def _draw_fighters(self, surface: pygame.Surface):
         """Disegna giocatore e AI con lame"""
         # === PLAYER ===
-        px, py = int(self.player_x + sx), int(self.player_y + sy)
+        px, py = int(self.player_x), int(self.player_y)
 
         # Corpo player (cerchio blu)
         body_color = (100, 150, 255) if self.player_stagger <= 0 else (255, 150, 100)
@@ -6136,7 +8350,7 @@ class SpinDuel(MiniGame):
             surface.blit(shield_surf, (0, 0))
 
         # === AI ===
-        ax, ay = int(self.ai_x + sx), int(self.ai_y + sy)
+        ax, ay = int(self.ai_x), int(self.ai_y)
 
         # Corpo AI (cerchio rosso)
         ai_body_color = (255, 100, 100) if self.ai_stagger <= 0 else (255, 200, 100)
@@ -6168,6 +8382,7 @@ class SpinDuel(MiniGame):
         pygame.draw.line(surface, ai_blade_color, (ax, ay), (ai_blade_end_x, ai_blade_end_y), ai_blade_width)
         pygame.draw.circle(surface, (255, 255, 255), (ai_blade_end_x, ai_blade_end_y), 8)
 
+    @profiled
     def _draw_hud(self, surface: pygame.Surface):
         """HUD con energie, round, score"""
         # Energy bars
@@ -6186,10 +8401,10 @@ class SpinDuel(MiniGame):
 
         pygame.draw.rect(surface, (150, 170, 200), (player_bar_x, player_bar_y, bar_width, bar_height), 3, 8)
 
-        player_txt = self.font_small.render("PLAYER", True, (150, 200, 255))
+        player_txt = TEXT.render(self.font_small, "PLAYER", True, (150, 200, 255))
         surface.blit(player_txt, (player_bar_x, player_bar_y - 28))
 
-        energy_txt = self.font_tiny.render(f"{int(self.player_energy)}/100", True, (255, 255, 255))
+        energy_txt = TEXT.render(self.font_tiny, f"{int(self.player_energy)}/100", True, (255, 255, 255))
         surface.blit(energy_txt, (player_bar_x + bar_width//2 - energy_txt.get_width()//2, player_bar_y + 6))
 
         # AI energy (destra)
@@ -6204,43 +8419,43 @@ class SpinDuel(MiniGame):
 
         pygame.draw.rect(surface, (200, 150, 150), (ai_bar_x, ai_bar_y, bar_width, bar_height), 3, 8)
 
-        ai_txt = self.font_small.render("AI OPPONENT", True, (255, 150, 150))
+        ai_txt = TEXT.render(self.font_small, "AI OPPONENT", True, (255, 150, 150))
         surface.blit(ai_txt, (ai_bar_x + bar_width - ai_txt.get_width(), ai_bar_y - 28))
 
-        ai_energy_txt = self.font_tiny.render(f"{int(self.ai_energy)}/100", True, (255, 255, 255))
+        ai_energy_txt = TEXT.render(self.font_tiny, f"{int(self.ai_energy)}/100", True, (255, 255, 255))
         surface.blit(ai_energy_txt, (ai_bar_x + bar_width//2 - ai_energy_txt.get_width()//2, ai_bar_y + 6))
 
         # Round counter (centro alto)
-        round_txt = self.font_medium.render(f"ROUND {self.round}", True, (255, 255, 100))
+        round_txt = TEXT.render(self.font_medium, f"ROUND {self.round}", True, (255, 255, 100))
         surface.blit(round_txt, (640 - round_txt.get_width()//2, 20))
 
-        wins_txt = self.font_small.render(f"P:{self.player_wins}  vs  AI:{self.ai_wins}", True, (200, 200, 200))
+        wins_txt = TEXT.render(self.font_small, f"P:{self.player_wins}  vs  AI:{self.ai_wins}", True, (200, 200, 200))
         surface.blit(wins_txt, (640 - wins_txt.get_width()//2, 60))
 
         # Score
-        score_txt = self.font_small.render(f"SCORE: {self.score}", True, (255, 255, 255))
+        score_txt = TEXT.render(self.font_small, f"SCORE: {self.score}", True, (255, 255, 255))
         surface.blit(score_txt, (640 - score_txt.get_width()//2, 670))
 
         # Charge indicator (player)
         if self.player_charge > 0:
-            charge_txt = self.font_tiny.render(f"CHARGE: {int(self.player_charge * 100)}%", True, (255, 255, 100))
+            charge_txt = TEXT.render(self.font_tiny, f"CHARGE: {int(self.player_charge * 100)}%", True, (255, 255, 100))
             surface.blit(charge_txt, (player_bar_x, player_bar_y + 35))
 
         # Speed indicator
-        speed_txt = self.font_tiny.render(f"SPEED: {int(self.player_blade_speed)}", True, (150, 200, 255))
+        speed_txt = TEXT.render(self.font_tiny, f"SPEED: {int(self.player_blade_speed)}", True, (150, 200, 255))
         surface.blit(speed_txt, (player_bar_x, player_bar_y + 55))
 
     def _draw_intro(self, surface: pygame.Surface):
         """Schermata introduttiva"""
         # Title con effetto
         pulse = abs(math.sin(self.time * 3)) * 0.2 + 0.8
-        title = self.font_huge.render("⚔️ SPIN DUEL ⚔️", True, (255, 255, 100))
+        title = TEXT.render(self.font_huge, "⚔️ SPIN DUEL ⚔️", True, (255, 255, 100))
         title_scale = pygame.transform.scale(title, 
             (int(title.get_width() * pulse), int(title.get_height() * pulse)))
         surface.blit(title_scale, (640 - title_scale.get_width()//2, 150))
 
         # Subtitle
-        subtitle = self.font_medium.render("Master the blade through rotation", True, (200, 200, 255))
+        subtitle = TEXT.render(self.font_medium, "Master the blade through rotation", True, (200, 200, 255))
         surface.blit(subtitle, (640 - subtitle.get_width()//2, 280))
 
         # Controls
@@ -6252,12 +8467,12 @@ class SpinDuel(MiniGame):
             "⏸️  RIGHT CLICK - Pause game"
         ]
         for ctrl in controls:
-            txt = self.font_small.render(ctrl, True, (180, 220, 255))
+            txt = TEXT.render(self.font_small, ctrl, True, (180, 220, 255))
             surface.blit(txt, (640 - txt.get_width()//2, y))
             y += 45
 
         # Start prompt
-        start = self.font_large.render("CLICK TO START", True, (100, 255, 100))
+        start = TEXT.render(self.font_large, "CLICK TO START", True, (100, 255, 100))
         if int(self.time * 2) % 2:
             surface.blit(start, (640 - start.get_width()//2, 600))
 
@@ -6269,12 +8484,12 @@ class SpinDuel(MiniGame):
         surface.blit(overlay, (0, 0))
 
         if self.player_wins > self.ai_wins:
-            txt = self.font_huge.render("VICTORY!", True, (100, 255, 100))
+            txt = TEXT.render(self.font_huge, "VICTORY!", True, (100, 255, 100))
         else:
-            txt = self.font_huge.render("DEFEAT", True, (255, 100, 100))
+            txt = TEXT.render(self.font_huge, "DEFEAT", True, (255, 100, 100))
         surface.blit(txt, (640 - txt.get_width()//2, 250))
 
-        continue_txt = self.font_medium.render("Click to continue", True, (200, 200, 200))
+        continue_txt = TEXT.render(self.font_medium, "Click to continue", True, (200, 200, 200))
         surface.blit(continue_txt, (640 - continue_txt.get_width()//2, 450))
 
     def _draw_game_over(self, surface: pygame.Surface):
@@ -6285,18 +8500,18 @@ class SpinDuel(MiniGame):
         surface.blit(overlay, (0, 0))
 
         if self.player_wins >= 2:
-            title = self.font_huge.render("🏆 CHAMPION! 🏆", True, (255, 215, 0))
+            title = TEXT.render(self.font_huge, "🏆 CHAMPION! 🏆", True, (255, 215, 0))
         else:
-            title = self.font_huge.render("DEFEATED", True, (255, 100, 100))
+            title = TEXT.render(self.font_huge, "DEFEATED", True, (255, 100, 100))
         surface.blit(title, (640 - title.get_width()//2, 180))
 
-        score = self.font_large.render(f"FINAL SCORE: {self.score}", True, (255, 255, 100))
+        score = TEXT.render(self.font_large, f"FINAL SCORE: {self.score}", True, (255, 255, 100))
         surface.blit(score, (640 - score.get_width()//2, 300))
 
-        wins = self.font_medium.render(f"Player {self.player_wins} - {self.ai_wins} AI", True, (200, 200, 200))
+        wins = TEXT.render(self.font_medium, f"Player {self.player_wins} - {self.ai_wins} AI", True, (200, 200, 200))
         surface.blit(wins, (640 - wins.get_width()//2, 380))
 
-        exit_txt = self.font_small.render("Right Click to Exit", True, (150, 150, 150))
+        exit_txt = TEXT.render(self.font_small, "Right Click to Exit", True, (150, 150, 150))
         surface.blit(exit_txt, (640 - exit_txt.get_width()//2, 550))
 
     def _draw_pause(self, surface: pygame.Surface):
@@ -6306,22 +8521,17 @@ class SpinDuel(MiniGame):
         overlay.set_alpha(200)
         surface.blit(overlay, (0, 0))
 
-        title = self.font_huge.render("⏸️  PAUSED", True, (255, 255, 255))
+        title = TEXT.render(self.font_huge, "⏸️  PAUSED", True, (255, 255, 255))
         surface.blit(title, (640 - title.get_width()//2, 250))
 
-        resume = self.font_medium.render("RIGHT CLICK - Resume", True, (100, 255, 100))
-        exit_txt = self.font_medium.render("LEFT CLICK - Exit", True, (255, 100, 100))
+        resume = TEXT.render(self.font_medium, "RIGHT CLICK - Resume", True, (100, 255, 100))
+        exit_txt = TEXT.render(self.font_medium, "LEFT CLICK - Exit", True, (255, 100, 100))
         surface.blit(resume, (640 - resume.get_width()//2, 380))
         surface.blit(exit_txt, (640 - exit_txt.get_width()//2, 430))
 
-    def _draw_particles(self, surface: pygame.Surface, sx: int, sy: int):
+    def _draw_particles(self, surface: pygame.Surface):
         """Rendering particles"""
-        for p in self.particles:
-            alpha = int(255 * (p['life'] / p['max_life']))
-            size = int(p['size'])
-            surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*p['color'], alpha), (size, size), size)
-            surface.blit(surf, (int(p['x']-size+sx), int(p['y']-size+sy)))
+        self.particles.draw(surface)
 
     def _draw_floating_texts(self, surface: pygame.Surface):
         """Rendering floating text"""
@@ -6380,6 +8590,8 @@ class PongSpinner(MiniGame):
         # Ball setup
         self.ball_x = 640
         self.ball_y = 360
+        # Palla e paddle al passo precedente (x, y, bottom, top), per l'interpolazione in draw
+        self.previous = (640, 360, 640, 640)
         self.ball_vx = 0
         self.ball_vy = 0
         self.ball_size = 8
@@ -6410,10 +8622,8 @@ class PongSpinner(MiniGame):
         self.powerup_spawn_interval = 15.0
         
         # Visual effects
-        self.particles = []
+        self.particles = ParticleSystem()
         self.floating_texts = []
-        self.screen_shake = 0
-        self.flash_timer = 0
         
         # Background animation
         self.stars = []
@@ -6491,10 +8701,8 @@ class PongSpinner(MiniGame):
         self.powerup_spawn_timer = 0
         
         # Effects
-        self.particles = []
+        self.particles = ParticleSystem()
         self.floating_texts = []
-        self.screen_shake = 0
-        self.flash_timer = 0
         self.ball_trail = []
         
         # Pause
@@ -6514,6 +8722,8 @@ class PongSpinner(MiniGame):
         self.ball_x = 640
         self.ball_y = 360
         self.ball_trail = []
+        # Teletrasporto: niente interpolazione dalla posizione di prima
+        self.previous = (640, 360) + self.previous[2:]
         
         if direction == 0:
             direction = random.choice([-1, 1])
@@ -6531,20 +8741,8 @@ class PongSpinner(MiniGame):
     def _create_particles(self, x: float, y: float, count: int, color: tuple, 
                          speed_min: float = 80, speed_max: float = 250):
         """Sistema particellare avanzato"""
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(speed_min, speed_max)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'lifetime': random.uniform(0.3, 1.0),
-                'max_lifetime': 1.0,
-                'color': color,
-                'size': random.randint(2, 6),
-                'gravity': random.uniform(100, 300)
-            })
+        self.particles.emit(x, y, count, color, speed=(speed_min, speed_max), life=(0.3, 1.0),
+                            max_life=1.0, size=(2, 7), gravity=(100, 300))
     
     def _add_floating_text(self, x: float, y: float, text: str, 
                           color: tuple, size: int = 36):
@@ -6578,7 +8776,7 @@ class PongSpinner(MiniGame):
         powerup['rotation'] = 0
         
         self.powerups_available.append(powerup)
-        self.synth.create_blip(2).play()
+        self.synth.play_blip(2)
     
     def _activate_powerup(self, powerup_type: str):
         """Attiva un powerup"""
@@ -6601,7 +8799,7 @@ class PongSpinner(MiniGame):
             self.paddle_smooth_factor = 25.0  # Ancora più veloce con powerup
             self._add_floating_text(640, 300, "SPEED UP!", (255, 255, 100), 48)
         
-        self.synth.create_high_score().play()
+        self.synth.play("high_score")
     
     def _deactivate_powerup(self):
         """Disattiva powerup corrente"""
@@ -6611,7 +8809,7 @@ class PongSpinner(MiniGame):
             self.paddle_smooth_factor = 18.0  # Torna alla velocità aumentata base
         
         self.active_powerup = None
-        self.synth.create_back().play()
+        self.synth.play("back")
     
 
 
@@ -6621,6 +8819,7 @@ class PongSpinner(MiniGame):
 
     def update(self, dt: float, spinner_delta: float, spinner: SpinnerInput) -> bool:
         """Update loop principale"""
+        self.previous = (self.ball_x, self.ball_y, self.paddle_bottom_x, self.paddle_top_x)
         
         # === GESTIONE PAUSA - PULSANTI INVERTITI ===
         if spinner.is_right_clicked():
@@ -6630,11 +8829,11 @@ class PongSpinner(MiniGame):
             if not self.paused:
                 self.paused = True
                 self.confirm_exit = True
-                self.synth.create_blip(0).play()
+                self.synth.play_blip(0)
             else:
                 self.paused = False
                 self.confirm_exit = False
-                self.synth.create_select().play()
+                self.synth.play("select")
         
         if spinner.is_left_clicked() and self.paused:
             return False
@@ -6648,13 +8847,7 @@ class PongSpinner(MiniGame):
         self._update_background(dt)
         
         # Update particles
-        for p in self.particles[:]:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] += p['gravity'] * dt
-            p['lifetime'] -= dt
-            if p['lifetime'] <= 0:
-                self.particles.remove(p)
+        self.particles.update(dt)
         
         # Update floating texts
         for txt in self.floating_texts[:]:
@@ -6663,12 +8856,6 @@ class PongSpinner(MiniGame):
             if txt['lifetime'] <= 0:
                 self.floating_texts.remove(txt)
         
-        # Update screen effects
-        if self.screen_shake > 0:
-            self.screen_shake -= dt * 5
-        if self.flash_timer > 0:
-            self.flash_timer -= dt * 3
-        
         # Se in pausa o game over, non aggiornare gameplay
         if self.paused or self.game_over:
             return True
@@ -6754,102 +8941,30 @@ class PongSpinner(MiniGame):
         self.paddle_top_x = max(self.paddle_width // 2, 
                             min(1280 - self.paddle_width // 2, self.paddle_top_x))
         
-        # Ball movement
-        self.ball_x += self.ball_vx * dt
-        self.ball_y += self.ball_vy * dt
+        # Ball movement (swept: paddle and walls)
+        self._move_ball(dt, paddle_y_top, paddle_y_bottom)
         
         # Ball trail
         self.ball_trail.append((self.ball_x, self.ball_y))
         if len(self.ball_trail) > 15:
             self.ball_trail.pop(0)
         
-        # Wall collision
-        if self.ball_x <= self.ball_size or self.ball_x >= 1280 - self.ball_size:
-            self.ball_vx *= -1.02
-            self.ball_x = max(self.ball_size, min(1280 - self.ball_size, self.ball_x))
-            self.synth.create_blip(0).play()
-            self._create_particles(self.ball_x, self.ball_y, 8, (100, 150, 200))
-        
-        # === PADDLE COLLISION - BOTTOM (player) - FIXED SYMMETRIC ===
-        if (paddle_y_bottom <= self.ball_y <= paddle_y_bottom + self.paddle_height + self.ball_size and
-            self.paddle_bottom_x - self.paddle_width // 2 <= self.ball_x <= 
-            self.paddle_bottom_x + self.paddle_width // 2):
-            
-            offset_from_center = abs(self.ball_x - self.paddle_bottom_x) / (self.paddle_width // 2)
-            hit_quality = 1.0 - offset_from_center
-            self.last_hit_quality = hit_quality
-            
-            if hit_quality > 0.9:
-                self.perfect_hits += 1
-                self._add_floating_text(self.ball_x, self.ball_y - 30, "PERFECT!", (255, 255, 100), 32)
-                self.score += 25
-            
-            offset = (self.ball_x - self.paddle_bottom_x) / (self.paddle_width // 2)
-            max_angle = 60
-            angle = offset * max_angle
-            
-            speed = math.sqrt(self.ball_vx**2 + self.ball_vy**2) * 1.04
-            speed = min(speed, 800)
-            
-            self.ball_vx = math.sin(math.radians(angle)) * speed
-            self.ball_vy = -abs(math.cos(math.radians(angle)) * speed)
-            
-            self.rally_count += 1
-            self.total_hits += 1
-            self.max_rally = max(self.max_rally, self.rally_count)
-            
-            self.combo_timer = self.combo_decay_time
-            self.combo_multiplier = min(3.0, 1.0 + (self.rally_count * 0.1))
-            
-            base_score = 15
-            rally_bonus = self.rally_count * 3
-            combo_score = int((base_score + rally_bonus) * self.combo_multiplier)
-            self.score += combo_score
-            
-            self.synth.create_hit().play()
-            self.screen_shake = 0.2
-            self._create_particles(self.ball_x, self.ball_y, 15, (100, 255, 150))
-            
-            if self.rally_count % 5 == 0:
-                self._add_floating_text(640, 360, f"RALLY x{self.rally_count}!", (255, 200, 100), 42)
-        
-        # === PADDLE COLLISION - TOP (AI) - FIXED SYMMETRIC ===
-        if (paddle_y_top - self.ball_size <= self.ball_y <= paddle_y_top + self.paddle_height and
-            self.paddle_top_x - self.paddle_width // 2 <= self.ball_x <= 
-            self.paddle_top_x + self.paddle_width // 2):
-            
-            offset = (self.ball_x - self.paddle_top_x) / (self.paddle_width // 2)
-            max_angle = 60
-            angle = offset * max_angle
-            
-            speed = math.sqrt(self.ball_vx**2 + self.ball_vy**2) * 1.04
-            speed = min(speed, 800)
-            
-            self.ball_vx = math.sin(math.radians(angle)) * speed
-            self.ball_vy = abs(math.cos(math.radians(angle)) * speed)
-            
-            self.rally_count += 1
-            self.max_rally = max(self.max_rally, self.rally_count)
-            
-            self.synth.create_blip(1).play()
-            self._create_particles(self.ball_x, self.ball_y, 12, (255, 120, 120))
-        
         # Goal - AI scores (ball passes player paddle)
         if self.ball_y >= 720 + 20:
             if self.active_powerup == 'shield':
                 self._reset_ball(-1)
                 self._deactivate_powerup()
                 self._add_floating_text(640, 600, "SHIELD SAVED!", (255, 150, 255), 48)
-                self.synth.create_high_score().play()
+                self.synth.play("high_score")
             else:
                 self.score_ai += 1
-                self.synth.create_back().play()
+                self.synth.play("back")
                 self._create_particles(640, 720, 40, (255, 100, 100), 150, 400)
-                self.flash_timer = 1.0
+                CAMERA.flash((255, 255, 255), 150, 0.33)
                 
                 if self.score_ai >= self.max_score:
                     self.game_over = True
-                    self.synth.create_game_over().play()
+                    self.synth.play("game_over")
                 else:
                     self._reset_ball(-1)
         
@@ -6859,19 +8974,119 @@ class PongSpinner(MiniGame):
             goal_bonus = 150 + (self.rally_count * 25)
             self.score += goal_bonus
             
-            self.synth.create_score_point().play()
+            self.synth.play("score_point")
             self._create_particles(640, 0, 40, (100, 255, 150), 150, 400)
             self._add_floating_text(640, 100, f"+{goal_bonus} GOAL!", (255, 255, 100), 52)
-            self.flash_timer = 0.5
+            CAMERA.flash((255, 255, 255), 75, 0.17)
             
             if self.score_player >= self.max_score:
                 self.game_over = True
                 self.score += 1000
-                self.synth.create_high_score().play()
+                self.synth.play("high_score")
             else:
                 self._reset_ball(1)
         
         return True
+    
+    def _move_ball(self, dt: float, paddle_y_top: float, paddle_y_bottom: float):
+        """Muove la pallina a sotto-passi con collisioni continue contro i due paddle.
+
+        A 800 px/s con dt di 0.1 s la pallina percorre 80 px: il test puntuale sulla fascia
+        del paddle la lasciava passare, il segmento contro il rettangolo no.
+        """
+        half = self.paddle_width // 2
+        size = self.ball_size
+        steps = sweep_steps(self.ball_vx * dt, self.ball_vy * dt)
+        for _ in range(steps):
+            left = dt / steps
+            for _ in range(SWEEP_MAX_CONTACTS):
+                x, y = self.ball_x, self.ball_y
+                sx, sy = self.ball_vx * left, self.ball_vy * left
+                if sy > 0:
+                    hit = sweep_aabb(x, y, sx, sy,
+                                     self.paddle_bottom_x - half, paddle_y_bottom - size,
+                                     self.paddle_bottom_x + half, paddle_y_bottom + self.paddle_height + size,
+                                     hit_inside=True)
+                else:
+                    hit = sweep_aabb(x, y, sx, sy,
+                                     self.paddle_top_x - half, paddle_y_top - size,
+                                     self.paddle_top_x + half, paddle_y_top + self.paddle_height + size,
+                                     hit_inside=True)
+                if hit is None:
+                    self.ball_x = x + sx
+                    self.ball_y = y + sy
+                    break
+                t = hit[0]
+                self.ball_x = x + sx * t
+                self.ball_y = y + sy * t
+                left *= 1.0 - t
+                if sy > 0:
+                    self._hit_player_paddle()
+                else:
+                    self._hit_ai_paddle()
+            
+            # Wall collision
+            if self.ball_x <= self.ball_size or self.ball_x >= 1280 - self.ball_size:
+                self.ball_vx *= -1.02
+                self.ball_x = max(self.ball_size, min(1280 - self.ball_size, self.ball_x))
+                self.synth.play_blip(0)
+                self._create_particles(self.ball_x, self.ball_y, 8, (100, 150, 200))
+    
+    def _hit_player_paddle(self):
+        offset_from_center = abs(self.ball_x - self.paddle_bottom_x) / (self.paddle_width // 2)
+        hit_quality = 1.0 - offset_from_center
+        self.last_hit_quality = hit_quality
+        
+        if hit_quality > 0.9:
+            self.perfect_hits += 1
+            self._add_floating_text(self.ball_x, self.ball_y - 30, "PERFECT!", (255, 255, 100), 32)
+            self.score += 25
+        
+        offset = (self.ball_x - self.paddle_bottom_x) / (self.paddle_width // 2)
+        max_angle = 60
+        angle = offset * max_angle
+        
+        speed = math.sqrt(self.ball_vx**2 + self.ball_vy**2) * 1.04
+        speed = min(speed, 800)
+        
+        self.ball_vx = math.sin(math.radians(angle)) * speed
+        self.ball_vy = -abs(math.cos(math.radians(angle)) * speed)
+        
+        self.rally_count += 1
+        self.total_hits += 1
+        self.max_rally = max(self.max_rally, self.rally_count)
+        
+        self.combo_timer = self.combo_decay_time
+        self.combo_multiplier = min(3.0, 1.0 + (self.rally_count * 0.1))
+        
+        base_score = 15
+        rally_bonus = self.rally_count * 3
+        combo_score = int((base_score + rally_bonus) * self.combo_multiplier)
+        self.score += combo_score
+        
+        self.synth.play("hit")
+        CAMERA.shake(2, 0.04, decay=True)
+        self._create_particles(self.ball_x, self.ball_y, 15, (100, 255, 150))
+        
+        if self.rally_count % 5 == 0:
+            self._add_floating_text(640, 360, f"RALLY x{self.rally_count}!", (255, 200, 100), 42)
+    
+    def _hit_ai_paddle(self):
+        offset = (self.ball_x - self.paddle_top_x) / (self.paddle_width // 2)
+        max_angle = 60
+        angle = offset * max_angle
+        
+        speed = math.sqrt(self.ball_vx**2 + self.ball_vy**2) * 1.04
+        speed = min(speed, 800)
+        
+        self.ball_vx = math.sin(math.radians(angle)) * speed
+        self.ball_vy = abs(math.cos(math.radians(angle)) * speed)
+        
+        self.rally_count += 1
+        self.max_rally = max(self.max_rally, self.rally_count)
+        
+        self.synth.play_blip(1)
+        self._create_particles(self.ball_x, self.ball_y, 12, (255, 120, 120))
 
 
 
@@ -6897,13 +9112,10 @@ class PongSpinner(MiniGame):
         """Rendering completo"""
         
         # Background gradiente
-        for y in range(720):
-            factor = y / 720
-            pulse = abs(math.sin(self.bg_pulse * 0.3)) * 10
-            r = int(5 + factor * 8 + pulse)
-            g = int(10 + factor * 12 + pulse)
-            b = int(25 + factor * 20 + pulse)
-            pygame.draw.line(surface, (r, g, b), (0, y), (1280, y))
+        pulse = abs(math.sin(self.bg_pulse * 0.3)) * 10
+        GRADIENTS.draw(surface, "pong_background",
+                       lambda t, y, p: (5 + t * 8 + p, 10 + t * 12 + p, 25 + t * 20 + p),
+                       pulse, quantum=0.5)
         
         # Stars
         for star in self.stars:
@@ -6944,23 +9156,14 @@ class PongSpinner(MiniGame):
         # Powerups
         self._draw_powerups(surface)
         
-        # Screen shake
-        shake_x = random.randint(-int(self.screen_shake * 10), int(self.screen_shake * 10)) if self.screen_shake > 0 else 0
-        shake_y = random.randint(-int(self.screen_shake * 10), int(self.screen_shake * 10)) if self.screen_shake > 0 else 0
-        
-        # Paddles
-        self._draw_paddles(surface, shake_x, shake_y)
+        # Paddles (shake e flash li applica la camera in composizione)
+        self._draw_paddles(surface)
         
         # Ball
-        self._draw_ball(surface, shake_x, shake_y)
+        self._draw_ball(surface)
         
         # Particles
-        for p in self.particles:
-            alpha = int(255 * (p['lifetime'] / p['max_lifetime']))
-            color = p['color'] + (alpha,)
-            particle_surf = pygame.Surface((p['size'] * 2, p['size'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, color, (p['size'], p['size']), p['size'])
-            surface.blit(particle_surf, (int(p['x'] - p['size']), int(p['y'] - p['size'])))
+        self.particles.draw(surface)
         
         # HUD
         self._draw_hud(surface)
@@ -6968,31 +9171,24 @@ class PongSpinner(MiniGame):
         # Floating texts
         for txt in self.floating_texts:
             alpha = int(255 * (txt['lifetime'] / txt['max_lifetime']))
-            font = pygame.font.Font(None, txt['size'])
+            font = TEXT.font(txt['size'])
             text_surf = font.render(txt['text'], True, txt['color'])
             text_surf.set_alpha(alpha)
             surface.blit(text_surf, (int(txt['x'] - text_surf.get_width() // 2), int(txt['y'])))
         
-        # Flash
-        if self.flash_timer > 0:
-            flash_alpha = int(min(180, self.flash_timer * 150))
-            flash_surf = pygame.Surface((1280, 720), pygame.SRCALPHA)
-            flash_surf.fill((255, 255, 255, flash_alpha))
-            surface.blit(flash_surf, (0, 0))
-        
         # Pause menu
         if self.paused and self.confirm_exit:
             overlay = pygame.Surface((1280, 720), pygame.SRCALPHA)
             overlay.fill((0, 0, 0, 180))
             surface.blit(overlay, (0, 0))
             
-            font_huge = pygame.font.Font(None, 100)
-            pause_surf = font_huge.render("PAUSED", True, (255, 255, 255))
+            font_huge = TEXT.font(100)
+            pause_surf = TEXT.render(font_huge, "PAUSED", True, (255, 255, 255))
             surface.blit(pause_surf, (640 - pause_surf.get_width() // 2, 200))
             
-            font_medium = pygame.font.Font(None, 48)
-            exit_text = font_medium.render("LEFT CLICK = Exit", True, (255, 100, 100))
-            continue_text = font_medium.render("RIGHT CLICK = Continue", True, (100, 255, 100))
+            font_medium = TEXT.font(48)
+            exit_text = TEXT.render(font_medium, "LEFT CLICK = Exit", True, (255, 100, 100))
+            continue_text = TEXT.render(font_medium, "RIGHT CLICK = Continue", True, (100, 255, 100))
             surface.blit(exit_text, (640 - exit_text.get_width() // 2, 350))
             surface.blit(continue_text, (640 - continue_text.get_width() // 2, 420))
         
@@ -7000,6 +9196,7 @@ class PongSpinner(MiniGame):
         if self.game_over:
             self._draw_game_over(surface)
     
+    @profiled
     def _draw_powerups(self, surface: pygame.Surface):
         """Disegna powerup con grafica migliorata - BUG FIXED"""
         for pu in self.powerups_available:
@@ -7081,11 +9278,14 @@ class PongSpinner(MiniGame):
 
 
 
-    def _draw_paddles(self, surface: pygame.Surface, shake_x: int, shake_y: int):
+    @profiled
+    def _draw_paddles(self, surface: pygame.Surface):
         """Disegna paddle con effetti - SIMMETRICO"""
         
         # DISTANZA UGUALE DAI BORDI: 30px
         EDGE_DISTANCE = 30
+        bottom_x = self.interpolate(self.previous[2], self.paddle_bottom_x)
+        top_x = self.interpolate(self.previous[3], self.paddle_top_x)
         
         # Bottom paddle (player) - 30px dal bordo inferiore
         paddle_y_bottom = 720 - EDGE_DISTANCE - self.paddle_height  # 720 - 30 - 15 = 675
@@ -7093,16 +9293,16 @@ class PongSpinner(MiniGame):
         glow_surf_bottom = pygame.Surface((self.paddle_width + 12, self.paddle_height + 8), pygame.SRCALPHA)
         glow_surf_bottom.fill((100, 255, 150, 60))
         surface.blit(glow_surf_bottom, 
-                    (int(self.paddle_bottom_x - (self.paddle_width + 12) // 2) + shake_x, 
-                    paddle_y_bottom - 4 + shake_y))
+                    (int(bottom_x - (self.paddle_width + 12) // 2), 
+                    paddle_y_bottom - 4))
         
         pygame.draw.rect(surface, (100, 255, 150), 
-                        (int(self.paddle_bottom_x - self.paddle_width // 2) + shake_x, 
-                        paddle_y_bottom + shake_y, 
+                        (int(bottom_x - self.paddle_width // 2), 
+                        paddle_y_bottom, 
                         self.paddle_width, self.paddle_height), 0, 5)
         pygame.draw.rect(surface, (180, 255, 200), 
-                        (int(self.paddle_bottom_x - self.paddle_width // 2) + shake_x, 
-                        paddle_y_bottom + shake_y, 
+                        (int(bottom_x - self.paddle_width // 2), 
+                        paddle_y_bottom, 
                         self.paddle_width, self.paddle_height), 3, 5)
         
         # Top paddle (AI) - 30px dal bordo superiore
@@ -7111,22 +9311,23 @@ class PongSpinner(MiniGame):
         glow_surf_top = pygame.Surface((self.paddle_width + 12, self.paddle_height + 8), pygame.SRCALPHA)
         glow_surf_top.fill((255, 120, 120, 60))
         surface.blit(glow_surf_top, 
-                    (int(self.paddle_top_x - (self.paddle_width + 12) // 2) + shake_x, 
-                    paddle_y_top - 4 + shake_y))
+                    (int(top_x - (self.paddle_width + 12) // 2), 
+                    paddle_y_top - 4))
         
         pygame.draw.rect(surface, (255, 120, 120), 
-                        (int(self.paddle_top_x - self.paddle_width // 2) + shake_x, 
-                        paddle_y_top + shake_y, 
+                        (int(top_x - self.paddle_width // 2), 
+                        paddle_y_top, 
                         self.paddle_width, self.paddle_height), 0, 5)
         pygame.draw.rect(surface, (255, 180, 180), 
-                        (int(self.paddle_top_x - self.paddle_width // 2) + shake_x, 
-                        paddle_y_top + shake_y, 
+                        (int(top_x - self.paddle_width // 2), 
+                        paddle_y_top, 
                         self.paddle_width, self.paddle_height), 3, 5)
 
 
 
 
-    def _draw_ball(self, surface: pygame.Surface, shake_x: int, shake_y: int):
+    @profiled
+    def _draw_ball(self, surface: pygame.Surface):
         """Disegna palla con trail"""
         # Trail
         for i, (tx, ty) in enumerate(self.ball_trail):
@@ -7135,29 +9336,32 @@ class PongSpinner(MiniGame):
                 size = int(2 + (i / len(self.ball_trail)) * 4)
                 trail_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
                 pygame.draw.circle(trail_surf, (255, 255, 200, alpha), (size, size), size)
-                surface.blit(trail_surf, (int(tx - size) + shake_x, int(ty - size) + shake_y))
+                surface.blit(trail_surf, (int(tx - size), int(ty - size)))
         
         # Glow
         glow_size = int(self.ball_size + 8 + abs(math.sin(self.ball_glow_pulse)) * 4)
         ball_glow = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
         pygame.draw.circle(ball_glow, (255, 255, 150, 120), (glow_size, glow_size), glow_size)
-        surface.blit(ball_glow, (int(self.ball_x - glow_size) + shake_x, 
-                                int(self.ball_y - glow_size) + shake_y))
+        x = self.interpolate(self.previous[0], self.ball_x)
+        y = self.interpolate(self.previous[1], self.ball_y)
+        surface.blit(ball_glow, (int(x - glow_size), 
+                                int(y - glow_size)))
         
         # Ball core
         pygame.draw.circle(surface, (255, 255, 220), 
-                          (int(self.ball_x) + shake_x, int(self.ball_y) + shake_y), 
+                          (int(x), int(y)), 
                           self.ball_size)
         pygame.draw.circle(surface, (255, 255, 255), 
-                          (int(self.ball_x) + shake_x, int(self.ball_y) + shake_y), 
+                          (int(x), int(y)), 
                           self.ball_size - 2)
             
+    @profiled
     def _draw_hud(self, surface: pygame.Surface):
         """HUD elegante minimalista - LAYOUT SIMMETRICO"""
-        font_score = pygame.font.Font(None, 64)
-        font_label = pygame.font.Font(None, 22)
-        font_small = pygame.font.Font(None, 20)
-        font_tiny = pygame.font.Font(None, 18)
+        font_score = TEXT.font(64)
+        font_label = TEXT.font(22)
+        font_small = TEXT.font(20)
+        font_tiny = TEXT.font(18)
         
         # === PLAYER SCORE (Bottom Left) ===
         player_panel_width = 90
@@ -7226,7 +9430,7 @@ class PongSpinner(MiniGame):
             surface.blit(rally_bg, (rally_panel_x, rally_panel_y))
             
             rally_color = (255, 255, 120) if self.rally_count < 10 else (255, 150, 255)
-            font_rally = pygame.font.Font(None, 34)
+            font_rally = TEXT.font(34)
             rally_text = font_rally.render(f"RALLY x{self.rally_count}", True, rally_color)
             rally_text.set_alpha(245)
             text_x = rally_panel_x + (rally_panel_width - rally_text.get_width()) // 2
@@ -7304,26 +9508,26 @@ class PongSpinner(MiniGame):
         overlay.fill((0, 0, 0, 200))
         surface.blit(overlay, (0, 0))
         
-        font_huge = pygame.font.Font(None, 110)
-        font_large = pygame.font.Font(None, 56)
-        font_medium = pygame.font.Font(None, 40)
-        font_small = pygame.font.Font(None, 32)
+        font_huge = TEXT.font(110)
+        font_large = TEXT.font(56)
+        font_medium = TEXT.font(40)
+        font_small = TEXT.font(32)
         
         if self.score_player >= self.max_score:
             result_text, result_color = "VICTORY!", (120, 255, 170)
         else:
             result_text, result_color = "DEFEAT", (255, 140, 140)
         
-        shadow = font_huge.render(result_text, True, (0, 0, 0))
+        shadow = TEXT.render(font_huge, result_text, True, (0, 0, 0))
         surface.blit(shadow, (642 - shadow.get_width() // 2, 82))
         
-        result = font_huge.render(result_text, True, result_color)
+        result = TEXT.render(font_huge, result_text, True, result_color)
         surface.blit(result, (640 - result.get_width() // 2, 80))
         
-        final_score = font_large.render(f"FINAL SCORE: {self.score}", True, (255, 255, 255))
+        final_score = TEXT.render(font_large, f"FINAL SCORE: {self.score}", True, (255, 255, 255))
         surface.blit(final_score, (640 - final_score.get_width() // 2, 220))
         
-        match_result = font_medium.render(f"{self.score_player} - {self.score_ai}", True, (220, 220, 220))
+        match_result = TEXT.render(font_medium, f"{self.score_player} - {self.score_ai}", True, (220, 220, 220))
         surface.blit(match_result, (640 - match_result.get_width() // 2, 290))
         
         stats_y = 360
@@ -7336,11 +9540,11 @@ class PongSpinner(MiniGame):
         ]
         
         for stat in stats:
-            stat_surf = font_small.render(stat, True, (200, 210, 230))
+            stat_surf = TEXT.render(font_small, stat, True, (200, 210, 230))
             surface.blit(stat_surf, (640 - stat_surf.get_width() // 2, stats_y))
             stats_y += 40
         
-        hint = font_medium.render("RIGHT CLICK to continue", True, (150, 170, 180))
+        hint = TEXT.render(font_medium, "RIGHT CLICK to continue", True, (150, 170, 180))
         surface.blit(hint, (640 - hint.get_width() // 2, 640))
 
 
@@ -7414,7 +9618,7 @@ class MissileCommander(MiniGame):
         self.explosions = []
         self.bullets = []
         self.powerups = []
-        self.particles = []
+        self.particles = ParticleSystem()
         self.cities = []
         self.floating_texts = []
 
@@ -7423,7 +9627,6 @@ class MissileCommander(MiniGame):
         self.missiles_destroyed_this_wave = 0
         self.missiles_needed_for_wave = 8
 
-        self.screen_flash = 0
         self.background_color = (5, 5, 30)
         self.stars = []
         for _ in range(150):
@@ -7640,20 +9843,13 @@ class MissileCommander(MiniGame):
         })
 
         particle_count = int(radius / 2.5)
-        for _ in range(particle_count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(80, 250)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed - random.uniform(0, 50),
-                'lifetime': random.uniform(0.4, 1.2),
-                'max_lifetime': 1.2,
-                'color': color,
-                'size': random.uniform(2, 6),
-                'fade': random.choice([True, False])
-            })
+        angle = np.random.uniform(0, math.pi * 2, particle_count)
+        speed = np.random.uniform(80, 250, particle_count)
+        self.particles.emit(x, y, particle_count, color,
+                            vx=np.cos(angle) * speed,
+                            vy=np.sin(angle) * speed - np.random.uniform(0, 50, particle_count),
+                            life=(0.4, 1.2), max_life=1.2, size=(2, 6), gravity=250, drag=0.98,
+                            fade=np.random.random(particle_count) < 0.5)
 
 
 
@@ -7732,12 +9928,12 @@ class MissileCommander(MiniGame):
             if self.powerup_ammo == 0:
                 self.active_powerup = None
             
-            self.synth.create_hit().play()
+            self.synth.play("hit")
             return
         
         # NORMAL BULLET
         self._fire_normal_bullet(start_x, start_y, cos_rad, sin_rad)
-        self.synth.create_hit().play()
+        self.synth.play("hit")
 
     def _fire_shotgun(self, x: float, y: float, base_angle_rad: float):  # <--- Parametro rinominato
         """Shotgun con spread pattern migliorato"""
@@ -7793,7 +9989,7 @@ class MissileCommander(MiniGame):
         })
         
         # Effetti aggiuntivi
-        self.synth.create_hit().play()
+        self.synth.play("hit")
         self.add_floating_text(640, 350, "⚛ NUKE LAUNCHED! ⚛", (255, 50, 255), 56)
         
         # Particelle extra per l'effetto drammatico
@@ -8001,9 +10197,6 @@ class MissileCommander(MiniGame):
         self.was_pressing = is_pressing
         # ===== FINE SISTEMA NUKE =====
 
-        if self.screen_flash > 0:
-            self.screen_flash -= dt * 3
-
         self.update_combo(dt, False)
 
         for star in self.stars:
@@ -8046,14 +10239,7 @@ class MissileCommander(MiniGame):
             if exp['lifetime'] <= 0:
                 self.explosions.remove(exp)
 
-        for p in self.particles[:]:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] += 250 * dt
-            p['vx'] *= 0.98
-            p['lifetime'] -= dt
-            if p['lifetime'] <= 0:
-                self.particles.remove(p)
+        self.particles.update(dt)
 
         for txt in self.floating_texts[:]:
             txt['y'] += txt['vy'] * dt
@@ -8107,12 +10293,12 @@ class MissileCommander(MiniGame):
                             city['alive'] = False
                             city['destroyed_time'] = self.time
                             self.health -= 1
-                            self.screen_flash = 1.2
+                            CAMERA.flash((255, 255, 255), 48, 0.4)
                             self.combo = 0
                             self.combo_multiplier = 1.0
                             self.add_floating_text(city['x'], city['y'] - 50, 
                                                  "CITY LOST!", (255, 50, 50), 42)
-                            self.synth.create_game_over().play()
+                            self.synth.play("game_over")
                             if self.health <= 0:
                                 self.game_over = True
                                 if self.total_shots > 0:
@@ -8141,7 +10327,7 @@ class MissileCommander(MiniGame):
                                                  f"+{points}", (0, 255, 255), 32)
                             self.spawn_powerup(missile['x'], missile['y'])
                             self.update_combo(dt, True)
-                            self.synth.create_score_point().play()
+                            self.synth.play("score_point")
 
                 if bullet['lifetime'] <= 0:
                     self.bullets.remove(bullet)
@@ -8183,7 +10369,7 @@ class MissileCommander(MiniGame):
 
                     if bullet['type'] == 'super_grenade':
                         self.create_explosion(bullet['x'], bullet['y'], 450, (255, 50, 255))
-                        self.screen_flash = 2.0
+                        CAMERA.flash((255, 255, 255), 50, 0.67)
                         self.add_floating_text(640, 250, "*** NUKE ***", 
                                              (255, 0, 255), 60)
                         destroyed_count = 0
@@ -8237,7 +10423,7 @@ class MissileCommander(MiniGame):
                     self.spawn_powerup(missile['x'], missile['y'])
                     self.update_combo(dt, True)
                     self.missiles_destroyed_this_wave += 1
-                    self.synth.create_score_point().play()
+                    self.synth.play("score_point")
                     hit = True
                     break
 
@@ -8275,7 +10461,7 @@ class MissileCommander(MiniGame):
 
                         self.create_explosion(pu['x'], pu['y'], 55, pu['color'])
                         self.powerups.remove(pu)
-                        self.synth.create_score_point().play()
+                        self.synth.play("score_point")
                         break
 
         if self.missiles_destroyed_this_wave >= self.missiles_needed_for_wave:
@@ -8305,16 +10491,16 @@ class MissileCommander(MiniGame):
         surface.blit(overlay, (0, 0))
         
         # GAME OVER con ombra epica
-        font_huge = pygame.font.Font(None, 100)
+        font_huge = TEXT.font(100)
         for offset in [(-3, -3), (3, -3), (-3, 3), (3, 3)]:
-            shadow = font_huge.render("GAME OVER", True, (100, 0, 0))
+            shadow = TEXT.render(font_huge, "GAME OVER", True, (100, 0, 0))
             surface.blit(shadow, (640 - shadow.get_width() // 2 + offset[0], 160 + offset[1]))
         
-        go_surf = font_huge.render("GAME OVER", True, (255, 100, 100))
+        go_surf = TEXT.render(font_huge, "GAME OVER", True, (255, 100, 100))
         surface.blit(go_surf, (640 - go_surf.get_width() // 2, 160))
         
         # ✅ STATISTICHE CORRETTE
-        font_stats = pygame.font.Font(None, 38)
+        font_stats = TEXT.font(38)
         stats = [
             f"Final Score: {self.score}",
             f"Max Combo: x{self.max_combo}",      # ✅ CORRETTO
@@ -8324,14 +10510,14 @@ class MissileCommander(MiniGame):
         
         y = 320
         for stat in stats:
-            stat_surf = font_stats.render(stat, True, (220, 255, 220))
+            stat_surf = TEXT.render(font_stats, stat, True, (220, 255, 220))
             surface.blit(stat_surf, (640 - stat_surf.get_width() // 2, y))
             y += 40
         
         # Hint lampeggiante
         hint_pulse = abs(math.sin(self.time * 4)) * 0.5 + 0.5
         hint_col = tuple(int(c * hint_pulse + (1 - hint_pulse) * 100) for c in (255, 255, 180))
-        hint_surf = font_stats.render("RIGHT CLICK TO CONTINUE", True, hint_col)
+        hint_surf = TEXT.render(font_stats, "RIGHT CLICK TO CONTINUE", True, hint_col)
         surface.blit(hint_surf, (640 - hint_surf.get_width() // 2, 570))
 
 
@@ -8366,6 +10552,7 @@ class MissileCommander(MiniGame):
 
 
 
+    @profiled
     def _draw_background(self, surface):
         """Disegna un cielo dinamico che copre TUTTO lo schermo (0-720px) e cambia col livello"""
         
@@ -8388,36 +10575,12 @@ class MissileCommander(MiniGame):
             top_col = (20, 5, 5)        # Quasi nero
             bot_col = (120, 20, 20)     # Rosso sangue
             
-        # Gestione Cache: rigenera se cambia livello o dimensioni
-        current_palette = (top_col, bot_col)
-        
-        # Controllo se dobbiamo rigenerare la surface di background
-        if (not hasattr(self, '_bg_surface') or 
-            not hasattr(self, '_last_bg_wave_palette') or 
-            self._last_bg_wave_palette != current_palette):
-            
-            self._last_bg_wave_palette = current_palette
-            
-            # Altezza TOTALE dello schermo (non fermarti al terreno!)
-            h = 720 
-            self._bg_surface = pygame.Surface((1, h))
-            
-            r1, g1, b1 = top_col
-            r2, g2, b2 = bot_col
-            
-            # Genera gradiente verticale
-            for y in range(h):
-                ratio = y / h
-                # Interpolazione lineare (lerp)
-                r = int(r1 * (1 - ratio) + r2 * ratio)
-                g = int(g1 * (1 - ratio) + g2 * ratio)
-                b = int(b1 * (1 - ratio) + b2 * ratio)
-                self._bg_surface.set_at((0, y), (r, g, b))
-        
-        # Scala per riempire TUTTO lo schermo (0,0) -> (1280, 720)
-        # Viene disegnato PRIMA di tutto, quindi ground e cities ci andranno sopra
-        scaled_bg = pygame.transform.scale(self._bg_surface, surface.get_size())
-        surface.blit(scaled_bg, (0, 0))
+        # Interpolazione lineare (lerp) su TUTTO lo schermo (non fermarti al terreno!)
+        # La cache è indicizzata per palette: si rigenera solo al cambio di livello
+        def gradient(t, y, phase):
+            return tuple(top_col[i] * (1 - t) + bot_col[i] * t for i in range(3))
+
+        GRADIENTS.draw(surface, "missile_sky", gradient, palette=(top_col, bot_col))
 
 
     def _draw_stars(self, surface):
@@ -8440,6 +10603,7 @@ class MissileCommander(MiniGame):
 
 
 
+    @profiled
     def _draw_meteors(self, surface):
         """Meteore SFUMATE: trails soft + ESPLOSIONE PARTICELLARE finale visibile"""
         visible_meteors = [m for m in self.meteors if len(m['trail']) >= 3]
@@ -8504,6 +10668,11 @@ class MissileCommander(MiniGame):
 
 
     def _draw_ground(self, surface):
+        """Terreno statico: disegnato una volta nel layer cache, poi un blit"""
+        LAYERS.draw(surface, "missile.ground", surface.get_width(), self._build_ground,
+                    (0, 660, surface.get_width(), 60), alpha=False)
+
+    def _build_ground(self, surface):
         """Disegna un terreno Cyberpunk dettagliato con griglia prospettica e texture"""
         ground_h = 60
         ground_y = 660
@@ -8560,9 +10729,22 @@ class MissileCommander(MiniGame):
         pygame.draw.line(surface, (80, 20, 80), (0, ground_y + 3), (width, ground_y + 3), 1)
 
 
+    @profiled
     def _draw_cities(self, surface):
-        """Disegna tutte le città gestendo alive/destroyed"""
-        # Batch drawing could be optimized here if needed, but loop is fine for <10 cities
+        """Disegna tutte le città gestendo alive/destroyed
+
+        Edifici e macerie stanno in un layer che si ricostruisce solo quando una città
+        cade o rinasce; luci, fumo e braci si animano sopra ogni frame.
+        """
+        key = tuple((c['x'], c['y'], c['width'], c['height'], c['type'], c['alive']) for c in self.cities)
+        LAYERS.draw(surface, "missile.cities", key, self._build_cities, (0, 560, surface.get_width(), 110))
+        for city in self.cities:
+            if city['alive']:
+                self._draw_city_lights(surface, city)
+            else:
+                self._draw_city_embers(surface, city)
+
+    def _build_cities(self, surface):
         for city in self.cities:
             if city['alive']:
                 self._draw_city_alive(surface, city)
@@ -8635,10 +10817,6 @@ class MissileCommander(MiniGame):
             pygame.draw.line(surface, c_outline, (city_x - 5, city_y - height), (city_x - 5, city_y - height - ant_h + 4), 2)
             pygame.draw.line(surface, (150, 150, 150), (city_x - 5, city_y - height - ant_h + 4), (city_x - 5, city_y - height - ant_h), 1)
 
-            # Luce rossa lampeggiante (usando ticks globali)
-            if (pygame.time.get_ticks() // 600) % 2 == 0:
-                pygame.draw.line(surface, (255, 50, 50), (city_x - 6, city_y - height - ant_h), (city_x - 4, city_y - height - ant_h), 2)
-
         else:
             # --- FACTORY: Ciminiere & Fumo ---
             chim_w = 10
@@ -8653,9 +10831,24 @@ class MissileCommander(MiniGame):
             # Banda di pericolo gialla/nera
             pygame.draw.line(surface, (200, 180, 50), (cx, cy + 4), (cx + chim_w, cy + 4), 2)
 
+    def _draw_city_lights(self, surface, city):
+        """Parti animate di una città viva (sopra il layer degli edifici)"""
+        city_x = city['x']
+        city_y = city['y']
+        width = city['width']
+        height = city['height']
+
+        if city['type'] == 'skyscraper':
+            # Luce rossa lampeggiante (usando ticks globali)
+            ant_h = 14
+            if (pygame.time.get_ticks() // 600) % 2 == 0:
+                pygame.draw.line(surface, (255, 50, 50), (city_x - 6, city_y - height - ant_h), (city_x - 4, city_y - height - ant_h), 2)
+        else:
+            cx = city_x - width//2 + 6
+            cy = city_y - height - 14
+
             # Particelle fumo (deterministico basato sul tempo per non creare oggetti)
             # Simula 3 particelle che salgono ciclicamente
-            import math
             t = pygame.time.get_ticks() / 1000.0
             for i in range(3):
                 offset = i * 2.0
@@ -8696,9 +10889,13 @@ class MissileCommander(MiniGame):
         pygame.draw.line(surface, (20, 20, 20), (city_x - 10, city_y), (city_x - 15, city_y - 18), 2)
         pygame.draw.line(surface, (20, 20, 20), (city_x + 5, city_y - 5), (city_x + 12, city_y - 20), 2)
 
+    def _draw_city_embers(self, surface, city):
+        """Braci e fumo animati sulle macerie"""
+        city_x = city['x']
+        city_y = city['y']
+
         # 3. Effetto "Brace ardenti" (Punti rossi/arancio randomici)
         # Usiamo pseudo-random per sfarfallio
-        import random
         # Genera 2-3 punti caldi che cambiano posizione leggermente
         if random.random() < 0.8:
             fx = city_x + random.randint(-15, 15)
@@ -8731,26 +10928,14 @@ class MissileCommander(MiniGame):
 
     def _draw_particles(self, surface):
         """Disegna tutte le particelle con glow"""
-        for p in self.particles:
-            alpha = p['lifetime'] / p['max_lifetime']
-            size = int(p['size'] * alpha)
-            if size > 0:
-                if p['fade']:
-                    color = tuple(int(c * alpha) for c in p['color'])
-                else:
-                    color = p['color']
-                pygame.draw.circle(surface, color, 
-                                (int(p['x']), int(p['y'])), size)
-                if size > 2:
-                    glow_color = tuple(int(c * alpha * 0.5) for c in p['color'])
-                    pygame.draw.circle(surface, glow_color, 
-                                    (int(p['x']), int(p['y'])), size + 2)
+        self.particles.draw(surface, style=ParticleSystem.STYLE_SHRINK)
 
 
 
 
 
 
+    @profiled
     def _draw_missiles(self, surface):
         """
         Renderizza missili con geometria procedurale avanzata, effetti bloom e scie dinamiche.
@@ -9025,14 +11210,15 @@ class MissileCommander(MiniGame):
             pygame.draw.polygon(surface, pu['color'], points, 5)
 
             # Icona tipo powerup
-            font = pygame.font.Font(None, 32)
+            font = TEXT.font(32)
             icons = {'shotgun': 'S', 'laser': 'L', 'grenade': 'G', 'life': '+'}
-            text = font.render(icons[pu['type']], True, (255, 255, 255))
+            text = TEXT.render(font, icons[pu['type']], True, (255, 255, 255))
             surface.blit(text, (center_x - text.get_width()//2, 
                             center_y - text.get_height()//2))
 
 
 
+    @profiled
     def _draw_tank(self, surface):
         """Tank Heavy Sci-Fi con simmetria perfetta e laser corretto (All-in-One)"""
         tank_x = self.tank_x
@@ -9256,11 +11442,11 @@ class MissileCommander(MiniGame):
                     (bar_x, bar_y, bar_width, bar_height), 3)
 
         # Testo
-        font = pygame.font.Font(None, 28)
+        font = TEXT.font(28)
         if charge_percent >= 1.0:
-            text = font.render("NUKE READY - RELEASE TO FIRE!", True, (255, 50, 255))
+            text = TEXT.render(font, "NUKE READY - RELEASE TO FIRE!", True, (255, 50, 255))
         else:
-            text = font.render(f"Charging: {int(charge_percent * 100)}%", 
+            text = TEXT.render(font, f"Charging: {int(charge_percent * 100)}%", 
                             True, (255, 255, 255))
         surface.blit(text, (bar_x + bar_width//2 - text.get_width()//2, bar_y - 35))
 
@@ -9268,19 +11454,20 @@ class MissileCommander(MiniGame):
         """Disegna i testi fluttuanti (combo, punteggi, etc)"""
         for txt in self.floating_texts:
             alpha = txt['lifetime'] / txt['max_lifetime']
-            font = pygame.font.Font(None, txt['size'])
+            font = TEXT.font(txt['size'])
             text_surf = font.render(txt['text'], True, txt['color'])
             if alpha < 0.3:
                 text_surf.set_alpha(int(alpha / 0.3 * 255))
             surface.blit(text_surf, (int(txt['x']) - text_surf.get_width()//2, 
                                 int(txt['y'])))
 
+    @profiled
     def _draw_hud(self, surface):
         """Disegna l'HUD completo (score, health, combo, powerup, etc)"""
-        font_score = pygame.font.Font(None, 52)
-        font_medium = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
-        font_combo_big = pygame.font.Font(None, 44)
+        font_score = TEXT.font(52)
+        font_medium = TEXT.font(32)
+        font_small = TEXT.font(24)
+        font_combo_big = TEXT.font(44)
 
         def draw_text_shadow(text, font, x, y, color, shadow_offset=2, alpha=255):
             shadow = font.render(text, True, (0, 0, 0))
@@ -9295,7 +11482,6 @@ class MissileCommander(MiniGame):
         self._draw_hud_powerup(surface, font_small)
         self._draw_hud_progress(surface, font_small)
         self._draw_hud_combo(surface, font_combo_big, font_small)
-        self._draw_hud_flash(surface)
         self._draw_hud_pause(surface)
 
     def _draw_hud_score(self, surface, font_score, font_small, draw_text_shadow):
@@ -9316,7 +11502,7 @@ class MissileCommander(MiniGame):
         hp_spacing = 28
 
         # Label
-        hp_label = font_small.render("HP", True, (200, 200, 200))
+        hp_label = TEXT.render(font_small, "HP", True, (200, 200, 200))
         surface.blit(hp_label, (hp_start_x - 40, hp_y - 3))
 
         # Pallini
@@ -9409,7 +11595,7 @@ class MissileCommander(MiniGame):
 
         # Counter
         prog_text = f"{self.missiles_destroyed_this_wave}/{self.missiles_needed_for_wave}"
-        prog_label = font_small.render(prog_text, True, (140, 140, 140))
+        prog_label = TEXT.render(font_small, prog_text, True, (140, 140, 140))
         prog_label_w = prog_label.get_width()
         surface.blit(prog_label, (640 - prog_label_w // 2, progress_y + 8))
 
@@ -9455,7 +11641,7 @@ class MissileCommander(MiniGame):
         surface.blit(border_surf, (combo_container_x, combo_container_y))
 
         # Label
-        label_font = pygame.font.Font(None, 20)
+        label_font = TEXT.font(20)
         label_surf = label_font.render(combo_label, True, combo_color)
         label_surf.set_alpha(220)
         label_w = label_surf.get_width()
@@ -9468,7 +11654,7 @@ class MissileCommander(MiniGame):
         combo_num_w = combo_num_surf.get_width()
         surface.blit(combo_num_surf, (combo_base_x + 45 - combo_num_w // 2, combo_base_y + 18))
 
-        combo_main_surf = font_combo_big.render(combo_text, True, combo_color)
+        combo_main_surf = TEXT.render(font_combo_big, combo_text, True, combo_color)
         surface.blit(combo_main_surf, (combo_base_x + 45 - combo_num_w // 2, combo_base_y + 18))
 
         # Timer bar
@@ -9495,14 +11681,6 @@ class MissileCommander(MiniGame):
 
         pygame.draw.rect(surface, (120, 120, 130), (timer_x, timer_y, timer_w, timer_h), 1)
 
-    def _draw_hud_flash(self, surface):
-        """Disegna il flash dello schermo"""
-        if self.screen_flash > 0:
-            flash_alpha = min(50, int(self.screen_flash * 40))
-            flash_surf = pygame.Surface((1280, 720), pygame.SRCALPHA)
-            flash_surf.fill((255, 255, 255, flash_alpha))
-            surface.blit(flash_surf, (0, 0))
-
     def _draw_hud_pause(self, surface):
         """Disegna il menu di pausa"""
         if not (self.paused and self.confirm_exit):
@@ -9523,8 +11701,8 @@ class MissileCommander(MiniGame):
         pygame.draw.rect(surface, (100, 180, 255), (pause_x, pause_y, pause_w, 3))
 
         # Titolo
-        pause_font = pygame.font.Font(None, 64)
-        pause_text = pause_font.render("PAUSED", True, (255, 255, 255))
+        pause_font = TEXT.font(64)
+        pause_text = TEXT.render(pause_font, "PAUSED", True, (255, 255, 255))
         pause_text_w = pause_text.get_width()
         surface.blit(pause_text, (640 - pause_text_w // 2, pause_y + 35))
 
@@ -9534,18 +11712,18 @@ class MissileCommander(MiniGame):
         pygame.draw.line(surface, (60, 60, 70), (sep_x, pause_y + 105), (sep_x + sep_w, pause_y + 105), 1)
 
         # Opzioni
-        opt_font = pygame.font.Font(None, 28)
+        opt_font = TEXT.font(28)
 
-        exit_icon = opt_font.render("◀", True, (255, 100, 100))
-        exit_text = opt_font.render("LEFT CLICK", True, (255, 100, 100))
-        exit_label = opt_font.render("Exit Game", True, (200, 200, 200))
+        exit_icon = TEXT.render(opt_font, "◀", True, (255, 100, 100))
+        exit_text = TEXT.render(opt_font, "LEFT CLICK", True, (255, 100, 100))
+        exit_label = TEXT.render(opt_font, "Exit Game", True, (200, 200, 200))
         surface.blit(exit_icon, (pause_x + 30, pause_y + 125))
         surface.blit(exit_text, (pause_x + 55, pause_y + 125))
         surface.blit(exit_label, (pause_x + 190, pause_y + 125))
 
-        cont_icon = opt_font.render("▶", True, (100, 255, 100))
-        cont_text = opt_font.render("RIGHT CLICK", True, (100, 255, 100))
-        cont_label = opt_font.render("Continue", True, (200, 200, 200))
+        cont_icon = TEXT.render(opt_font, "▶", True, (100, 255, 100))
+        cont_text = TEXT.render(opt_font, "RIGHT CLICK", True, (100, 255, 100))
+        cont_label = TEXT.render(opt_font, "Continue", True, (200, 200, 200))
         surface.blit(cont_icon, (pause_x + 30, pause_y + 165))
         surface.blit(cont_text, (pause_x + 55, pause_y + 165))
         surface.blit(cont_label, (pause_x + 210, pause_y + 165))
@@ -9606,9 +11784,7 @@ class SpinnerDefense(MiniGame):
         self.combo_multiplier = 1.0
 
         # Visual effects
-        self.particles = []
-        self.screen_shake = 0
-        self.flash_timer = 0
+        self.particles = ParticleSystem()
         self.time = 0
         self.bullets = []
         self.bullet_time = 1.0
@@ -9632,6 +11808,10 @@ class SpinnerDefense(MiniGame):
         self.multishot_ammo = 0
         self.pierce_ammo = 0
 
+        # Broadphase collisioni (ricostruite a ogni frame)
+        self.enemy_grid = SpatialHash(64)
+        self.bullet_grid = SpatialHash(64)
+
         # Enemy types
         self.enemy_types = {
             'basic': {'health': 1, 'speed': 80, 'points': 10, 'color': (255, 100, 100), 'size': 10},
@@ -9640,6 +11820,7 @@ class SpinnerDefense(MiniGame):
             'zigzag': {'health': 1, 'speed': 100, 'points': 30, 'color': (100, 255, 180), 'size': 11},
             'swirl': {'health': 1, 'speed': 90, 'points': 35, 'color': (255, 150, 255), 'size': 9}
         }
+        self.max_enemy_size = max(e['size'] for e in self.enemy_types.values())
 
         # Fonts
         self.font_huge = None
@@ -9667,8 +11848,6 @@ class SpinnerDefense(MiniGame):
         self.accuracy = 0
 
         # Arcade effects
-        self.camera_shake_x = 0
-        self.camera_shake_y = 0
         self.time_slow = 1.0
         self.perfect_shot_streak = 0
 
@@ -9695,13 +11874,11 @@ class SpinnerDefense(MiniGame):
         self.combo_max = 0
         self.last_hit_time = 0
         self.combo_multiplier = 1.0
-        self.particles = []
+        self.particles = ParticleSystem()
         self.explosions = []
         self.floating_texts = []
         self.bullets = []
         self.power_ups = []
-        self.screen_shake = 0
-        self.flash_timer = 0
         self.time = 0
         self.power_up_spawn_timer = 8.0
         self.shield_active = False
@@ -9724,8 +11901,6 @@ class SpinnerDefense(MiniGame):
         self.total_shots = 0
         self.total_hits = 0
         self.accuracy = 0
-        self.camera_shake_x = 0
-        self.camera_shake_y = 0
         self.time_slow = 1.0
         self.bullet_time = 1.0
         self.bullet_time_timer = 0
@@ -9773,14 +11948,14 @@ class SpinnerDefense(MiniGame):
             if not hasattr(self, 'paused') or not self.paused:
                 self.paused = True
                 self.confirmexit = True
-                self.synth.create_blip(0).play()
+                self.synth.play_blip(0)
             else:
                 self.paused = False
                 self.confirmexit = False
-                self.synth.create_select().play()
+                self.synth.play("select")
         
         if spinner.is_left_clicked() and hasattr(self, 'paused') and self.paused:
-            self.synth.create_back().play()
+            self.synth.play("back")
             self.game_over = True
             return False
         
@@ -9844,20 +12019,6 @@ class SpinnerDefense(MiniGame):
         self._update_floating_texts(dt)
         self._update_power_ups(effective_dt)
 
-        # Camera shake
-        if self.screen_shake > 0:
-            self.screen_shake -= dt * 6
-            self.screen_shake = max(0, self.screen_shake)
-            intensity = self.screen_shake * 15
-            self.camera_shake_x = random.uniform(-intensity, intensity)
-            self.camera_shake_y = random.uniform(-intensity, intensity)
-        else:
-            self.camera_shake_x *= 0.8
-            self.camera_shake_y *= 0.8
-
-        if self.flash_timer > 0:
-            self.flash_timer -= dt * 4
-
         if self.hit_flash > 0:
             self.hit_flash -= dt * 6
 
@@ -9955,6 +12116,7 @@ class SpinnerDefense(MiniGame):
 
 
     def _update_power_ups(self, dt: float):
+        bullet_grid = None  # costruita solo se serve
         for pu in self.power_ups[:]:
             if pu['collected']:
                 continue
@@ -9972,13 +12134,8 @@ class SpinnerDefense(MiniGame):
 
             if pu['lifetime'] <= 0:
                 # Fade out animation
-                for _ in range(15):
-                    angle = random.uniform(0, 2 * math.pi)
-                    speed = random.uniform(50, 150)
-                    self._add_particle(pu['x'], pu['y'], pu['color'],
-                                    vx=math.cos(angle) * speed,
-                                    vy=math.sin(angle) * speed,
-                                    size=3, life=0.5, gravity=False)
+                self._add_particle(pu['x'], pu['y'], pu['color'], speed=(50, 150),
+                                   size=3, life=0.5, gravity=False, count=15)
                 self.power_ups.remove(pu)
                 continue
 
@@ -9993,32 +12150,33 @@ class SpinnerDefense(MiniGame):
                                 size=2, life=0.4, gravity=False)
 
             # COLLISION CON PROIETTILI (non più con player)
-            for bullet in self.bullets[:]:
-                dist = math.sqrt((pu['x'] - bullet['x'])**2 + (pu['y'] - bullet['y'])**2)
-                if dist < 30:  # Raggio di collisione powerup
+            if bullet_grid is None:
+                bullet_grid = self.bullet_grid
+                bullet_grid.rebuild(self.bullets)
+            for bullet in bullet_grid.query(pu['x'], pu['y'], 30):
+                dx = pu['x'] - bullet['x']
+                dy = pu['y'] - bullet['y']
+                if dx * dx + dy * dy < 900:  # Raggio di collisione powerup (30)
                     self._collect_power_up(pu)
                     pu['collected'] = True
                     self.power_ups.remove(pu)
                     # Rimuovi anche il proiettile che ha colpito il powerup
-                    if bullet in self.bullets:
-                        self.bullets.remove(bullet)
+                    bullet_grid.remove(bullet)
+                    self.bullets.remove(bullet)
                     break
 
 
 
     def _collect_power_up(self, pu):
-        self.synth.create_high_score().play()
+        self.synth.play("high_score")
         self._add_explosion(pu['x'], pu['y'], pu['color'], 35)
-        self.screen_shake = 0.6
+        self._shake(0.6)
 
         # Ring explosion effect
-        for i in range(20):
-            angle = (i / 20) * 2 * math.pi
-            speed = 200
-            self._add_particle(pu['x'], pu['y'], pu['color'],
-                             vx=math.cos(angle) * speed,
-                             vy=math.sin(angle) * speed,
-                             size=4, life=0.6, gravity=False)
+        ring = np.arange(20) / 20 * 2 * math.pi
+        self._add_particle(pu['x'], pu['y'], pu['color'],
+                           vx=np.cos(ring) * 200, vy=np.sin(ring) * 200,
+                           size=4, life=0.6, gravity=False, count=20)
 
         if pu['type'] == 'LIFE':
             if self.lives < self.max_lives:
@@ -10049,6 +12207,8 @@ class SpinnerDefense(MiniGame):
             angle = random.uniform(0, 360)
 
             max_attempts = 8
+            min_distance_sq = 80 * 80
+            self.enemy_grid.rebuild(self.enemies)
             for attempt in range(max_attempts):
                 rad = math.radians(angle)
                 spawn_distance = 650
@@ -10056,42 +12216,26 @@ class SpinnerDefense(MiniGame):
                 new_y = 360 + math.sin(rad) * spawn_distance
 
                 too_close = False
-                min_distance = 80
 
-                for enemy in self.enemies:
-                    dist = math.sqrt((enemy['x'] - new_x)**2 + (enemy['y'] - new_y)**2)
-                    if dist < min_distance:
+                for enemy in self.enemy_grid.query(new_x, new_y, 80):
+                    dx = enemy['x'] - new_x
+                    dy = enemy['y'] - new_y
+                    if dx * dx + dy * dy < min_distance_sq:
                         too_close = True
                         break
 
                 # Check power-ups distance
-                for pu in self.power_ups:
-                    if not pu['collected']:
-                        dist = math.sqrt((pu['x'] - new_x)**2 + (pu['y'] - new_y)**2)
-                        if dist < 100:
-                            too_close = True
-                            break
+                if not too_close:
+                    for pu in self.power_ups:
+                        if not pu['collected']:
+                            dx = pu['x'] - new_x
+                            dy = pu['y'] - new_y
+                            if dx * dx + dy * dy < 10000:  # 100 px
+                                too_close = True
+                                break
 
                 if not too_close:
-                    enemy_data = self.enemy_types[enemy_type].copy()
-                    self.enemies.append({
-                        'x': new_x,
-                        'y': new_y,
-                        'angle': angle,
-                        'type': enemy_type,
-                        'health': enemy_data['health'],
-                        'max_health': enemy_data['health'],
-                        'speed': enemy_data['speed'] * (1 + self.level * 0.05),
-                        'points': enemy_data['points'],
-                        'color': enemy_data['color'],
-                        'size': enemy_data['size'],
-                        'hit_flash': 0,
-                        'spawn_anim': 1.0,
-                        'zigzag_offset': random.uniform(0, math.pi * 2),
-                        'zigzag_time': 0,
-                        'swirl_angle': 0,
-                        'rotation': 0
-                    })
+                    self.enemies.append(self._make_enemy(enemy_type, new_x, new_y, angle))
                     break
 
                 angle = random.uniform(0, 360)
@@ -10099,6 +12243,27 @@ class SpinnerDefense(MiniGame):
             base_spawn_time = max(0.4, 1.8 - self.level * 0.05 - self.wave * 0.03)
             self.spawn_timer = base_spawn_time * random.uniform(0.8, 1.3)
 
+    def _make_enemy(self, enemy_type: str, x: float, y: float, angle: float) -> dict:
+        enemy_data = self.enemy_types[enemy_type]
+        return {
+            'x': x,
+            'y': y,
+            'angle': angle,
+            'type': enemy_type,
+            'health': enemy_data['health'],
+            'max_health': enemy_data['health'],
+            'speed': enemy_data['speed'] * (1 + self.level * 0.05),
+            'points': enemy_data['points'],
+            'color': enemy_data['color'],
+            'size': enemy_data['size'],
+            'hit_flash': 0,
+            'spawn_anim': 1.0,
+            'zigzag_offset': random.uniform(0, math.pi * 2),
+            'zigzag_time': 0,
+            'swirl_angle': 0,
+            'rotation': 0
+        }
+
     def _get_random_enemy_type(self) -> str:
         if self.level < 2:
             choices = ['basic'] * 80 + ['fast'] * 20
@@ -10114,6 +12279,7 @@ class SpinnerDefense(MiniGame):
         return random.choice(choices)
 
     def _update_enemies(self, dt: float):
+        trails = []
         for enemy in self.enemies[:]:
             # Animations
             enemy['rotation'] += dt * 3
@@ -10145,7 +12311,7 @@ class SpinnerDefense(MiniGame):
             enemy['y'] -= math.sin(rad) * enemy['speed'] * dt
 
             if random.random() < 0.2:
-                self._add_particle(enemy['x'], enemy['y'], enemy['color'], size=1.5, life=0.3, gravity=False)
+                trails.append((enemy['x'], enemy['y'], enemy['color']))
 
             dist = math.sqrt((enemy['x'] - 640)**2 + (enemy['y'] - 360)**2)
 
@@ -10156,16 +12322,16 @@ class SpinnerDefense(MiniGame):
                     self.shield_power -= 1
                     self._add_explosion(enemy['x'], enemy['y'], (120, 220, 255), 25)
                     self._add_floating_text(640, 360, "BLOCKED", (120, 220, 255), 0.6)
-                    self.synth.create_blip(1).play()
+                    self.synth.play_blip(1)
                     if self.shield_power <= 0:
                         self.shield_active = False
                 else:
                     self.lives -= 1
                     self._add_explosion(enemy['x'], enemy['y'], (255, 100, 100), 40)
-                    self.screen_shake = 1.5
-                    self.flash_timer = 0.5
+                    self._shake(1.5)
+                    CAMERA.flash((255, 80, 80), 50, 0.125)
                     self.hit_flash = 1.0
-                    self.synth.create_hit().play()
+                    self.synth.play("hit")
                     self._add_floating_text(640, 280, "DAMAGE", (255, 100, 100), 1.0)
 
                     self.combo = 0
@@ -10174,9 +12340,11 @@ class SpinnerDefense(MiniGame):
 
                     if self.lives <= 0:
                         self.game_over = True
-                        self.synth.create_game_over().play()
+                        self.synth.play("game_over")
                         self._add_floating_text(640, 360, "GAME OVER", (255, 80, 80), 3.0)
 
+        self._emit_trails(trails, size=1.5, life=0.3)
+
     def _handle_shoot(self):
         self.total_shots += 1
         self.weapon_charge = 0
@@ -10231,7 +12399,7 @@ class SpinnerDefense(MiniGame):
 
         rad = math.radians(self.rotation)
         self._create_muzzle_flash(rad, (255, 220, 80), 20)
-        self.screen_shake = 0.5
+        self._shake(0.5)
 
     def _shoot_multishot(self):
         for angle_offset in [-25, 0, 25]:
@@ -10250,7 +12418,7 @@ class SpinnerDefense(MiniGame):
 
         rad = math.radians(self.rotation)
         self._create_muzzle_flash(rad, (255, 180, 100), 15)
-        self.screen_shake = 0.35
+        self._shake(0.35)
 
     def _shoot_pierce(self):
         rad = math.radians(self.rotation)
@@ -10269,32 +12437,25 @@ class SpinnerDefense(MiniGame):
         })
 
         self._create_muzzle_flash(rad, (180, 100, 255), 12)
-        self.screen_shake = 0.25
+        self._shake(0.25)
 
     def _create_muzzle_flash(self, rad, color, count):
         flash_x = 640 + math.cos(rad) * 50
         flash_y = 360 + math.sin(rad) * 50
-        for _ in range(count):
-            angle = rad + random.uniform(-0.5, 0.5)
-            speed = random.uniform(180, 350)
-            self._add_particle(flash_x, flash_y, color, 
-                             vx=math.cos(angle) * speed,
-                             vy=math.sin(angle) * speed,
-                             size=random.uniform(3, 6), life=0.25, gravity=False)
+        self._add_particle(flash_x, flash_y, color, angle=(rad - 0.5, rad + 0.5), speed=(180, 350),
+                           size=(3, 6), life=0.25, gravity=False, count=count)
 
     def _update_bullets(self, dt: float):
-        for bullet in self.bullets[:]:
+        trails = []
+        survivors = []
+        enemy_grid = self.enemy_grid
+        enemy_grid.rebuild(self.enemies)
+        for bullet in self.bullets:
             bullet['life'] -= dt
             if bullet['life'] <= 0:
                 # Death animation
-                for _ in range(5):
-                    angle = random.uniform(0, 2 * math.pi)
-                    speed = random.uniform(50, 100)
-                    self._add_particle(bullet['x'], bullet['y'], bullet['color'],
-                                     vx=math.cos(angle) * speed,
-                                     vy=math.sin(angle) * speed,
-                                     size=2, life=0.2, gravity=False)
-                self.bullets.remove(bullet)
+                self._add_particle(bullet['x'], bullet['y'], bullet['color'], speed=(50, 100),
+                                   size=2, life=0.2, gravity=False, count=5)
                 continue
 
             bullet['rotation'] += dt * 10
@@ -10303,27 +12464,24 @@ class SpinnerDefense(MiniGame):
 
             # Trail
             if random.random() < 0.7:
-                self._add_particle(bullet['x'], bullet['y'], bullet['color'], 
-                                 size=2.5, life=0.2, gravity=False)
+                trails.append((bullet['x'], bullet['y'], bullet['color']))
 
-            # Collision con nemici (NON con power-ups!)
+            # Collision con nemici (NON con power-ups!): broadphase a griglia + distanza al quadrato
             hit_enemy = False
-            for enemy in self.enemies[:]:
-                dist = math.sqrt((enemy['x'] - bullet['x'])**2 + (enemy['y'] - bullet['y'])**2)
-                if dist < enemy['size'] + bullet['size']:
+            bx, by = bullet['x'], bullet['y']
+            for enemy in enemy_grid.query(bx, by, bullet['size'] + self.max_enemy_size):
+                dx = enemy['x'] - bx
+                dy = enemy['y'] - by
+                reach = enemy['size'] + bullet['size']
+                if dx * dx + dy * dy < reach * reach:
                     self.total_hits += 1
                     enemy['health'] -= 1
                     enemy['hit_flash'] = 1.0
 
                     self._add_explosion(enemy['x'], enemy['y'], (255, 255, 180), 15)
 
-                    for _ in range(8):
-                        angle = random.uniform(0, 2 * math.pi)
-                        speed = random.uniform(120, 300)
-                        self._add_particle(enemy['x'], enemy['y'], (255, 255, 220),
-                                         vx=math.cos(angle) * speed,
-                                         vy=math.sin(angle) * speed,
-                                         size=3, life=0.3, gravity=False)
+                    self._add_particle(enemy['x'], enemy['y'], (255, 255, 220), speed=(120, 300),
+                                       size=3, life=0.3, gravity=False, count=8)
 
                     if enemy['health'] <= 0:
                         self._kill_enemy(enemy)
@@ -10332,20 +12490,26 @@ class SpinnerDefense(MiniGame):
                         bullet['pierce_count'] = bullet.get('pierce_count', 0) + 1
                         if bullet['pierce_count'] >= bullet.get('max_pierce', 5):
                             hit_enemy = True
-                        self.synth.create_score_point().play()
+                        self.synth.play("score_point")
                     else:
                         hit_enemy = True
 
                     break
 
-            if hit_enemy and bullet in self.bullets:
-                self.bullets.remove(bullet)
+            if hit_enemy:
+                continue
 
             if bullet['x'] < -100 or bullet['x'] > 1380 or bullet['y'] < -100 or bullet['y'] > 820:
-                self.bullets.remove(bullet)
+                continue
+
+            survivors.append(bullet)
+
+        self.bullets = survivors
+        self._emit_trails(trails, size=2.5, life=0.2)
 
     def _kill_enemy(self, enemy):
         self.enemies.remove(enemy)
+        self.enemy_grid.remove(enemy)
 
         current_time = self.time
         if current_time - self.last_hit_time < 3.0:
@@ -10371,7 +12535,7 @@ class SpinnerDefense(MiniGame):
         self.score += points
 
         self._add_explosion(enemy['x'], enemy['y'], enemy['color'], 30)
-        self.screen_shake = 0.3
+        self._shake(0.3)
 
         combo_color = self._get_combo_color()
         if self.combo > 1:
@@ -10381,7 +12545,7 @@ class SpinnerDefense(MiniGame):
             self._add_floating_text(enemy['x'], enemy['y'], f"+{points}", 
                                   (255, 255, 180), 0.6)
 
-        self.synth.create_score_point().play()
+        self.synth.play("score_point")
 
         if self.combo == 5:
             self._add_floating_text(640, 250, "COMBO x5", (255, 220, 120), 1.0)
@@ -10401,6 +12565,7 @@ class SpinnerDefense(MiniGame):
         for enemy in self.enemies:
             self._add_explosion(enemy['x'], enemy['y'], enemy['color'], 25)
         self.enemies.clear()
+        self.enemy_grid.clear()
 
         bonus = self.wave * 200 + self.combo * 50
         self.score += bonus
@@ -10431,29 +12596,23 @@ class SpinnerDefense(MiniGame):
             return (180, 255, 255)
 
     def _add_particle(self, x: float, y: float, color: Tuple[int, int, int], 
-                     vx: float = None, vy: float = None, size: float = 2, 
-                     life: float = 0.4, gravity: bool = True):
-        if vx is None:
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(30, 90)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-
-        self.particles.append({
-            'x': x,
-            'y': y,
-            'vx': vx,
-            'vy': vy,
-            'life': life,
-            'max_life': life,
-            'color': color,
-            'size': size,
-            'gravity': gravity
-        })
+                     vx: float = None, vy: float = None, size=2, 
+                     life=0.4, gravity: bool = True, count: int = 1,
+                     speed=(30, 90), angle=(0, 2 * math.pi)):
+        """Emette count particelle (velocità esplicite o burst radiale)"""
+        self.particles.emit(x, y, count, color, vx=vx, vy=vy, speed=speed, angle=angle,
+                            size=size, life=life,
+                            gravity=300 if gravity else 0.0, drag=0.97 if gravity else 1.0)
+
+    def _emit_trails(self, trails: List[Tuple[float, float, Tuple[int, int, int]]], size: float, life: float):
+        """Una sola emit per tutte le scie del frame"""
+        if trails:
+            xs, ys, colors = zip(*trails)
+            self._add_particle(np.array(xs), np.array(ys), np.array(colors), size=size, life=life,
+                               gravity=False, count=len(trails))
 
     def _add_explosion(self, x: float, y: float, color: Tuple[int, int, int], count: int = 15):
-        for _ in range(count):
-            self._add_particle(x, y, color, size=random.uniform(2, 5), life=random.uniform(0.3, 0.7))
+        self._add_particle(x, y, color, size=(2, 5), life=(0.3, 0.7), count=count)
 
     def _add_floating_text(self, x: float, y: float, text: str, color: Tuple[int, int, int], duration: float):
         self.floating_texts.append({
@@ -10468,18 +12627,7 @@ class SpinnerDefense(MiniGame):
         })
 
     def _update_particles(self, dt: float):
-        for particle in self.particles[:]:
-            particle['life'] -= dt
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-                continue
-
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-
-            if particle['gravity']:
-                particle['vy'] += 300 * dt
-                particle['vx'] *= 0.97
+        self.particles.update(dt)
 
     def _update_floating_texts(self, dt: float):
         for text in self.floating_texts[:]:
@@ -10534,24 +12682,28 @@ class SpinnerDefense(MiniGame):
 
 
 
-    def draw(self, surface: pygame.Surface):
-        shake_x = int(self.camera_shake_x)
-        shake_y = int(self.camera_shake_y)
+    def _shake(self, amount: float):
+        """Camera shake: 15 px per unita', smorzato a zero in amount/6 secondi"""
+        CAMERA.shake(amount * 15, amount / 6, decay=True)
 
+    def draw(self, surface: pygame.Surface):
+        # Shake e flash li applica la camera in composizione
         # Background gradient dinamico
-        for y in range(720):
-            factor = y / 720
-            wave = math.sin(self.time * 0.4 + factor * 2.5) * 4
-            combo_boost = min(20, self.combo * 2)
-            r = max(0, min(255, int(2 + wave + combo_boost * 0.2)))
-            g = max(0, min(255, int(3 + wave + combo_boost * 0.3)))
-            b = max(0, min(255, int(15 + wave + combo_boost * 0.5)))
-
-            if self.time_slow < 1.0:
-                b = min(255, b + 30)
-                r = max(0, r - 10)
-
-            pygame.draw.line(surface, (r, g, b), (0, y), (1280, y))
+        combo_boost = min(20, self.combo * 2)
+        slow = self.time_slow < 1.0
+
+        def gradient(t, y, phase):
+            wave = np.sin(phase + t * 2.5) * 4
+            r = np.clip(np.trunc(2 + wave + combo_boost * 0.2), 0, 255)
+            g = np.clip(np.trunc(3 + wave + combo_boost * 0.3), 0, 255)
+            b = np.clip(np.trunc(15 + wave + combo_boost * 0.5), 0, 255)
+            if slow:
+                b = b + 30
+                r = r - 10
+            return r, g, b
+
+        GRADIENTS.draw(surface, "defense_background", gradient, (self.time * 0.4) % (math.pi * 2),
+                       quantum=0.1, palette=(combo_boost, slow))
 
         # Stars
         for star in self.stars:
@@ -10559,8 +12711,8 @@ class SpinnerDefense(MiniGame):
             brightness = int(star['brightness'] * 255 * twinkle)
             color = (brightness, brightness, min(255, brightness + 50))
 
-            x = int(star['x'] + shake_x)
-            y = int(star['y'] + shake_y)
+            x = int(star['x'])
+            y = int(star['y'])
 
             if 0 <= x < 1280 and 0 <= y < 720:
                 if star['size'] > 1:
@@ -10581,8 +12733,8 @@ class SpinnerDefense(MiniGame):
             if self.combo > 5:
                 alpha = min(255, alpha + self.combo * 3)
             color = (70, 90, 160)
-            x = int(line['x'] + shake_x)
-            y = int(line['y'] + shake_y)
+            x = int(line['x'])
+            y = int(line['y'])
 
             if -line['length'] <= x < 1280 and 0 <= y < 720:
                 line_surf = pygame.Surface((max(1, line['length']), line['thickness'] * 2), pygame.SRCALPHA)
@@ -10590,8 +12742,8 @@ class SpinnerDefense(MiniGame):
                                (line['length'], line['thickness']), line['thickness'])
                 surface.blit(line_surf, (x, y))
 
-        center_x = 640 + shake_x
-        center_y = 360 + shake_y
+        center_x = 640
+        center_y = 360
 
         # Shield con rotazione
         if self.shield_active:
@@ -10770,8 +12922,8 @@ class SpinnerDefense(MiniGame):
 
         # Bullets
         for bullet in self.bullets:
-            x = int(bullet['x'] + shake_x)
-            y = int(bullet['y'] + shake_y)
+            x = int(bullet['x'])
+            y = int(bullet['y'])
 
             # Rotating bullet
             bullet_surf = pygame.Surface((int(bullet['size'] * 8), int(bullet['size'] * 8)), pygame.SRCALPHA)
@@ -10796,26 +12948,12 @@ class SpinnerDefense(MiniGame):
             surface.blit(bullet_surf, (x - center_b, y - center_b))
 
         # Particles
-        for particle in self.particles:
-            alpha_factor = particle['life'] / particle['max_life']
-            size = particle['size'] * alpha_factor
-
-            if size > 0.5:
-                x = int(particle['x'] + shake_x)
-                y = int(particle['y'] + shake_y)
-
-                if -50 <= x < 1330 and -50 <= y < 770:
-                    glow_surf = pygame.Surface((int(size * 4), int(size * 4)), pygame.SRCALPHA)
-                    color_alpha = (*particle['color'], int(100 * alpha_factor))
-                    pygame.draw.circle(glow_surf, color_alpha, (int(size * 2), int(size * 2)), int(size * 2))
-                    surface.blit(glow_surf, (x - int(size * 2), y - int(size * 2)))
-
-                    pygame.draw.circle(surface, particle['color'], (x, y), max(1, int(size)))
+        self.particles.draw(surface, style=ParticleSystem.STYLE_GLOW)
 
         # Enemies con animazioni migliorate
         for enemy in self.enemies:
-            x = int(enemy['x'] + shake_x)
-            y = int(enemy['y'] + shake_y)
+            x = int(enemy['x'])
+            y = int(enemy['y'])
 
             spawn_scale = max(0.1, 1.0 - enemy['spawn_anim'] * 0.5)
             size = int(enemy['size'] * spawn_scale)
@@ -10888,8 +13026,8 @@ class SpinnerDefense(MiniGame):
             if pu.get('collected', False):
                 continue
 
-            x = int(pu['x'] + shake_x)
-            y = int(pu['y'] + shake_y)
+            x = int(pu['x'])
+            y = int(pu['y'])
 
             # Spawn animation
             spawn_scale = 1.0 - pu['spawn_anim'] * 0.5
@@ -10965,12 +13103,6 @@ class SpinnerDefense(MiniGame):
             bt_text.set_alpha(int((math.sin(self.time * 10) * 0.5 + 0.5) * 200 + 55))
             surface.blit(bt_text, (640 - bt_text.get_width() // 2, 650))
 
-        # Flash
-        if self.flash_timer > 0:
-            flash_surf = pygame.Surface((1280, 720), pygame.SRCALPHA)
-            flash_surf.fill((255, 80, 80, int(100 * self.flash_timer)))
-            surface.blit(flash_surf, (0, 0))
-
         if self.game_over:
             self._draw_game_over(surface)
 
@@ -10992,11 +13124,12 @@ class SpinnerDefense(MiniGame):
 
 
 
+    @profiled
     def _draw_minimal_hud(self, surface: pygame.Surface):
         hud_surf = pygame.Surface((1280, 720), pygame.SRCALPHA)
 
         # Score
-        score_surf = self.font_medium.render(f"{self.score}", True, (255, 255, 220))
+        score_surf = TEXT.render(self.font_medium, f"{self.score}", True, (255, 255, 220))
         hud_surf.blit(score_surf, (18, 12))
 
         # Lives
@@ -11005,17 +13138,17 @@ class SpinnerDefense(MiniGame):
             self._draw_mini_heart(hud_surf, heart_x, 55, (255, 120, 180), 11)
 
         # Level/Wave
-        level_surf = self.font_small.render(f"L{self.level}", True, (180, 255, 180))
+        level_surf = TEXT.render(self.font_small, f"L{self.level}", True, (180, 255, 180))
         hud_surf.blit(level_surf, (1230, 14))
 
-        wave_surf = self.font_tiny.render(f"W{self.wave}", True, (180, 220, 255))
+        wave_surf = TEXT.render(self.font_tiny, f"W{self.wave}", True, (180, 220, 255))
         hud_surf.blit(wave_surf, (1230, 42))
 
         # Combo
         if self.combo > 1:
             combo_text = f"x{self.combo}"
             combo_col = self._get_combo_color()
-            combo_surf = self.font_medium.render(combo_text, True, combo_col)
+            combo_surf = TEXT.render(self.font_medium, combo_text, True, combo_col)
 
             timer_ratio = self.combo_timer / 4.0
             bar_w = 100
@@ -11043,7 +13176,7 @@ class SpinnerDefense(MiniGame):
             pu_list.append((f"AUTO {self.uzi_ammo}", (80, 255, 220)))
 
         for text, color in pu_list:
-            pu_surf = self.font_small.render(text, True, color)
+            pu_surf = TEXT.render(self.font_small, text, True, color)
             hud_surf.blit(pu_surf, (18, pu_y))
             pu_y -= 26
 
@@ -11071,9 +13204,9 @@ class SpinnerDefense(MiniGame):
         overlay.fill((0, 0, 0, 210))
         surface.blit(overlay, (0, 0))
 
-        go_surf = self.font_huge.render("GAME OVER", True, (255, 100, 100))
+        go_surf = TEXT.render(self.font_huge, "GAME OVER", True, (255, 100, 100))
         for offset in [(-3, -3), (3, -3), (-3, 3), (3, 3)]:
-            shadow = self.font_huge.render("GAME OVER", True, (100, 0, 0))
+            shadow = TEXT.render(self.font_huge, "GAME OVER", True, (100, 0, 0))
             surface.blit(shadow, (640 - shadow.get_width() // 2 + offset[0], 160 + offset[1]))
         surface.blit(go_surf, (640 - go_surf.get_width() // 2, 160))
 
@@ -11086,13 +13219,13 @@ class SpinnerDefense(MiniGame):
 
         y = 320
         for stat in stats:
-            stat_surf = self.font_small.render(stat, True, (220, 255, 220))
+            stat_surf = TEXT.render(self.font_small, stat, True, (220, 255, 220))
             surface.blit(stat_surf, (640 - stat_surf.get_width() // 2, y))
             y += 40
 
         hint_pulse = abs(math.sin(self.time * 4)) * 0.5 + 0.5
         hint_col = tuple(int(c * hint_pulse + (1 - hint_pulse) * 100) for c in (255, 255, 180))
-        hint_surf = self.font_small.render("RIGHT CLICK TO CONTINUE", True, hint_col)
+        hint_surf = TEXT.render(self.font_small, "RIGHT CLICK TO CONTINUE", True, hint_col)
         surface.blit(hint_surf, (640 - hint_surf.get_width() // 2, 570))
 
 
@@ -11109,12 +13242,12 @@ class SpinnerDefense(MiniGame):
         surface.blit(overlay, (0, 0))
         
         # PAUSED titolo (y=150, font 80px)
-        pausefont = pygame.font.Font(None, 80)  # Come fontpause
-        pausetext = pausefont.render("PAUSED", True, (255, 255, 255))
+        pausefont = TEXT.font(80)  # Come fontpause
+        pausetext = TEXT.render(pausefont, "PAUSED", True, (255, 255, 255))
         surface.blit(pausetext, (640 - pausetext.get_width() // 2, 150))
         
         # Stats panel (y=280, spacing 40px, font 26px)
-        statsfont = pygame.font.Font(None, 26)  # Come fontcombo
+        statsfont = TEXT.font(26)  # Come fontcombo
         stats = [
             f"Score: {self.score}",
             f"Level: {self.level}/{self.level}",  # Adatta ai tuoi dati
@@ -11124,15 +13257,15 @@ class SpinnerDefense(MiniGame):
         ]
         y = 280
         for stat in stats:
-            stattext = statsfont.render(stat, True, (255, 255, 255))
+            stattext = TEXT.render(statsfont, stat, True, (255, 255, 255))
             surface.blit(stattext, (640 - stattext.get_width() // 2, y))
             y += 40
         
         # Buttons (font 32px, y=550/600)
-        btnfont = pygame.font.Font(None, 32)  # Come fontlevel
+        btnfont = TEXT.font(32)  # Come fontlevel
         
-        exittext = btnfont.render("LEFT CLICK - Exit", True, (255, 100, 100))
-        continuetext = btnfont.render("RIGHT CLICK - Continue", True, (100, 255, 100))
+        exittext = TEXT.render(btnfont, "LEFT CLICK - Exit", True, (255, 100, 100))
+        continuetext = TEXT.render(btnfont, "RIGHT CLICK - Continue", True, (100, 255, 100))
         
         surface.blit(exittext, (640 - exittext.get_width() // 2, 550))
         surface.blit(continuetext, (640 - continuetext.get_width() // 2, 600))
@@ -11151,14 +13284,21 @@ class SpinnerDefense(MiniGame):
 # ============== GAME MANAGER ==============
 class GameManager:
     def __init__(self):
+        boot_start = perf_counter()
         pygame.init()
         
         # Core systems
         self.config = Config()
         self.display = DisplayManager(self.config)
+        display_done = perf_counter()
         self.spinner = SpinnerInput(self.config)
-        self.synth = SoundSynthesizer()
+        # Audio: bank (o render, anche in processi separati) e tutti i Sound pronti prima del primo frame
+        self.synth = SoundSynthesizer(workers=self.config.sound_workers)
+        self.synth.warm_up()
+        STREAM.resize(self.config.stream_block)
+        audio_done = perf_counter()
         self.high_score_mgr = HighScoreManager()
+        MUSIC.budget_bytes = self.config.music_cache_mb * 1024 * 1024
         self.music_player = MusicPlayer()
         self.clock = pygame.time.Clock()
         
@@ -11173,9 +13313,33 @@ class GameManager:
         self.frame_times = []
         self.max_frame_samples = 60
         
+        # Fixed timestep
+        self.sim_dt = 1.0 / self.config.sim_rate
+        self.max_catchup_steps = self.config.max_catchup_steps
+        self.max_frame_time = 0.25  # oltre, il frame e' un hitch (drag finestra, breakpoint...)
+        self.render_alpha = 0.0
+        self.dropped_steps = 0
+        
         # Initialize
         self._initialize_base_states()
         self._change_state("main_menu")
+        self._report_boot(boot_start, display_done, audio_done, perf_counter())
+    
+    def _report_boot(self, start: float, display_done: float, audio_done: float, end: float):
+        """Tempi di avvio per fase (in ms), anche in self.boot_times"""
+        warmup = self.synth.warmup_stats
+        self.boot_times = {
+            'display': (display_done - start) * 1000,
+            'audio': (audio_done - display_done) * 1000,
+            'states': (end - audio_done) * 1000,
+            'total': (end - start) * 1000,
+        }
+        source = warmup.get('source', '-')
+        if source == 'render' and warmup.get('workers', 0) > 1:
+            source += f" x{warmup['workers']} processi"
+        print(f"[Boot] display {self.boot_times['display']:.0f} ms, audio {self.boot_times['audio']:.0f} ms "
+              f"({warmup.get('sounds', 0)} suoni da {source}), stati {self.boot_times['states']:.0f} ms, "
+              f"totale {self.boot_times['total']:.0f} ms")
     
     @property
     def games(self) -> List[MiniGame]:
@@ -11270,6 +13434,10 @@ class GameManager:
             
             self.current_state = next_state
             self.current_state.on_enter()
+            self.display.invalidate()
+            self.display.camera.reset()
+            STREAM.set(gain=0.0)
+            self.display.resolution.set_floor(self.current_state.min_dynamic_scale)
             
         except (ValueError, IndexError, KeyError) as e:
             print(f"Error changing state to '{state_name}': {e}")
@@ -11317,71 +13485,149 @@ class GameManager:
         return 1.0 / avg_dt if avg_dt > 0 else 60.0
     
     def run(self):
-        """Main game loop ottimizzato"""
+        """Main game loop: simulazione a passo fisso, rendering a frame rate libero.
+        
+        Il tempo reale si accumula e viene consumato a passi di 1/sim_rate (al massimo
+        max_catchup_steps per frame: il resto viene scartato per non entrare nella spirale
+        della morte). Quanto avanza diventa render_alpha, passato a draw() per interpolare.
+        """
         # Avvia musica
         self.music_player.start()
+        if self.config.threaded_present:
+            self.display.start_presenter()
         
         running = True
-        frame_count = 0
-        cleanup_interval = 600  # Cleanup ogni 10 secondi (60fps * 10)
+        sim_steps = 0
+        cleanup_interval = self.config.sim_rate * 10  # Cleanup ogni 10 secondi di simulazione
+        accumulator = 0.0
+        pending_delta = 0.0
         
         try:
             while running:
-                # Delta time con cap per evitare spike
-                dt = min(self.clock.tick(60) / 1000.0, 0.1)  # Max 100ms
-                frame_count += 1
+                # Tempo reale del frame, con cap per gli hitch. Cap effettivo ricalcolato ogni frame
+                # (il display puo' essere ricreato): 0 solo se il ritmo lo da' il vsync del renderer;
+                # e' anche il riferimento per i vsync saltati (60 Hz senza cap)
+                fps_cap = self.display.frame_cap(self.config.fps_cap)
+                LATENCY.frame_period = 1.0 / (fps_cap or 60)
+                frame_time = min(self.clock.tick(fps_cap) / 1000.0, self.max_frame_time)
+                work_start = perf_counter()
+                accumulator += frame_time
+                PROFILER.end_frame()
+                PROFILER.begin_frame()
                 
                 # Track performance (opzionale, commentare in produzione)
-                # self._track_performance(dt)
+                # self._track_performance(frame_time)
                 
                 # Event handling
-                events = pygame.event.get()
-                for event in events:
-                    if event.type == pygame.QUIT:
-                        running = False
-                        break
-                    
-                    # Music player events
-                    self.music_player.handle_event(event)
-                    
-                    # Emergency exit: ESC key
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                        if self.current_state == self.states.get("main_menu"):
+                with PROFILER.zone("events"):
+                    events = pygame.event.get()
+                    for event in events:
+                        if event.type == pygame.QUIT:
                             running = False
-                        else:
-                            self._change_state("main_menu")
+                            break
+                        
+                        # Music player events
+                        self.music_player.handle_event(event)
+                        
+                        if event.type == pygame.KEYDOWN:
+                            # Emergency exit: ESC key
+                            if event.key == pygame.K_ESCAPE:
+                                if self.current_state == self.states.get("main_menu"):
+                                    running = False
+                                else:
+                                    self._change_state("main_menu")
+                            # F2 FPS e risoluzione dinamica (Shift = stats con latenza); profiler:
+                            # F3 overlay on/off, F4 dump; F5 log JSON della latenza; F6 tinta dei
+                            # layer ricostruiti
+                            elif event.key == pygame.K_F2:
+                                if event.mod & pygame.KMOD_SHIFT:
+                                    self.display.toggle_detailed_stats()
+                                else:
+                                    self.display.toggle_fps_display()
+                            elif event.key == pygame.K_F3:
+                                PROFILER.toggle()
+                            elif event.key == pygame.K_F4:
+                                PROFILER.dump()
+                            elif event.key == pygame.K_F5:
+                                LATENCY.dump()
+                            elif event.key == pygame.K_F6:
+                                LAYERS.toggle_debug()
+                            # Cattura: F10 instant replay (Shift = frame raw), F12 screenshot
+                            elif event.key == pygame.K_F10:
+                                self.display.capture.dump_replay(raw=bool(event.mod & pygame.KMOD_SHIFT))
+                            elif event.key == pygame.K_F12:
+                                self.display.take_screenshot()
                 
-                # Input update
-                self.spinner.update(events)
-                spinner_delta = self.spinner.get_rotation_delta()
+                # Input update: rotazione e click si accumulano fino al prossimo passo
+                with PROFILER.zone("spinner"):
+                    self.spinner.update(events)
+                    pending_delta += self.spinner.get_rotation_delta()
+                    LATENCY.input_sampled(perf_counter())
                 
-                # State update
-                if self.current_state:
+                # Fixed-step simulation
+                steps = min(int(accumulator / self.sim_dt), self.max_catchup_steps)
+                if steps:
+                    step_delta = pending_delta / steps
+                    pending_delta = 0.0
+                latency_token = None
+                for step in range(steps):
+                    accumulator -= self.sim_dt
+                    sim_steps += 1
+                    if not self.current_state:
+                        continue
                     try:
-                        next_state = self.current_state.update(dt, spinner_delta, self.spinner)
+                        with PROFILER.zone("update"):
+                            next_state = self.current_state.update(self.sim_dt, step_delta, self.spinner)
+                        if step == 0:
+                            latency_token = LATENCY.consumed(perf_counter())
+                        self.spinner.clear_clicks()
                         
                         if next_state == "exit":
                             running = False
+                            break
                         elif next_state:
                             self._change_state(next_state)
                     
                     except Exception as e:
                         print(f"Error in state update: {e}")
                         # Fallback to main menu on error
+                        self.spinner.clear_clicks()
                         self._change_state("main_menu")
+                    
+                    # Periodic cleanup
+                    if sim_steps % cleanup_interval == 0:
+                        self._cleanup_unused_states()
+                
+                # Spiral-of-death guard: il tempo che non si riesce a recuperare si perde
+                if accumulator >= self.sim_dt:
+                    dropped = int(accumulator / self.sim_dt)
+                    self.dropped_steps += dropped
+                    accumulator -= dropped * self.sim_dt
+                self.render_alpha = accumulator / self.sim_dt
+                
+                # Audio procedurale: riempie la coda del canale con i parametri appena aggiornati
+                STREAM.update()
+                # Musica: accoda la traccia successiva appena il worker l'ha preparata
+                self.music_player.update()
                 
                 # Rendering
                 try:
                     if self.current_state:
-                        self.current_state.draw(self.display.get_virtual_surface())
-                    self.display.render()
+                        self.current_state.render_alpha = self.render_alpha
+                        self.current_state.dynamic_scale = self.display.resolution.scale
+                        self.current_state.dirty_mode = self.display.dirty_rects_enabled
+                        with PROFILER.zone("draw"):
+                            self.current_state.draw(self.display.get_virtual_surface())
+                        self.display.capture.record(self.display.get_virtual_surface(), frame_time)
+                    with PROFILER.zone("present"):
+                        self.display.present(self.clock.get_fps(), frame_time,
+                                             self.current_state.get_dirty_rects() if self.current_state else None,
+                                             latency_token)
+                    # Tempo di lavoro del frame (senza attesa di vsync/cap) -> risoluzione dinamica
+                    self.display.resolution.update(perf_counter() - work_start)
                 
                 except Exception as e:
                     print(f"Error in rendering: {e}")
-                
-                # Periodic cleanup
-                if frame_count % cleanup_interval == 0:
-                    self._cleanup_unused_states()
         
         except KeyboardInterrupt:
             print("\nGame interrupted by user")
@@ -11399,8 +13645,29 @@ class GameManager:
         """Cleanup resources"""
         print("Shutting down...")
         
+        # Profiler: salva gli ultimi frame se attivo
+        if PROFILER.enabled:
+            PROFILER.dump()
+        
+        # Presenter thread: chiude dopo l'ultimo frame, prima di pygame.quit
+        try:
+            self.display.stop_presenter()
+        except:
+            pass
+        
+        # Latenza: log JSON se richiesto con --latency
+        if LATENCY.log_on_exit:
+            LATENCY.dump()
+        
+        # Capture: finisce di scrivere screenshot e replay gia' accodati
+        try:
+            self.display.capture.stop()
+        except:
+            pass
+        
         # Stop music
         try:
+            STREAM.stop()
             self.music_player.stop()
         except:
             pass
@@ -11427,14 +13694,21 @@ class GameManager:
 
 
 class MusicPlayer:
-    """Gestisce la riproduzione continua della playlist"""
+    """Gestisce la riproduzione continua della playlist.
+
+    Le tracce arrivano dalla RAM (MUSIC): la successiva viene preparata in background e accodata
+    con mixer.music.queue, cosi' il cambio canzone non tocca il disco e non lascia buchi.
+    """
     MUSIC_END = pygame.USEREVENT + 10
+    VOLUME = 0.4  # Volume 0.0 - 1.0
     
     def __init__(self):
         self.music_folder = Path(resource_path("music"))
         self.playlist = []
         self.current_index = 0
         self.enabled = False
+        self.pending: Optional[str] = None  # traccia successiva non ancora accodata
+        self.queued: Optional[str] = None  # traccia gia' accodata nel mixer
         self.load_playlist()
     
     def load_playlist(self):
@@ -11467,17 +13741,19 @@ class MusicPlayer:
             print(f"✗ Errore avvio: {e}")
     
     def play_current(self):
-        """Riproduce la canzone corrente"""
+        """Riproduce la canzone corrente (fallback: la legge subito se non e' gia' in RAM)"""
         if not self.playlist:
             return
         
         try:
             song_path = self.playlist[self.current_index]
-            pygame.mixer.music.load(song_path)
-            pygame.mixer.music.set_volume(0.4)  # Volume 0.0 - 1.0
+            start = perf_counter()
+            track, hint = MUSIC.load(song_path)
+            pygame.mixer.music.load(track, hint)
+            pygame.mixer.music.set_volume(self.VOLUME)
             pygame.mixer.music.play()
-            print(f"♪ {Path(song_path).name}")
-        except pygame.error as e:
+            self._switched(song_path, perf_counter() - start, False)
+        except (pygame.error, OSError) as e:
             print(f"✗ Errore: {e}")
             self.next_song()
     
@@ -11488,17 +13764,364 @@ class MusicPlayer:
         self.current_index = (self.current_index + 1) % len(self.playlist)
         self.play_current()
     
+    def update(self):
+        """Ogni frame: appena la traccia successiva e' in RAM la accoda nel mixer"""
+        if not self.enabled or self.pending is None:
+            return
+        track = MUSIC.get(self.pending)
+        if track is None:
+            return
+        path, self.pending = self.pending, None
+        try:
+            pygame.mixer.music.queue(*track)
+            self.queued = path
+        except pygame.error as e:
+            print(f"✗ Errore coda {Path(path).name}: {e}")
+    
     def handle_event(self, event):
         """Gestisce l'evento di fine canzone"""
-        if self.enabled and event.type == self.MUSIC_END:
+        if not (self.enabled and event.type == self.MUSIC_END):
+            return
+        if self.queued is None:
+            # La successiva non era pronta (o non accodabile): caricamento diretto
             self.next_song()
+            return
+        # Il mixer ha gia' avviato la traccia in coda: si aggiorna solo lo stato
+        self.current_index = self.playlist.index(self.queued)
+        self._switched(self.queued, 0.0, True)
+    
+    def _switched(self, path: str, seconds: float, gapless: bool):
+        """Log del cambio traccia con i tempi di caricamento, poi prepara la successiva"""
+        MUSIC.switched(seconds, gapless)
+        read = MUSIC.read_times.get(path, 0.0) * 1000
+        decode = MUSIC.decode_times.get(path)
+        info = f"read {read:.1f} ms" + (f", decode {decode * 1000:.0f} ms" if decode is not None else "")
+        info += ", gapless" if gapless else f", load {seconds * 1000:.1f} ms"
+        print(f"♪ {Path(path).name} ({info})")
+        
+        following = self.playlist[(self.current_index + 1) % len(self.playlist)]
+        self.pending = following
+        self.queued = None
+        MUSIC.pin((path, following))
+        MUSIC.request(following)
+    
+    def stop(self):
+        """Ferma la musica e il worker di prefetch (shutdown)"""
+        self.enabled = False
+        self.pending = self.queued = None
+        try:
+            pygame.mixer.music.set_endevent()
+            pygame.mixer.music.stop()
+        except pygame.error:
+            pass
+        MUSIC.stop()
+
+
+
+
+# ============== BENCHMARK ==============
+
+BENCH_GAME_CLASSES = [
+    "BreakoutSpinner", "MissileCommander", "SpinnerDefense", "PongSpinner",
+    "Kaleidoscope", "SpinDuel", "YahtzeeSpinner",
+]
 
 
+class BenchSpinner:
+    """Spinner sintetico: riproduce una traccia seedata di rotazioni e click (stessa API di SpinnerInput)"""
+
+    def __init__(self, seed: int, frames: int):
+        rng = random.Random(seed)
+        self.deltas = []
+        self.left_clicks = []
+        self.left_pressed = []
+        held = 0
+        for i in range(frames):
+            # Rotazione: oscillazione lenta + rumore, come un giocatore che gira avanti e indietro
+            delta = math.sin(i * 0.05) * 12 + rng.uniform(-3, 3)
+            self.deltas.append(delta)
+
+            click = rng.random() < 0.08
+            if held == 0 and rng.random() < 0.01:
+                held = rng.randint(30, 300)  # pressione lunga (uzi, nuke charge)
+            self.left_clicks.append(click or held == 1)
+            self.left_pressed.append(held > 0 or click)
+            held = max(0, held - 1)
+        self.frame = 0
+
+    def advance(self):
+        self.frame += 1
+
+    def get_rotation_delta(self) -> float:
+        return self.deltas[self.frame]
+
+    def is_left_clicked(self) -> bool:
+        return self.left_clicks[self.frame]
+
+    def is_right_clicked(self) -> bool:
+        # Mai: il tasto destro apre la pausa e falserebbe le misure
+        return False
+
+    def is_left_pressed(self) -> bool:
+        return self.left_pressed[self.frame]
+
+    def is_right_pressed(self) -> bool:
+        return False
+
+    def release(self):
+        pass
+
+
+def _bench_stats(samples: List[float]) -> Dict[str, float]:
+    """Statistiche in millisecondi"""
+    arr = np.asarray(samples, dtype=np.float64) * 1000.0
+    return {
+        "mean": round(float(arr.mean()), 4),
+        "p50": round(float(np.percentile(arr, 50)), 4),
+        "p99": round(float(np.percentile(arr, 99)), 4),
+        "worst": round(float(arr.max()), 4),
+    }
+
+
+def run_benchmark(frames: int = 600, seed: int = 1234, games: Optional[List[str]] = None,
+                  dt: float = 1.0 / 60.0) -> Dict:
+    """Esegue ogni MiniGame headless con una traccia input deterministica e misura update()/draw()"""
+    import time
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    # Serve un display per convert()/convert_alpha()
+    pygame.display.set_mode((1280, 720))
+    synth = SoundSynthesizer()
+    surface = pygame.Surface((1280, 720))
+
+    names = games or BENCH_GAME_CLASSES
+    results = {}
+    for class_name in names:
+        game_class = globals().get(class_name)
+        if game_class is None or not (isinstance(game_class, type) and issubclass(game_class, MiniGame)):
+            print(f"[Bench] Unknown game '{class_name}', skipped", file=sys.stderr)
+            continue
+
+        random.seed(seed)
+        np.random.seed(seed)
+        game = game_class(synth)
+        game.reset()
+        spinner = BenchSpinner(seed, frames)
+
+        update_times = []
+        draw_times = []
+        resets = 0
+        for _ in range(frames):
+            t0 = time.perf_counter()
+            keep_running = game.update(dt, spinner.get_rotation_delta(), spinner)
+            t1 = time.perf_counter()
+            game.draw(surface)
+            t2 = time.perf_counter()
+
+            update_times.append(t1 - t0)
+            draw_times.append(t2 - t1)
+            spinner.advance()
+
+            # Fine partita: riparte subito (fuori dal tempo misurato)
+            if not keep_running or game.game_over:
+                game.reset()
+                resets += 1
+
+        frame_times = [u + d for u, d in zip(update_times, draw_times)]
+        results[class_name] = {
+            "name": game.get_name(),
+            "frames": frames,
+            "resets": resets,
+            "update_ms": _bench_stats(update_times),
+            "draw_ms": _bench_stats(draw_times),
+            "frame_ms": _bench_stats(frame_times),
+        }
+
+    pygame.quit()
+    return {
+        "seed": seed,
+        "frames": frames,
+        "dt": dt,
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "games": results,
+    }
+
+
+def run_collision_benchmark(counts: List[int], frames: int = 240, seed: int = 1234,
+                            dt: float = 1.0 / 60.0) -> Dict:
+    """SpinnerDefense.update() con N nemici e N proiettili tenuti costanti (scaling della broadphase)"""
+    import time
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1280, 720))
+    synth = SoundSynthesizer()
+    spinner = BenchSpinner(seed, frames)
+    types = list(SpinnerDefense(synth).enemy_types.keys())
+
+    results = {}
+    for n in counts:
+        random.seed(seed)
+        np.random.seed(seed)
+        game = SpinnerDefense(synth)
+        game.lives = 10 ** 9
+        game.enemies_needed_for_wave = 10 ** 9
+        spinner.frame = 0
+        update_times = []
+        for _ in range(frames):
+            # Rabbocco fuori dal tempo misurato
+            while len(game.enemies) < n:
+                angle = random.uniform(0, 360)
+                dist = random.uniform(120, 640)
+                rad = math.radians(angle)
+                game.enemies.append(game._make_enemy(random.choice(types), 640 + math.cos(rad) * dist,
+                                                     360 + math.sin(rad) * dist, angle))
+            while len(game.bullets) < n:
+                rad = random.uniform(0, math.pi * 2)
+                game.bullets.append({
+                    'x': random.uniform(0, 1280), 'y': random.uniform(0, 720),
+                    'vx': math.cos(rad) * 900, 'vy': math.sin(rad) * 900,
+                    'life': 1.8, 'size': 5, 'color': (255, 255, 180),
+                    'pierce': False, 'rotation': 0
+                })
+            game.particles.clear()
+
+            t0 = time.perf_counter()
+            game.update(dt, spinner.get_rotation_delta(), spinner)
+            update_times.append(time.perf_counter() - t0)
+            spinner.advance()
+
+        results[str(n)] = _bench_stats(update_times)
+
+    pygame.quit()
+    return {"game": "SpinnerDefense", "entities": "N enemies + N bullets", "frames": frames,
+            "update_ms": results}
+
+
+def run_present_benchmark(frames: int = 300, seed: int = 1234) -> Dict:
+    """DisplayManager.render() per risoluzione di uscita: buffer, present diretto e backend renderer SDL2"""
+    import time
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    display = DisplayManager(Config(persistent=False))  # default fissi, il config dell'utente non conta
+    display.vsync_enabled = False
+    display.show_fps = False
+    rng = np.random.default_rng(seed)
+
+    results = {}
+    frame = rng.integers(0, 1 << 24, display.virtual_surface.get_size(), dtype=np.uint32)
+    for res in Config.VALID_RESOLUTIONS:
+        display.config.resolution = res
+        for label, backend, direct in (("buffered", "software", False), ("direct", "software", True),
+                                       ("renderer", "renderer", True)):
+            display.backend = backend
+            display.update_display()
+            if display.backend != backend:
+                continue  # renderer SDL2 non disponibile: niente riga
+            pygame.surfarray.blit_array(display.virtual_surface, frame)
+            display.direct_present = direct
+            times = []
+            for _ in range(frames):
+                t0 = time.perf_counter()
+                display.render(60.0, 1.0 / 60.0)
+                times.append(time.perf_counter() - t0)
+            results.setdefault(f"{res[0]}x{res[1]}", {})[label] = _bench_stats(times)
+
+    pygame.quit()
+    return {"virtual": f"{display.VIRTUAL_WIDTH}x{display.VIRTUAL_HEIGHT}", "frames": frames,
+            "render_ms": results}
+
+
+def run_stream_benchmark(blocks: int = 2000, seed: int = 1234,
+                         sizes: Tuple[int, ...] = (256, 512, 1024, 2048)) -> Dict:
+    """AudioStream.render_block() per dimensione di blocco, con pitch/volume/filtro che cambiano a ogni blocco"""
+    import time
+
+    rng = np.random.default_rng(seed)
+    results = {}
+    for size in sizes:
+        stream = AudioStream(block=size)
+        out = np.empty((size, 2), dtype=np.int16)
+        params = rng.random((blocks, 3))
+        times = []
+        for freq, gain, brightness in params:
+            stream.set(freq=55.0 + 500.0 * freq, gain=gain, brightness=brightness)
+            t0 = time.perf_counter()
+            stream.render_block(out)
+            times.append(time.perf_counter() - t0)
+        results[str(size)] = {
+            "block_ms": _bench_stats(times),
+            "audio_ms": round(size / stream.sample_rate * 1000.0, 2),
+            "latency_ms": round(stream.latency * 1000.0, 1),
+        }
+    return {"blocks": blocks, "sample_rate": AudioStream().sample_rate, "stream": results}
+
+
+def bench_main(argv: List[str]) -> int:
+    """Entry point CLI: python main.py --bench [--frames N] [--seed N] [--games A,B] [--out file.json]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Spinner Overdrive headless benchmark")
+    parser.add_argument("--bench", action="store_true")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--games", type=str, default="",
+                        help="Comma separated class names (default: all)")
+    parser.add_argument("--collision", action="store_true",
+                        help="SpinnerDefense update time vs. entity count instead of the per-game suite")
+    parser.add_argument("--present", action="store_true",
+                        help="DisplayManager.render() time per output resolution: buffered, direct, SDL2 renderer")
+    parser.add_argument("--stream", action="store_true",
+                        help="AudioStream block render time per block size")
+    parser.add_argument("--counts", type=str, default="25,50,100,200,400",
+                        help="Entity counts for --collision")
+    parser.add_argument("--out", type=str, default="",
+                        help="Write the JSON report to this file as well as stdout")
+    args = parser.parse_args(argv)
+
+    if args.collision:
+        counts = [int(c) for c in args.counts.split(",") if c.strip()]
+        report = run_collision_benchmark(counts, frames=min(args.frames, 240), seed=args.seed)
+    elif args.present:
+        report = run_present_benchmark(frames=min(args.frames, 300), seed=args.seed)
+    elif args.stream:
+        report = run_stream_benchmark(blocks=max(args.frames, 100), seed=args.seed)
+    else:
+        games = [g.strip() for g in args.games.split(",") if g.strip()] or None
+        report = run_benchmark(frames=args.frames, seed=args.seed, games=games)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text)
+    return 0
 
 
 # ============== START ==============
 
 if __name__ == "__main__":
+    # Processi spawn (decodifica musica, warm-up suoni) negli eseguibili PyInstaller
+    import multiprocessing
+    multiprocessing.freeze_support()
+    if "--bench" in sys.argv[1:]:
+        sys.exit(bench_main(sys.argv[1:]))
+    if "--profile" in sys.argv[1:]:
+        PROFILER.enable()
+    if "--latency" in sys.argv[1:]:
+        LATENCY.log_on_exit = True
+    if "--build-sound-bank" in sys.argv[1:]:
+        pygame.init()
+        SoundSynthesizer(bank_file=None).build_bank()
+        sys.exit(0)
+
     try:
         game = GameManager()
         game.run()
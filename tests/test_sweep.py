@@ -0,0 +1,72 @@
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from main import SWEEP_EPSILON, SWEEP_MAX_STEP, sweep_aabb, sweep_steps  # noqa: E402
+
+# Rettangolo di prova: x 0..10, y 0..10
+BOX = (0.0, 0.0, 10.0, 10.0)
+
+
+@pytest.mark.parametrize("start, delta, t, normal", [
+    ((-5.0, 5.0), (10.0, 0.0), 0.5, (-1, 0)),   # da sinistra
+    ((15.0, 5.0), (-10.0, 0.0), 0.5, (1, 0)),   # da destra
+    ((5.0, -5.0), (0.0, 10.0), 0.5, (0, -1)),   # dall'alto
+    ((5.0, 15.0), (0.0, -10.0), 0.5, (0, 1)),   # dal basso
+])
+def test_hit_from_each_face(start, delta, t, normal):
+    hit = sweep_aabb(*start, *delta, *BOX)
+    assert hit is not None
+    assert hit[0] == pytest.approx(t)
+    assert hit[1:] == normal
+
+
+def test_diagonal_hit_reports_face_reached_last():
+    # Entra nello slab x a t=0.25 e in quello y a t=0.5: la faccia colpita e' quella in alto
+    hit = sweep_aabb(-2.5, -5.0, 10.0, 10.0, *BOX)
+    assert hit[0] == pytest.approx(0.5)
+    assert hit[1:] == (0, -1)
+
+
+def test_miss_and_short_segment():
+    assert sweep_aabb(-5.0, 20.0, 10.0, 0.0, *BOX) is None  # passa sotto
+    assert sweep_aabb(-5.0, 5.0, 4.0, 0.0, *BOX) is None    # si ferma prima
+    assert sweep_aabb(5.0, 5.0, 0.0, 0.0, *BOX) is None     # fermo
+
+
+def test_start_on_edge():
+    # Sul bordo verso l'interno: contatto subito
+    assert sweep_aabb(0.0, 5.0, 3.0, 0.0, *BOX) == (0.0, -1, 0)
+    # Sul bordo verso l'esterno: nessun contatto
+    assert sweep_aabb(0.0, 5.0, -3.0, 0.0, *BOX) is None
+    assert sweep_aabb(5.0, 10.0, 0.0, 3.0, *BOX) is None
+    # Appena dentro per arrotondamento, in uscita: nessun contatto
+    assert sweep_aabb(SWEEP_EPSILON * 0.1, 5.0, -3.0, 0.0, *BOX) is None
+
+
+def test_start_inside():
+    # Niente t=0 ripetuti per chi e' gia' dentro (mattone colpito piu' volte nello stesso passo)
+    assert sweep_aabb(5.0, 5.0, 3.0, 1.0, *BOX) is None
+    # hit_inside: contatto immediato (paddle che si sposta sopra la pallina)
+    hit = sweep_aabb(5.0, 5.0, 3.0, 1.0, *BOX, hit_inside=True)
+    assert hit is not None and hit[0] == 0.0
+
+
+def test_axis_aligned_motion():
+    # dx == 0: conta solo se x e' dentro lo slab
+    assert sweep_aabb(5.0, -5.0, 0.0, 10.0, *BOX)[1:] == (0, -1)
+    assert sweep_aabb(12.0, -5.0, 0.0, 10.0, *BOX) is None
+    # dy == 0: conta solo se y e' dentro lo slab
+    assert sweep_aabb(-5.0, 5.0, 10.0, 0.0, *BOX)[1:] == (-1, 0)
+    assert sweep_aabb(-5.0, -1.0, 10.0, 0.0, *BOX) is None
+
+
+def test_sweep_steps():
+    assert sweep_steps(0.0, 0.0) == 1
+    assert sweep_steps(SWEEP_MAX_STEP, 0.0) == 1
+    assert sweep_steps(SWEEP_MAX_STEP * 3 + 1, 0.0) == 4
+    assert sweep_steps(30.0, 40.0, max_step=10.0) == math.ceil(50.0 / 10.0)